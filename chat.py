@@ -5,7 +5,6 @@ Chainlit 기반 RAG 챗봇 애플리케이션
 Gemini API를 통해 답변을 생성하는 챗봇 인터페이스
 """
 
-import os
 import sys
 import time
 from typing import Dict, List, Any
@@ -17,14 +16,17 @@ from chainlit.types import AskFileResponse
 from utils.common import setup_logger, get_project_root
 from core.rag_engine import RAGEngine
 
-# 로거 설정
-logger = setup_logger(
-    "chat", 
-    os.path.join(get_project_root(), "logs", "chat.log")
-)
+# 프로젝트 경로 (모듈 로드 시 한 번만 계산)
+PROJECT_ROOT = get_project_root()
+LOG_PATH = PROJECT_ROOT / "logs" / "chat.log"
+VECTOR_DB_PATH = str(PROJECT_ROOT / "data" / "vector_db")
 
-# 벡터 DB 경로 설정
-vector_db_path = os.path.join(get_project_root(), "data", "vector_db")
+# 로거 설정 (모듈이 다시 로드되어도 핸들러가 중복 추가되지 않음)
+logger = setup_logger("chat", str(LOG_PATH))
+
+# 스트리밍 응답 화면 갱신 기준 (누적 글자 수, 경과 시간(초))
+STREAM_FLUSH_CHARS = 64
+STREAM_FLUSH_INTERVAL = 0.05
 
 # RAG 엔진 초기화
 @cl.on_chat_start
@@ -38,7 +40,7 @@ async def on_chat_start():
         rag_engine = RAGEngine(
             embedding_model_name="jhgan/ko-sroberta-multitask",
             llm_service="gemini",  # Gemini API 사용
-            vector_db_path=vector_db_path
+            vector_db_path=VECTOR_DB_PATH
         )
 
         # 세션에 RAG 엔진 저장
@@ -81,14 +83,9 @@ async def on_message(message: cl.Message):
         query = message.content
         logger.info(f"사용자 질문: {query}")
 
-        # 처리 중 표시
-        await cl.Message(
-            content="질문을 처리 중입니다...",
-            author="시스템"
-        ).send()
-
-        # 답변 생성 준비
+        # 답변 생성 준비 (진행 상황은 단계 표시로 대신함)
         with cl.Step(name="문서 검색") as step:
+            step.input = query
             start_time = time.time()
             
             # 스트림 방식으로 검색 결과 및 응답 생성 준비
@@ -106,22 +103,34 @@ async def on_message(message: cl.Message):
             # 스트림 방식으로 응답 처리
             full_answer = ""
             
+            # 화면 갱신 묶음 처리 (토큰마다 갱신하지 않고 일정 글자 수/시간마다 갱신)
+            pending_chars = 0
+            last_flush = time.monotonic()
+            
             # 비동기 생성기(async generator)에서 직접 청크를 가져와 처리
             async for chunk in stream_generator:
                 if hasattr(chunk, 'text') and chunk.text:
                     # Gemini 형식의 청크
                     content = chunk.text
-                    full_answer += content
-                    answer_message.content = full_answer
-                    await answer_message.update()
                 elif isinstance(chunk, str):
                     # 문자열 형식의 청크
-                    full_answer += chunk
+                    content = chunk
+                else:
+                    continue
+                
+                full_answer += content
+                pending_chars += len(content)
+                
+                if (pending_chars >= STREAM_FLUSH_CHARS
+                        or time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL):
                     answer_message.content = full_answer
                     await answer_message.update()
+                    pending_chars = 0
+                    last_flush = time.monotonic()
                 
             # 최종 완성된 답변으로 업데이트
             answer_message.content = full_answer
+            await answer_message.update()
             
             # 소요 시간 계산
             elapsed = time.time() - start_time
@@ -0,0 +1,46 @@
+"""
+임베딩 벡터 연산 커널 - 단위 길이 정규화
+"""
+import numpy as np
+
+# 선택적 JIT 컴파일 (numba가 설치되지 않은 경우 NumPy로 실행)
+# - 병렬(parallel=True) 커널은 numba 스레드 풀을 띄워 이후 프로세스 풀(fork) 사용 시 종료가 멈출 수 있고,
+#   정규화는 메모리 대역폭에 묶여 병렬화 이득도 없으므로 단일 스레드로 컴파일
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def l2_normalize(x: np.ndarray) -> None:
+        """
+        (N, D) 임베딩 행렬의 각 행을 제자리에서 단위 길이로 정규화
+
+        행마다 제곱합 계산과 나눗셈을 한 번의 순회로 처리합니다. 길이가 0인 행은 그대로 둡니다.
+
+        Args:
+            x (np.ndarray): float32 임베딩 행렬 (제자리 수정)
+        """
+        for i in range(x.shape[0]):
+            s = 0.0
+            for j in range(x.shape[1]):
+                s += x[i, j] * x[i, j]
+            if s > 0.0:
+                inv = 1.0 / np.sqrt(s)
+                for j in range(x.shape[1]):
+                    x[i, j] *= inv
+else:
+    def l2_normalize(x: np.ndarray) -> None:
+        """
+        (N, D) 임베딩 행렬의 각 행을 제자리에서 단위 길이로 정규화
+
+        길이가 0인 행은 그대로 둡니다.
+
+        Args:
+            x (np.ndarray): float32 임베딩 행렬 (제자리 수정)
+        """
+        norms = np.linalg.norm(x, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        x /= norms
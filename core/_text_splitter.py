@@ -0,0 +1,234 @@
+"""
+텍스트 분할기 - 구분자 위치를 미리 계산하여 부분 문자열 복사 없이 재귀 분할
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+
+def _is_self_overlapping(separator: str) -> bool:
+    """
+    구분자의 접두사와 접미사가 겹치는지 여부 (예: "\\n\\n")
+
+    겹치는 구분자는 검색 시작 위치에 따라 찾는 위치가 달라지므로 미리 계산한 위치를 쓸 수 없습니다.
+
+    Args:
+        separator (str): 구분자
+
+    Returns:
+        bool: 겹치면 True
+    """
+    return any(separator[:i] == separator[-i:] for i in range(1, len(separator)))
+
+
+class SpanTextSplitter(RecursiveCharacterTextSplitter):
+    """
+    RecursiveCharacterTextSplitter와 같은 결과를 내는 위치 기반 분할기
+
+    구분자마다 전체 텍스트에서의 위치를 한 번만 계산해 두고, 재귀 분할은 (시작, 끝) 위치로만
+    진행합니다. 부분 문자열은 최종 청크를 만들 때 한 번만 잘라냅니다.
+    정규식 구분자, len 이외의 길이 함수, 끝쪽 구분자 유지("end") 설정에서는 기본 구현을 사용합니다.
+    """
+
+    def split_text(self, text: str) -> List[str]:
+        """
+        텍스트를 청크 목록으로 분할
+
+        Args:
+            text (str): 분할할 텍스트
+
+        Returns:
+            List[str]: 청크 목록
+        """
+        if (self._is_separator_regex
+                or self._length_function is not len
+                or self._keep_separator not in (True, False, "start")):
+            return super().split_text(text)
+
+        self._text = text
+        self._positions: Dict[str, Optional[np.ndarray]] = {}
+        try:
+            return self._split_span(0, len(text), self._separators)
+        finally:
+            del self._text, self._positions
+
+    def _separator_positions(self, separator: str) -> Optional[np.ndarray]:
+        """
+        전체 텍스트에서 구분자가 나타나는 시작 위치 배열 (처음 요청 시 계산)
+
+        Args:
+            separator (str): 구분자
+
+        Returns:
+            Optional[np.ndarray]: 정렬된 시작 위치 배열 (겹치는 구분자는 None)
+        """
+        if separator not in self._positions:
+            if _is_self_overlapping(separator):
+                self._positions[separator] = None
+            else:
+                pattern = re.compile(re.escape(separator))
+                self._positions[separator] = np.fromiter(
+                    (m.start() for m in pattern.finditer(self._text)), dtype=np.int64
+                )
+        return self._positions[separator]
+
+    def _find_in_span(self, separator: str, start: int, end: int) -> np.ndarray:
+        """
+        구간 [start, end) 안에 완전히 들어가는 구분자 시작 위치
+
+        Args:
+            separator (str): 구분자
+            start (int): 구간 시작 위치
+            end (int): 구간 끝 위치
+
+        Returns:
+            np.ndarray: 시작 위치 배열
+        """
+        positions = self._separator_positions(separator)
+        if positions is None:
+            pattern = re.compile(re.escape(separator))
+            return np.fromiter(
+                (m.start() for m in pattern.finditer(self._text, start, end)), dtype=np.int64
+            )
+
+        lo, hi = np.searchsorted(positions, (start, end - len(separator) + 1))
+        return positions[lo:hi]
+
+    def _split_spans(self, separator: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """
+        구간을 구분자로 나눈 (시작, 끝) 위치 목록 (빈 조각 제외)
+
+        Args:
+            separator (str): 구분자 (빈 문자열이면 글자 단위)
+            start (int): 구간 시작 위치
+            end (int): 구간 끝 위치
+
+        Returns:
+            List[Tuple[int, int]]: 조각 위치 목록
+        """
+        if not separator:
+            return [(i, i + 1) for i in range(start, end)]
+
+        matches = self._find_in_span(separator, start, end).tolist()
+        if self._keep_separator:
+            # 구분자를 다음 조각의 앞에 붙임
+            bounds = [start, *matches, end]
+            spans = zip(bounds[:-1], bounds[1:])
+        else:
+            sep_len = len(separator)
+            spans = zip([start, *(m + sep_len for m in matches)], [*matches, end])
+        return [(a, b) for a, b in spans if a < b]
+
+    def _split_span(self, start: int, end: int, separators: List[str]) -> List[str]:
+        """
+        구간을 재귀적으로 분할 (RecursiveCharacterTextSplitter._split_text와 같은 규칙)
+
+        Args:
+            start (int): 구간 시작 위치
+            end (int): 구간 끝 위치
+            separators (List[str]): 남은 구분자 목록 (우선순위 순)
+
+        Returns:
+            List[str]: 청크 목록
+        """
+        final_chunks = []
+
+        # 구간 안에 나타나는 첫 번째 구분자 선택
+        separator = separators[-1]
+        new_separators = []
+        for i, sep in enumerate(separators):
+            if sep == "":
+                separator = sep
+                break
+            if len(self._find_in_span(sep, start, end)):
+                separator = sep
+                new_separators = separators[i + 1:]
+                break
+
+        merge_separator = "" if self._keep_separator else separator
+        good_spans = []
+        for a, b in self._split_spans(separator, start, end):
+            if b - a < self._chunk_size:
+                good_spans.append((a, b))
+                continue
+
+            if good_spans:
+                final_chunks.extend(self._merge_spans(good_spans, merge_separator))
+                good_spans = []
+            if not new_separators:
+                final_chunks.append(self._text[a:b])
+            else:
+                final_chunks.extend(self._split_span(a, b, new_separators))
+
+        if good_spans:
+            final_chunks.extend(self._merge_spans(good_spans, merge_separator))
+        return final_chunks
+
+    def _merge_spans(self, spans: List[Tuple[int, int]], separator: str) -> List[str]:
+        """
+        작은 조각들을 청크 크기와 겹침 크기에 맞게 합침 (_merge_splits와 같은 규칙)
+
+        Args:
+            spans (List[Tuple[int, int]]): 조각 위치 목록
+            separator (str): 조각 사이에 넣을 구분자
+
+        Returns:
+            List[str]: 청크 목록
+        """
+        separator_len = len(separator)
+        docs = []
+        first = 0  # 현재 청크에 포함된 첫 조각 번호
+        count = 0  # 현재 청크에 포함된 조각 수
+        total = 0
+
+        for i, (a, b) in enumerate(spans):
+            length = b - a
+            if total + length + (separator_len if count else 0) > self._chunk_size and count:
+                doc = self._join_spans(spans[first:first + count], separator)
+                if doc is not None:
+                    docs.append(doc)
+
+                # 겹침 크기 이하가 되고 새 조각이 들어갈 때까지 앞쪽 조각 제거
+                while total > self._chunk_overlap or (
+                    total + length + (separator_len if count else 0) > self._chunk_size
+                    and total > 0
+                ):
+                    fa, fb = spans[first]
+                    total -= (fb - fa) + (separator_len if count > 1 else 0)
+                    first += 1
+                    count -= 1
+
+            count += 1
+            total += length + (separator_len if count > 1 else 0)
+
+        doc = self._join_spans(spans[first:first + count], separator)
+        if doc is not None:
+            docs.append(doc)
+        return docs
+
+    def _join_spans(self, spans: List[Tuple[int, int]], separator: str) -> Optional[str]:
+        """
+        조각들을 하나의 청크 문자열로 합침
+
+        Args:
+            spans (List[Tuple[int, int]]): 연속된 조각 위치 목록
+            separator (str): 조각 사이에 넣을 구분자
+
+        Returns:
+            Optional[str]: 청크 문자열 (비어 있으면 None)
+        """
+        if not spans:
+            return None
+
+        if self._keep_separator:
+            # 구분자를 유지한 조각은 원문에서 연속하므로 한 번에 잘라냄
+            text = self._text[spans[0][0]:spans[-1][1]]
+        else:
+            text = separator.join(self._text[a:b] for a, b in spans)
+
+        if self._strip_whitespace:
+            text = text.strip()
+        return text or None
@@ -3,25 +3,42 @@
 """
 import os
 import re
+import zlib
+import mmap
+import codecs
 import logging
 import hashlib
 import numpy as np
-from typing import List, Dict, Optional, Tuple, Any, Union, Iterator
+import faiss
+from typing import List, Dict, Optional, Tuple, Any, Union, Iterator, Iterable, Callable
 from pathlib import Path
 from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 # 문서 처리 관련 라이브러리
 import pypdf
 import docx
-import markdown
-from bs4 import BeautifulSoup
+from markdown_it import MarkdownIt
 import email
 from email import policy
 from email.parser import BytesParser
 import html2text
 
+# Markdown 파서 (HTML 변환 없이 토큰 스트림에서 바로 텍스트 추출)
+_MD = MarkdownIt("commonmark")
+_MD_BLOCK_TEXT_TOKENS = ('code_block', 'fence')
+_MD_INLINE_TEXT_TOKENS = ('text', 'code_inline')
+_MD_LINE_BREAK_TOKENS = ('softbreak', 'hardbreak')
+
+# 선택적 JIT 컴파일 (numba가 설치되지 않은 경우 순수 Python으로 실행)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # 내부 모듈
-from utils.common import setup_logger, get_project_root, clean_filename, get_timestamp_str
+from utils.common import setup_logger, get_project_root, clean_filename, get_timestamp_str, prune_cache_dir
 from core.embedding_model import EmbeddingModel
 from core.vector_db import VectorDB
 from core.email_processor import EmailProcessor
@@ -32,6 +49,169 @@ logger = setup_logger(
     os.path.join(get_project_root(), "logs", "document_processor.log")
 )
 
+# 문서 ID 해시 크기 (바이트, 16바이트 = 32자리 16진수)
+DOC_ID_DIGEST_SIZE = 16
+
+# 연속된 줄바꿈 (3개 이상) 정리 패턴
+_MULTI_NEWLINE_PATTERN = re.compile(r'\n{3,}')
+
+# 텍스트 파일 인코딩 (BOM이 없는 경우 순서대로 시도)
+_TEXT_ENCODINGS = ['utf-8', 'cp949', 'euc-kr']
+
+# BOM별 인코딩 (UTF-32 BOM이 UTF-16 BOM을 포함하므로 UTF-32를 먼저 확인)
+_BOM_ENCODINGS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# 쿼리 결과 캐시 설정 (정확 일치 캐시 크기, 의미 캐시 크기, 의미 캐시 유사도 임계값)
+QUERY_CACHE_SIZE = 1024
+SEMANTIC_CACHE_SIZE = 10000
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+# 유사 중복 청크 판정 기준 (SimHash 지문 간 최대 해밍 거리)
+SIMHASH_MAX_DISTANCE = 3
+
+# 디렉토리 일괄 처리 시 임베딩 배치 크기
+DIRECTORY_EMBED_BATCH_SIZE = 256
+
+# 추출 텍스트 디스크 캐시 (경로/수정 시간/크기 기반 키, 추출 비용이 큰 형식만 대상)
+# - 전체 크기가 최대 크기(바이트)를 넘으면 오래 사용하지 않은 파일부터 삭제
+EXTRACT_CACHE_DIR = os.path.join(get_project_root(), "data", "extract_cache")
+EXTRACT_CACHE_TYPES = {'.pdf', '.docx'}
+EXTRACT_CACHE_READ_SIZE = 1 << 16
+EXTRACT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# 텍스트 분할 경계 문자 코드
+_NEWLINE = 0x0A
+_SPACE = 0x20
+_SENTENCE_MARKS = np.array([0x2E, 0x3F, 0x21], dtype=np.uint32)  # '.', '?', '!'
+
+
+def _find_split_offsets(text_len: int,
+                        chunk_size: int,
+                        chunk_overlap: int,
+                        para_ends: np.ndarray,
+                        sent_ends: np.ndarray,
+                        space_ends: np.ndarray) -> np.ndarray:
+    """
+    경계 위치 배열만으로 청크 분할 위치 계산 (정수 연산만 사용하므로 JIT 컴파일 가능)
+    
+    Args:
+        text_len (int): 텍스트 길이
+        chunk_size (int): 청크 크기
+        chunk_overlap (int): 청크 간 겹침 크기
+        para_ends (np.ndarray): 단락 끝('\n\n') 시작 위치 배열 (오름차순)
+        sent_ends (np.ndarray): 문장 끝 부호 위치 배열 (오름차순)
+        space_ends (np.ndarray): 공백 위치 배열 (오름차순)
+        
+    Returns:
+        np.ndarray: (청크 수, 2) 크기의 (시작, 끝) 위치 배열
+    """
+    splits = np.empty((max(16, text_len // max(1, chunk_size)), 2), dtype=np.int64)
+    count = 0
+    start = 0
+    
+    while start < text_len:
+        # 결과 배열이 가득 찬 경우 확장
+        if count == splits.shape[0]:
+            grown = np.empty((splits.shape[0] * 2, 2), dtype=np.int64)
+            grown[:count] = splits[:count]
+            splits = grown
+        
+        # 청크 끝 위치 계산
+        end = start + chunk_size
+        
+        if end >= text_len:
+            # 마지막 청크인 경우
+            splits[count, 0] = start
+            splits[count, 1] = text_len
+            count += 1
+            break
+        
+        # 문장 또는 단락 끝에서 잘라내기 (더 자연스러운 분할을 위해)
+        # 경계 검색 범위: 청크 중간 이후 ~ 청크 끝 (구분자 2글자가 청크 안에 포함되어야 함)
+        window_start = start + chunk_size // 2
+        window_last = end - 2
+        
+        # 1. 단락 끝 (빈 줄) 찾기 - 범위 내 첫 번째 단락 끝
+        para_idx = np.searchsorted(para_ends, window_start)
+        
+        if para_idx < len(para_ends) and para_ends[para_idx] <= window_last:
+            # 단락 끝을 찾은 경우
+            split_point = para_ends[para_idx] + 2  # '\n\n' 포함
+        else:
+            # 2. 단락 끝을 찾지 못한 경우, 범위 내 가장 늦은 문장 끝 찾기
+            sent_idx = np.searchsorted(sent_ends, window_last, side='right') - 1
+            
+            if sent_idx >= 0 and sent_ends[sent_idx] >= window_start:
+                split_point = sent_ends[sent_idx] + 1  # 마침표 등 포함
+            else:
+                # 문장 끝을 찾지 못한 경우, 범위 내 가장 늦은 공백에서 분할
+                space_idx = np.searchsorted(space_ends, end - 1, side='right') - 1
+                
+                if space_idx >= 0 and space_ends[space_idx] >= window_start:
+                    split_point = space_ends[space_idx] + 1  # 공백 포함
+                else:
+                    # 공백도 없는 경우, 그냥 크기대로 분할
+                    split_point = end
+        
+        splits[count, 0] = start
+        splits[count, 1] = split_point
+        count += 1
+        
+        # 다음 시작 위치 계산 (겹침 고려)
+        start = split_point - chunk_overlap
+        if start < split_point - chunk_size:
+            # 겹침이 너무 큰 경우 (음수가 될 수 있음) 조정
+            start = split_point - min(chunk_overlap, chunk_size // 2)
+        
+        # 시작 위치가 이전 분할 지점과 같거나 작으면 강제로 전진
+        if start <= split_point - chunk_size:
+            start = split_point
+    
+    return splits[:count]
+
+
+if njit is not None:
+    _find_split_offsets = njit(cache=True)(_find_split_offsets)
+
+
+def _simhash(text: str) -> Optional[int]:
+    """
+    단어 빈도를 가중치로 사용하는 64비트 SimHash 지문 계산
+    
+    Args:
+        text (str): 지문을 계산할 텍스트
+        
+    Returns:
+        Optional[int]: 64비트 지문 (단어가 없으면 None)
+    """
+    tokens = text.split()
+    if not tokens:
+        return None
+    
+    # 단어별 64비트 해시와 빈도
+    counts: Dict[str, int] = {}
+    for token in tokens:
+        counts[token] = counts.get(token, 0) + 1
+    
+    hashes = np.array(
+        [int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), 'little')
+         for token in counts],
+        dtype=np.uint64
+    )
+    weights = np.array(list(counts.values()), dtype=np.int64)
+    
+    # 비트별로 가중치를 더하거나 빼서 양수인 비트만 1로 설정
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+    scores = weights @ (bits.astype(np.int64) * 2 - 1)
+    
+    return int.from_bytes(np.packbits(scores > 0, bitorder='little').tobytes(), 'little')
+
 class DocumentProcessor:
     """
     다양한 형식의 문서를 처리하고 벡터 DB에 저장하는 클래스
@@ -56,6 +236,13 @@ class DocumentProcessor:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         
+        # 쿼리 결과 캐시 (정확히 일치하는 쿼리: LRU, 의미적으로 유사한 쿼리: FAISS 내적 인덱스)
+        self._exact_cache: "OrderedDict[bytes, Tuple[int, List[Dict[str, Any]]]]" = OrderedDict()
+        self._sem_index = None
+        self._sem_results: List[Tuple[int, List[Dict[str, Any]]]] = []
+        # 캐시를 채울 때의 벡터 DB 버전 (다르면 캐시 초기화)
+        self._cache_version = vector_db.version
+        
         logger.info(f"DocumentProcessor 초기화 완료 (청크 크기: {chunk_size}, 청크 겹침: {chunk_overlap})")
     
     def process_file(self, file_path: str) -> Tuple[int, Dict[str, Any]]:
@@ -68,97 +255,43 @@ class DocumentProcessor:
         Returns:
             Tuple[int, Dict[str, Any]]: (성공적으로 처리된 청크 수, 문서 메타데이터)
         """
-        if not os.path.exists(file_path):
-            error_msg = f"파일이 존재하지 않습니다: {file_path}"
-            logger.error(error_msg)
-            raise FileNotFoundError(error_msg)
-        
-        # 파일 확장자 확인
-        file_ext = os.path.splitext(file_path)[1].lower()
+        doc_id, chunks, doc_metadata = self._extract_and_chunk(file_path)
         
-        logger.info(f"파일 처리 시작: {file_path} (형식: {file_ext})")
+        # 청크가 없는 경우
+        if not chunks:
+            return 0, doc_metadata
         
         try:
-            # 파일 형식에 따라 텍스트 추출
-            if file_ext == '.pdf':
-                text = self._extract_text_from_pdf(file_path)
-            elif file_ext == '.docx':
-                text = self._extract_text_from_docx(file_path)
-            elif file_ext == '.txt':
-                text = self._extract_text_from_txt(file_path)
-            elif file_ext == '.md':
-                text = self._extract_text_from_md(file_path)
-            elif file_ext == '.eml':
-                text, metadata = self._extract_text_from_eml(file_path)
-            else:
-                error_msg = f"지원되지 않는 파일 형식입니다: {file_ext}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
-            # 문서 메타데이터 설정
-            file_stats = os.stat(file_path)
-            file_size = file_stats.st_size
-            modified_time = datetime.fromtimestamp(file_stats.st_mtime)
-            
-            doc_metadata = {
-                "file_path": file_path,
-                "file_name": os.path.basename(file_path),
-                "file_ext": file_ext,
-                "file_size": file_size,
-                "modified_time": modified_time.isoformat(),
-                "processed_time": get_timestamp_str()
-            }
-            
-            # 텍스트가 비어있는지 확인
-            if not text.strip():
-                logger.warning(f"파일에서 텍스트를 추출했지만 내용이 없습니다: {file_path}")
-                return 0, doc_metadata
-            
-            # 텍스트를 청크로 분할
-            chunks = self._split_text(text)
-            
-            # 청크가 없는 경우
-            if not chunks:
-                logger.warning(f"텍스트를 분할했지만 청크가 생성되지 않았습니다: {file_path}")
-                return 0, doc_metadata
-            
-            # 문서 ID 생성 (파일 경로 기반)
-            doc_id = self._generate_doc_id(file_path)
-            
             # 임베딩 생성
             embeddings = self.embedding_model.embed_texts(chunks)
             
             # 벡터 DB에 문서 저장
-            self.vector_db.add_document(doc_id, file_path, chunks, embeddings)
+            self._persist(doc_id, file_path, chunks, embeddings)
             
             # 저장 완료
             logger.info(f"파일 처리 완료: {file_path} (청크 수: {len(chunks)})")
             
-            # 문서 메타데이터 업데이트
-            doc_metadata.update({
-                "doc_id": doc_id,
-                "chunk_count": len(chunks),
-                "total_text_length": len(text)
-            })
-            
-            # EML 파일인 경우 추가 메타데이터 병합
-            if file_ext == '.eml' and metadata:
-                doc_metadata.update(metadata)
-            
             return len(chunks), doc_metadata
             
         except Exception as e:
             logger.error(f"파일 처리 중 오류 발생: {file_path} - {str(e)}")
             raise
     
-    def process_directory(self, dir_path: str, file_types: List[str] = None) -> List[Dict[str, Any]]:
+    def process_directory(self,
+                          dir_path: str,
+                          file_types: List[str] = None,
+                          max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         디렉토리 내의 모든 파일을 처리하고 벡터 DB에 저장
         
+        텍스트 추출은 프로세스 풀에서 병렬로 수행하고, 모든 파일의 청크를 모아
+        한 번에 임베딩한 뒤 문서별로 나누어 저장합니다.
+        
         Args:
             dir_path (str): 처리할 디렉토리 경로
             file_types (List[str], optional): 처리할 파일 확장자 목록 (예: ['.pdf', '.docx'])
                 기본값은 None으로, 모든 지원되는 파일 형식을 처리
+            max_workers (Optional[int]): 텍스트 추출 프로세스 수 (기본값: None, CPU 코어 수)
                 
         Returns:
             List[Dict[str, Any]]: 처리된 파일들의 메타데이터 목록
@@ -188,30 +321,68 @@ class DocumentProcessor:
         processed_count = 0
         error_count = 0
         
-        # 디렉토리 내 파일 목록 가져오기
-        for root, _, files in os.walk(dir_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                file_ext = os.path.splitext(file_path)[1].lower()
-                
-                # 파일 형식 확인
-                if file_ext not in file_types:
-                    continue
-                
+        # 디렉토리 내 파일 목록 가져오기 (디렉토리 읽기 시 얻은 파일 정보 재사용)
+        file_entries = list(self._iter_files(dir_path, set(file_types)))
+        file_paths = [entry.path for entry in file_entries]
+        
+        # 텍스트 추출은 CPU 부하가 크므로 파일이 여러 개인 경우 프로세스 풀에서 병렬 처리
+        executor = None
+        futures = [None] * len(file_paths)
+        if len(file_paths) > 1:
+            executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+            futures = [executor.submit(_extract_text, file_path) for file_path in file_paths]
+        
+        # 임베딩 대기 중인 문서 목록 (파일 경로, 문서 ID, 청크 목록, 메타데이터)
+        pending = []
+        
+        try:
+            for entry, future in zip(file_entries, futures):
+                file_path = entry.path
                 try:
-                    # 파일 처리
-                    chunks_count, metadata = self.process_file(file_path)
+                    # 텍스트 추출 결과를 청크로 분할 (임베딩은 마지막에 일괄 처리)
+                    extracted = future.result() if future is not None else None
+                    doc_id, chunks, metadata = self._extract_and_chunk(
+                        file_path, extracted, entry.stat(follow_symlinks=False)
+                    )
                     
-                    if chunks_count > 0:
-                        results.append(metadata)
-                        processed_count += 1
-                        logger.info(f"파일 처리 성공: {file_path} (청크 수: {chunks_count})")
+                    if chunks:
+                        pending.append((file_path, doc_id, chunks, metadata))
                     else:
                         logger.warning(f"파일에서 텍스트를 추출했지만 저장된 청크가 없습니다: {file_path}")
                 
                 except Exception as e:
                     logger.error(f"파일 처리 실패: {file_path} - {str(e)}")
                     error_count += 1
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        if pending:
+            # 전체 청크를 한 번에 임베딩
+            all_chunks = [chunk for _, _, chunks, _ in pending for chunk in chunks]
+            
+            try:
+                embeddings = self._embed_chunks_batched(all_chunks)
+            except Exception as e:
+                logger.error(f"디렉토리 청크 임베딩 실패: {dir_path} - {str(e)}")
+                error_count += len(pending)
+                pending = []
+            
+            # 문서별로 임베딩을 나누어 저장
+            offset = 0
+            for file_path, doc_id, chunks, metadata in pending:
+                doc_embeddings = embeddings[offset:offset + len(chunks)]
+                offset += len(chunks)
+                
+                try:
+                    self._persist(doc_id, file_path, chunks, doc_embeddings)
+                    results.append(metadata)
+                    processed_count += 1
+                    logger.info(f"파일 처리 성공: {file_path} (청크 수: {len(chunks)})")
+                
+                except Exception as e:
+                    logger.error(f"파일 처리 실패: {file_path} - {str(e)}")
+                    error_count += 1
         
         logger.info(f"디렉토리 처리 완료: {dir_path} (성공: {processed_count}, 실패: {error_count})")
         
@@ -228,7 +399,7 @@ class DocumentProcessor:
         Returns:
             Tuple[int, Dict[str, Any]]: (성공적으로 처리된 청크 수, 문서 메타데이터)
         """
-        if not text.strip():
+        if not text or text.isspace():
             logger.warning("처리할 텍스트가 비어 있습니다.")
             return 0, {}
         
@@ -239,8 +410,10 @@ class DocumentProcessor:
             if metadata is None:
                 metadata = {}
             
-            # 문서 ID 생성
-            text_hash = hashlib.md5(text[:1000].encode()).hexdigest()
+            # 문서 ID 생성 (앞부분이 같은 문서끼리 충돌하지 않도록 전체 텍스트 해시)
+            text_hash = hashlib.blake2b(
+                text.encode('utf-8', 'surrogatepass'), digest_size=DOC_ID_DIGEST_SIZE
+            ).hexdigest()
             doc_id = f"text_{text_hash}_{int(datetime.now().timestamp())}"
             
             # 텍스트 청크로 분할
@@ -255,7 +428,7 @@ class DocumentProcessor:
             embeddings = self.embedding_model.embed_texts(chunks)
             
             # 벡터 DB에 문서 저장
-            self.vector_db.add_document(doc_id, "", chunks, embeddings)
+            self._persist(doc_id, "", chunks, embeddings)
             
             # 처리 완료
             logger.info(f"텍스트 처리 완료 (청크 수: {len(chunks)})")
@@ -294,11 +467,37 @@ class DocumentProcessor:
         logger.info(f"유사 문서 검색 시작 (쿼리: '{query[:50]}...', top_k: {top_k})")
         
         try:
+            # 다른 경로(다른 인스턴스, 문서 삭제 등)로 벡터 DB가 바뀌었으면 캐시된 결과를 버림
+            if self._cache_version != self.vector_db.version:
+                self._clear_query_cache()
+            
+            # 1. 정확히 일치하는 쿼리 캐시 확인
+            cache_key = hashlib.blake2b(query.encode(), digest_size=DOC_ID_DIGEST_SIZE).digest()
+            cached = self._exact_cache.get(cache_key)
+            if cached is not None and cached[0] >= top_k:
+                self._exact_cache.move_to_end(cache_key)
+                logger.info("유사 문서 검색 완료 (쿼리 캐시 적중)")
+                return self._copy_results(cached[1][:top_k])
+            
             # 쿼리 임베딩
             query_embedding = self.embedding_model.embed_query(query)
             
+            # 2. 의미적으로 유사한 쿼리 캐시 확인
+            normalized = self._normalize_query_embedding(query_embedding)
+            if normalized is not None and self._sem_index is not None and self._sem_index.ntotal > 0:
+                similarities, indices = self._sem_index.search(normalized, 1)
+                sem_idx = int(indices[0][0])
+                if sem_idx != -1 and similarities[0][0] >= SEMANTIC_CACHE_THRESHOLD:
+                    cached_top_k, cached_results = self._sem_results[sem_idx]
+                    if cached_top_k >= top_k:
+                        logger.info(f"유사 문서 검색 완료 (의미 캐시 적중, 유사도: {similarities[0][0]:.4f})")
+                        return self._copy_results(cached_results[:top_k])
+            
             # 벡터 DB에서 유사한 문서 검색
-            results = self.vector_db.search_vectors(query_embedding, top_k)
+            results = self.vector_db.search(query_embedding, top_k)
+            
+            # 검색 결과 캐시에 저장
+            self._cache_query_results(cache_key, normalized, top_k, results)
             
             logger.info(f"유사 문서 검색 완료 (결과 수: {len(results)})")
             
@@ -308,7 +507,301 @@ class DocumentProcessor:
             logger.error(f"유사 문서 검색 중 오류 발생: {str(e)}")
             raise
     
-    def _extract_text_from_pdf(self, file_path: str) -> str:
+    def _normalize_query_embedding(self, query_embedding: np.ndarray) -> Optional[np.ndarray]:
+        """
+        의미 캐시 검색을 위해 쿼리 임베딩을 단위 벡터로 정규화
+        
+        Args:
+            query_embedding (np.ndarray): 쿼리 임베딩 벡터
+            
+        Returns:
+            Optional[np.ndarray]: (1, 차원) 크기의 정규화된 float32 벡터 (영벡터인 경우 None)
+        """
+        vector = np.asarray(query_embedding, dtype=np.float32).reshape(1, -1)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        
+        return np.ascontiguousarray(vector / norm)
+    
+    def _cache_query_results(self,
+                             cache_key: bytes,
+                             normalized: Optional[np.ndarray],
+                             top_k: int,
+                             results: List[Dict[str, Any]]) -> None:
+        """
+        검색 결과를 정확 일치 캐시와 의미 캐시에 저장
+        
+        Args:
+            cache_key (bytes): 쿼리 해시 키
+            normalized (Optional[np.ndarray]): 정규화된 쿼리 임베딩
+            top_k (int): 검색한 결과 수
+            results (List[Dict[str, Any]]): 검색 결과
+        """
+        # 호출자가 반환된 결과를 수정해도 캐시가 바뀌지 않도록 복사본 저장
+        results = self._copy_results(results)
+        
+        # 정확 일치 캐시 (LRU)
+        self._exact_cache[cache_key] = (top_k, results)
+        self._exact_cache.move_to_end(cache_key)
+        if len(self._exact_cache) > QUERY_CACHE_SIZE:
+            self._exact_cache.popitem(last=False)
+        
+        # 의미 캐시 (최대 크기를 넘으면 초기화)
+        if normalized is None:
+            return
+        
+        if self._sem_index is None or self._sem_index.ntotal >= SEMANTIC_CACHE_SIZE:
+            self._sem_index = faiss.IndexFlatIP(normalized.shape[1])
+            self._sem_results = []
+        
+        self._sem_index.add(normalized)
+        self._sem_results.append((top_k, results))
+    
+    @staticmethod
+    def _copy_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        검색 결과 목록 복사 (결과 항목은 값이 모두 불변인 평평한 dict이므로 얕은 복사로 충분)
+        
+        Args:
+            results (List[Dict[str, Any]]): 검색 결과
+            
+        Returns:
+            List[Dict[str, Any]]: 복사된 검색 결과
+        """
+        return [dict(result) for result in results]
+    
+    def _clear_query_cache(self) -> None:
+        """
+        쿼리 결과 캐시 초기화 (벡터 DB 버전이 캐시를 채울 때와 다른 경우 호출)
+        """
+        self._exact_cache.clear()
+        self._sem_index = None
+        self._sem_results = []
+        self._cache_version = self.vector_db.version
+    
+    def _extract_and_chunk(self,
+                           file_path: str,
+                           extracted: Optional[Tuple[str, Optional[Dict[str, Any]]]] = None,
+                           file_stats: Optional[os.stat_result] = None
+                           ) -> Tuple[Optional[str], List[str], Dict[str, Any]]:
+        """
+        파일에서 텍스트를 추출하고 청크로 분할 (임베딩 및 저장은 하지 않음)
+        
+        Args:
+            file_path (str): 처리할 파일 경로
+            extracted (Optional[Tuple[str, Optional[Dict[str, Any]]]]): 미리 추출된 (텍스트, 메타데이터)
+                None인 경우 현재 프로세스에서 직접 추출
+            file_stats (Optional[os.stat_result]): 미리 조회한 파일 정보
+                None인 경우 os.stat으로 조회
+            
+        Returns:
+            Tuple[Optional[str], List[str], Dict[str, Any]]: (문서 ID, 청크 목록, 문서 메타데이터)
+                - 청크가 없는 경우 문서 ID는 None, 청크 목록은 빈 리스트
+        """
+        if not os.path.exists(file_path):
+            error_msg = f"파일이 존재하지 않습니다: {file_path}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+        
+        # 파일 확장자 확인
+        file_ext = os.path.splitext(file_path)[1].lower()
+        
+        logger.info(f"파일 처리 시작: {file_path} (형식: {file_ext})")
+        
+        try:
+            # PDF는 전체 텍스트를 만들지 않고 페이지 단위로 읽으면서 바로 청크로 분할
+            if extracted is None and file_ext == '.pdf':
+                text = None
+                text_length = 0
+                
+                def _counted(pieces: Iterator[str]) -> Iterator[str]:
+                    nonlocal text_length
+                    for piece in pieces:
+                        text_length += len(piece)
+                        yield piece
+                
+                chunks = list(self._split_text_stream(_counted(_iter_pdf_text_cached(file_path))))
+                metadata = None
+            else:
+                # 파일 형식에 따라 텍스트 추출 (이미 추출된 결과가 있으면 재사용)
+                if extracted is None:
+                    extracted = _extract_text(file_path)
+                text, metadata = extracted
+                text_length = len(text) if text else 0
+            
+            # 문서 메타데이터 설정
+            if file_stats is None:
+                file_stats = os.stat(file_path)
+            file_size = file_stats.st_size
+            modified_time = datetime.fromtimestamp(file_stats.st_mtime)
+            
+            doc_metadata = {
+                "file_path": file_path,
+                "file_name": os.path.basename(file_path),
+                "file_ext": file_ext,
+                "file_size": file_size,
+                "modified_time": modified_time.isoformat(),
+                "processed_time": get_timestamp_str()
+            }
+            
+            if text is not None:
+                # 텍스트가 비어있는지 확인
+                if not text or text.isspace():
+                    logger.warning(f"파일에서 텍스트를 추출했지만 내용이 없습니다: {file_path}")
+                    return None, [], doc_metadata
+                
+                # 텍스트를 청크로 분할
+                chunks = self._split_text(text)
+            
+            # 청크가 없는 경우
+            if not chunks:
+                logger.warning(f"텍스트를 분할했지만 청크가 생성되지 않았습니다: {file_path}")
+                return None, [], doc_metadata
+            
+            # 문서 ID 생성 (파일 경로 기반)
+            doc_id = self._generate_doc_id(file_path, file_stats)
+            
+            # 문서 메타데이터 업데이트
+            doc_metadata.update({
+                "doc_id": doc_id,
+                "chunk_count": len(chunks),
+                "total_text_length": text_length
+            })
+            
+            # EML 파일인 경우 추가 메타데이터 병합
+            if file_ext == '.eml' and metadata:
+                doc_metadata.update(metadata)
+            
+            return doc_id, chunks, doc_metadata
+            
+        except Exception as e:
+            logger.error(f"파일 처리 중 오류 발생: {file_path} - {str(e)}")
+            raise
+    
+    @staticmethod
+    def _iter_files(dir_path: str, file_types: set) -> Iterator[os.DirEntry]:
+        """
+        디렉토리를 재귀적으로 탐색하여 지정된 확장자의 파일 항목 반환
+        
+        심볼릭 링크는 따라가지 않습니다.
+        
+        Args:
+            dir_path (str): 탐색할 디렉토리 경로
+            file_types (set): 처리할 파일 확장자 집합 (예: {'.pdf', '.docx'})
+            
+        Yields:
+            os.DirEntry: 조건에 맞는 파일 항목
+        """
+        stack = [dir_path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (entry.is_file(follow_symlinks=False)
+                          and os.path.splitext(entry.name)[1].lower() in file_types):
+                        yield entry
+    
+    def _persist(self, doc_id: str, file_path: str, chunks: List[str], embeddings: np.ndarray) -> None:
+        """
+        청크와 임베딩을 벡터 DB에 저장
+        
+        Args:
+            doc_id (str): 문서 ID
+            file_path (str): 원본 파일 경로 (텍스트 직접 입력인 경우 빈 문자열)
+            chunks (List[str]): 텍스트 청크 목록
+            embeddings (np.ndarray): 청크 임베딩 벡터 배열 (float16 변환은 여기서 수행)
+        """
+        # 전달 버퍼를 줄이기 위해 float16으로 변환 (정규화는 벡터 DB가 인덱스에 맞게 수행)
+        embeddings_fp16 = np.asarray(embeddings).astype(np.float16)
+        
+        # 저장된 문서가 바뀌면 벡터 DB 버전이 올라가 다음 검색에서 결과 캐시가 초기화됨
+        self.vector_db.add_document(doc_id, file_path, chunks, embeddings_fp16)
+    
+    def _embed_chunks_batched(self, chunks: List[str]) -> np.ndarray:
+        """
+        여러 문서의 청크를 길이 순으로 정렬하여 큰 배치로 임베딩
+        
+        거의 동일한 청크(머리말, 서명 등 반복되는 내용)는 한 번만 임베딩하여 재사용하고,
+        비슷한 길이의 청크끼리 배치를 구성하여 패딩 낭비를 줄입니다.
+        결과는 입력 순서대로 되돌려 반환합니다.
+        
+        Args:
+            chunks (List[str]): 임베딩할 청크 목록
+            
+        Returns:
+            np.ndarray: 입력 순서와 동일한 임베딩 벡터 배열
+        """
+        # 중복 청크를 대표 청크로 매핑
+        canonical = self._find_near_duplicates(chunks)
+        unique_indices = np.flatnonzero(canonical == np.arange(len(chunks)))
+        
+        if len(unique_indices) < len(chunks):
+            logger.info(f"유사 중복 청크 {len(chunks) - len(unique_indices)}개는 임베딩을 재사용합니다.")
+        
+        # 길이 순 정렬
+        order = unique_indices[
+            np.argsort([len(chunks[i]) for i in unique_indices], kind='stable')
+        ]
+        sorted_embeddings = self.embedding_model.embed_texts(
+            [chunks[i] for i in order],
+            batch_size=DIRECTORY_EMBED_BATCH_SIZE
+        )
+        
+        # 원래 순서로 복원 (중복 청크는 대표 청크의 임베딩 사용)
+        rank = np.empty(len(chunks), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        embeddings = sorted_embeddings[rank[canonical]]
+        
+        return embeddings
+    
+    def _find_near_duplicates(self, chunks: List[str]) -> np.ndarray:
+        """
+        SimHash로 거의 동일한 청크를 찾아 대표 청크 인덱스로 매핑
+        
+        64비트 지문을 16비트씩 4개 구간으로 나누어 색인하면, 해밍 거리가
+        SIMHASH_MAX_DISTANCE(3) 이하인 지문은 적어도 한 구간이 일치하므로
+        후보만 비교할 수 있습니다.
+        
+        Args:
+            chunks (List[str]): 청크 목록
+            
+        Returns:
+            np.ndarray: 각 청크의 대표 청크 인덱스 배열 (중복이 아니면 자기 자신)
+        """
+        canonical = np.arange(len(chunks))
+        fingerprints: Dict[int, int] = {}  # 대표 청크 인덱스: 지문
+        bands: List[Dict[int, List[int]]] = [{} for _ in range(4)]
+        
+        for i, chunk in enumerate(chunks):
+            fingerprint = _simhash(chunk)
+            if fingerprint is None:
+                continue
+            
+            # 구간이 일치하는 후보 중 해밍 거리가 임계값 이하인 대표 청크 찾기
+            match = None
+            for band, table in enumerate(bands):
+                for candidate in table.get((fingerprint >> (band * 16)) & 0xFFFF, ()):
+                    if bin(fingerprint ^ fingerprints[candidate]).count('1') <= SIMHASH_MAX_DISTANCE:
+                        match = candidate
+                        break
+                if match is not None:
+                    break
+            
+            if match is not None:
+                canonical[i] = match
+                continue
+            
+            # 새 대표 청크로 등록
+            fingerprints[i] = fingerprint
+            for band, table in enumerate(bands):
+                table.setdefault((fingerprint >> (band * 16)) & 0xFFFF, []).append(i)
+        
+        return canonical
+    
+    @staticmethod
+    def _extract_text_from_pdf(file_path: str) -> str:
         """
         PDF 파일에서 텍스트 추출
         
@@ -320,31 +813,70 @@ class DocumentProcessor:
         """
         logger.debug(f"PDF 파일에서 텍스트 추출 시작: {file_path}")
         
+        text = "".join(DocumentProcessor._iter_pdf_text(file_path))
+        
+        logger.debug(f"PDF 파일에서 텍스트 추출 완료: {file_path} (길이: {len(text)})")
+        
+        return text
+    
+    @staticmethod
+    def _iter_pdf_text(file_path: str) -> Iterator[str]:
+        """
+        PDF 파일의 텍스트를 페이지 단위로 읽어 순서대로 반환
+        
+        페이지 사이를 빈 줄로 연결하고 여러 줄바꿈을 정리하므로, 반환된 조각을
+        모두 이어 붙이면 _extract_text_from_pdf의 결과와 같습니다.
+        
+        Args:
+            file_path (str): PDF 파일 경로
+            
+        Yields:
+            str: 페이지별 텍스트 조각
+        """
         try:
             with open(file_path, 'rb') as file:
                 reader = pypdf.PdfReader(file)
-                text = ""
+                first = True
+                
+                # 직전 조각 끝의 연속 줄바꿈 수 (페이지 경계를 넘는 줄바꿈 정리용)
+                trailing_newlines = 0
                 
                 # 각 페이지에서 텍스트 추출
                 for i, page in enumerate(reader.pages):
                     page_text = page.extract_text()
-                    if page_text:
-                        text += f"{page_text}\n\n"
-                    else:
+                    if not page_text:
                         logger.debug(f"PDF 페이지 {i+1}에서 텍스트를 추출할 수 없습니다.")
-                
-                # 여러 줄바꿈 정리
-                text = re.sub(r'\n{3,}', '\n\n', text)
-                
-                logger.debug(f"PDF 파일에서 텍스트 추출 완료: {file_path} (길이: {len(text)})")
-                
-                return text
+                        continue
+                    
+                    # 페이지 사이를 빈 줄로 연결하고 여러 줄바꿈 정리
+                    piece = _MULTI_NEWLINE_PATTERN.sub(
+                        '\n\n', page_text if first else "\n\n" + page_text
+                    )
+                    first = False
+                    
+                    # 직전 조각과 이어지는 줄바꿈이 두 개를 넘지 않도록 앞부분 제거
+                    leading = len(piece) - len(piece.lstrip('\n'))
+                    excess = trailing_newlines + leading - 2
+                    if excess > 0:
+                        piece = piece[excess:]
+                    
+                    if not piece:
+                        continue
+                    
+                    body = piece.rstrip('\n')
+                    if body:
+                        trailing_newlines = len(piece) - len(body)
+                    else:
+                        trailing_newlines += len(piece)
+                    
+                    yield piece
                 
         except Exception as e:
             logger.error(f"PDF 파일에서 텍스트 추출 중 오류 발생: {file_path} - {str(e)}")
             raise
     
-    def _extract_text_from_docx(self, file_path: str) -> str:
+    @staticmethod
+    def _extract_text_from_docx(file_path: str) -> str:
         """
         DOCX 파일에서 텍스트 추출
         
@@ -358,12 +890,9 @@ class DocumentProcessor:
         
         try:
             doc = docx.Document(file_path)
-            text = ""
             
             # 각 단락에서 텍스트 추출
-            for para in doc.paragraphs:
-                if para.text:
-                    text += f"{para.text}\n"
+            text = "\n".join(para.text for para in doc.paragraphs if para.text)
             
             # 텍스트 정리
             text = text.strip()
@@ -376,7 +905,48 @@ class DocumentProcessor:
             logger.error(f"DOCX 파일에서 텍스트 추출 중 오류 발생: {file_path} - {str(e)}")
             raise
     
-    def _extract_text_from_txt(self, file_path: str) -> str:
+    @staticmethod
+    def _read_text_autodetect(file_path: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        텍스트 파일을 메모리 맵으로 한 번만 읽고 인코딩을 판별하여 디코딩
+        
+        BOM이 있으면 해당 인코딩을 사용하고, 없으면 utf-8, cp949, euc-kr 순으로 시도합니다.
+        
+        Args:
+            file_path (str): 텍스트 파일 경로
+            
+        Returns:
+            Tuple[Optional[str], Optional[str]]: (디코딩된 텍스트, 사용한 인코딩)
+                - 어떠한 인코딩으로도 읽을 수 없는 경우 (None, None)
+        """
+        with open(file_path, 'rb') as file:
+            # 빈 파일은 메모리 맵을 만들 수 없음
+            if os.fstat(file.fileno()).st_size == 0:
+                return "", "utf-8"
+            
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                # BOM으로 인코딩 판별
+                encodings = _TEXT_ENCODINGS
+                for bom, bom_encoding in _BOM_ENCODINGS:
+                    if buf[:len(bom)] == bom:
+                        encodings = [bom_encoding]
+                        break
+                
+                for encoding in encodings:
+                    try:
+                        text = str(buf, encoding)
+                    except UnicodeDecodeError:
+                        logger.debug(f"{file_path} 파일을 {encoding} 인코딩으로 디코딩하는 데 실패했습니다.")
+                        continue
+                    
+                    # 텍스트 모드로 읽을 때와 동일하게 줄바꿈 정규화
+                    text = text.replace('\r\n', '\n').replace('\r', '\n')
+                    return text, encoding
+        
+        return None, None
+    
+    @staticmethod
+    def _extract_text_from_txt(file_path: str) -> str:
         """
         TXT 파일에서 텍스트 추출
         
@@ -389,24 +959,15 @@ class DocumentProcessor:
         logger.debug(f"TXT 파일에서 텍스트 추출 시작: {file_path}")
         
         try:
-            # 다양한 인코딩 시도
-            encodings = ['utf-8', 'cp949', 'euc-kr']
-            text = None
-            
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as file:
-                        text = file.read()
-                    logger.debug(f"TXT 파일을 {encoding} 인코딩으로 성공적으로 읽었습니다.")
-                    break
-                except UnicodeDecodeError:
-                    logger.debug(f"TXT 파일을 {encoding} 인코딩으로 읽는 데 실패했습니다.")
-                    continue
+            # 파일을 한 번만 읽고 인코딩 판별 후 디코딩
+            text, encoding = DocumentProcessor._read_text_autodetect(file_path)
             
             if text is None:
                 logger.error(f"TXT 파일을 어떠한 인코딩으로도 읽을 수 없습니다: {file_path}")
                 raise UnicodeDecodeError("", b"", 0, 0, "텍스트 파일을 읽을 수 없습니다.")
             
+            logger.debug(f"TXT 파일을 {encoding} 인코딩으로 성공적으로 읽었습니다.")
+            
             logger.debug(f"TXT 파일에서 텍스트 추출 완료: {file_path} (길이: {len(text)})")
             
             return text
@@ -415,7 +976,8 @@ class DocumentProcessor:
             logger.error(f"TXT 파일에서 텍스트 추출 중 오류 발생: {file_path} - {str(e)}")
             raise
     
-    def _extract_text_from_md(self, file_path: str) -> str:
+    @staticmethod
+    def _extract_text_from_md(file_path: str) -> str:
         """
         Markdown 파일에서 텍스트 추출
         
@@ -428,30 +990,27 @@ class DocumentProcessor:
         logger.debug(f"Markdown 파일에서 텍스트 추출 시작: {file_path}")
         
         try:
-            # 다양한 인코딩 시도
-            encodings = ['utf-8', 'cp949', 'euc-kr']
-            md_text = None
-            
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as file:
-                        md_text = file.read()
-                    logger.debug(f"Markdown 파일을 {encoding} 인코딩으로 성공적으로 읽었습니다.")
-                    break
-                except UnicodeDecodeError:
-                    logger.debug(f"Markdown 파일을 {encoding} 인코딩으로 읽는 데 실패했습니다.")
-                    continue
+            # 파일을 한 번만 읽고 인코딩 판별 후 디코딩
+            md_text, encoding = DocumentProcessor._read_text_autodetect(file_path)
             
             if md_text is None:
                 logger.error(f"Markdown 파일을 어떠한 인코딩으로도 읽을 수 없습니다: {file_path}")
                 raise UnicodeDecodeError("", b"", 0, 0, "Markdown 파일을 읽을 수 없습니다.")
             
-            # Markdown을 HTML로 변환
-            html = markdown.markdown(md_text)
-            
-            # HTML에서 텍스트 추출
-            soup = BeautifulSoup(html, 'html.parser')
-            text = soup.get_text(separator='\n')
+            logger.debug(f"Markdown 파일을 {encoding} 인코딩으로 성공적으로 읽었습니다.")
+            
+            # Markdown 토큰 스트림에서 텍스트만 수집 (HTML 렌더링/파싱 생략)
+            parts = []
+            for token in _MD.parse(md_text):
+                if token.type == 'inline':
+                    parts.append(''.join(
+                        '\n' if child.type in _MD_LINE_BREAK_TOKENS else child.content
+                        for child in token.children
+                        if child.type in _MD_INLINE_TEXT_TOKENS or child.type in _MD_LINE_BREAK_TOKENS
+                    ))
+                elif token.type in _MD_BLOCK_TEXT_TOKENS:
+                    parts.append(token.content)
+            text = '\n'.join(parts)
             
             logger.debug(f"Markdown 파일에서 텍스트 추출 완료: {file_path} (길이: {len(text)})")
             
@@ -461,7 +1020,8 @@ class DocumentProcessor:
             logger.error(f"Markdown 파일에서 텍스트 추출 중 오류 발생: {file_path} - {str(e)}")
             raise
     
-    def _extract_text_from_eml(self, file_path: str) -> Tuple[str, Dict[str, Any]]:
+    @staticmethod
+    def _extract_text_from_eml(file_path: str) -> Tuple[str, Dict[str, Any]]:
         """
         EML 파일에서 텍스트 추출
         
@@ -481,18 +1041,11 @@ class DocumentProcessor:
                 return "", {}
             
             # 이메일 메타데이터 추출
-            metadata = result["metadata"]
-            content = result["content"]
-            attachments = result["attachments"]
-            
-            # 첨부 파일 정보 구성
-            attachments_info = []
-            for attachment in attachments:
-                attachments_info.append({
-                    "filename": attachment.get("filename", "알 수 없는 파일"),
-                    "content_type": attachment.get("content_type", "알 수 없는 형식"),
-                    "size": attachment.get("size", 0)
-                })
+            metadata = result.metadata
+            content = result.content
+            
+            # 첨부 파일 정보 구성 (JSON으로 저장되므로 딕셔너리로 변환)
+            attachments_info = [attachment.to_dict() for attachment in result.attachments]
             
             # 메타데이터에 첨부 파일 정보 추가
             metadata["attachments"] = attachments_info
@@ -526,91 +1079,155 @@ class DocumentProcessor:
         Returns:
             List[str]: 분할된 텍스트 청크 목록
         """
-        if not text.strip():
+        # 공백만 있는 텍스트 확인 (strip()과 달리 복사본을 만들지 않음)
+        if not text or text.isspace():
             return []
         
         logger.debug(f"텍스트 분할 시작 (길이: {len(text)}, 청크 크기: {self.chunk_size}, 겹침: {self.chunk_overlap})")
         
-        # 텍스트가 청크 크기보다 작은 경우
+        # 텍스트가 청크 크기보다 작은 경우 경계 계산 없이 바로 반환
         if len(text) <= self.chunk_size:
             return [text]
         
-        chunks = []
-        start = 0
+        # 단락/문장/공백 경계 위치를 한 번에 계산
+        para_ends, sent_ends, space_ends = self._boundary_offsets(text)
+        
+        # 분할 위치 계산 후 한 번에 잘라내기
+        splits = _find_split_offsets(
+            len(text), self.chunk_size, self.chunk_overlap,
+            para_ends, sent_ends, space_ends
+        )
         
-        while start < len(text):
-            # 청크 끝 위치 계산
-            end = start + self.chunk_size
+        chunks = self._slice_chunks(text, splits)
+        
+        logger.debug(f"텍스트 분할 완료 (청크 수: {len(chunks)})")
+        
+        return chunks
+    
+    def _split_text_stream(self, pieces: Iterable[str]) -> Iterator[str]:
+        """
+        텍스트 조각 스트림을 청크로 분할
+        
+        전체 텍스트를 만들지 않고 아직 확정되지 않은 부분만 버퍼에 유지하면서,
+        확정된 청크를 바로 내보냅니다. 결과는 조각을 모두 이어 붙인 텍스트에
+        _split_text를 적용한 것과 같습니다.
+        
+        Args:
+            pieces (Iterable[str]): 순서대로 이어지는 텍스트 조각
             
-            if end >= len(text):
-                # 마지막 청크인 경우
-                chunk = text[start:]
-                chunks.append(chunk)
-                break
-            
-            # 문장 또는 단락 끝에서 잘라내기 (더 자연스러운 분할을 위해)
-            # 1. 단락 끝 (빈 줄) 찾기
-            paragraph_end = text.find('\n\n', start + self.chunk_size // 2, end)
-            
-            # 2. 단락 끝을 찾지 못한 경우, 문장 끝 (마침표, 물음표, 느낌표) 찾기
-            if paragraph_end == -1:
-                # 문장 끝 찾기 (마침표, 물음표, 느낌표 + 공백 또는 줄바꿈)
-                sentence_patterns = ['. ', '? ', '! ', '.\n', '?\n', '!\n']
-                sentence_ends = [text.find(pattern, start + self.chunk_size // 2, end) for pattern in sentence_patterns]
-                sentence_ends = [e for e in sentence_ends if e != -1]
-                
-                if sentence_ends:
-                    # 가장 늦은 문장 끝 선택
-                    split_point = max(sentence_ends) + 1  # 마침표 등 포함
-                else:
-                    # 문장 끝을 찾지 못한 경우, 공백에서 분할
-                    space = text.rfind(' ', start + self.chunk_size // 2, end)
-                    if space != -1:
-                        split_point = space + 1  # 공백 포함
-                    else:
-                        # 공백도 없는 경우, 그냥 크기대로 분할
-                        split_point = end
-            else:
-                # 단락 끝을 찾은 경우
-                split_point = paragraph_end + 2  # '\n\n' 포함
+        Yields:
+            str: 분할된 텍스트 청크
+        """
+        buffer = ""
+        trimmed = False
+        
+        for piece in pieces:
+            buffer += piece
+            
+            # 청크 크기의 2배 이상 쌓였을 때만 분할 위치 계산
+            if len(buffer) < 2 * self.chunk_size:
+                continue
+            
+            para_ends, sent_ends, space_ends = self._boundary_offsets(buffer)
+            splits = _find_split_offsets(
+                len(buffer), self.chunk_size, self.chunk_overlap,
+                para_ends, sent_ends, space_ends
+            )
+            
+            # 마지막 청크를 제외한 나머지는 뒤따르는 텍스트와 관계없이 확정됨
+            if len(splits) < 2:
+                continue
+            
+            yield from self._slice_chunks(buffer, splits[:-1])
+            buffer = buffer[int(splits[-1, 0]):]
+            trimmed = True
+        
+        if not trimmed:
+            # 버퍼를 한 번도 비우지 않은 경우 일반 분할과 동일하게 처리
+            yield from self._split_text(buffer)
+        elif buffer:
+            para_ends, sent_ends, space_ends = self._boundary_offsets(buffer)
+            splits = _find_split_offsets(
+                len(buffer), self.chunk_size, self.chunk_overlap,
+                para_ends, sent_ends, space_ends
+            )
+            yield from self._slice_chunks(buffer, splits)
+    
+    @staticmethod
+    def _slice_chunks(text: str, splits: np.ndarray) -> List[str]:
+        """
+        분할 위치 배열에 따라 텍스트를 잘라 청크 목록 생성
+        
+        Args:
+            text (str): 분할할 텍스트
+            splits (np.ndarray): (청크 수, 2) 크기의 (시작, 끝) 위치 배열
+            
+        Returns:
+            List[str]: 분할된 텍스트 청크 목록
+        """
+        chunks = []
+        last = len(splits) - 1
+        for i, (start, split_point) in enumerate(splits.tolist()):
+            if i == last and split_point == len(text):
+                # 마지막 청크는 그대로 추가
+                chunks.append(text[start:])
+                continue
             
             # 청크 추출
             chunk = text[start:split_point].strip()
             if chunk:  # 비어있지 않은 경우만 추가
                 chunks.append(chunk)
+        
+        return chunks
+    
+    def _boundary_offsets(self, text: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        텍스트 전체에서 단락 끝, 문장 끝, 공백 위치를 한 번에 계산
+        
+        Args:
+            text (str): 분할할 텍스트
             
-            # 다음 시작 위치 계산 (겹침 고려)
-            start = split_point - self.chunk_overlap
-            if start < split_point - self.chunk_size:
-                # 겹침이 너무 큰 경우 (음수가 될 수 있음) 조정
-                start = split_point - min(self.chunk_overlap, self.chunk_size // 2)
-            
-            # 시작 위치가 이전 분할 지점과 같거나 작으면 강제로 전진
-            if start <= split_point - self.chunk_size:
-                start = split_point
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (단락 끝, 문장 끝, 공백) 위치 배열
+                - 모든 배열은 오름차순으로 정렬된 문자 단위 위치
+        """
+        # 문자 단위 위치를 유지하기 위해 UTF-32 코드 포인트 배열로 변환
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
         
-        logger.debug(f"텍스트 분할 완료 (청크 수: {len(chunks)})")
+        is_newline = codes == _NEWLINE
+        is_space = codes == _SPACE
         
-        return chunks
+        # 단락 끝: 연속된 줄바꿈 두 개의 시작 위치
+        para_ends = np.flatnonzero(is_newline[:-1] & is_newline[1:])
+        
+        # 문장 끝: 마침표/물음표/느낌표 뒤에 공백 또는 줄바꿈이 오는 위치
+        is_mark = np.isin(codes[:-1], _SENTENCE_MARKS)
+        sent_ends = np.flatnonzero(is_mark & (is_space[1:] | is_newline[1:]))
+        
+        space_ends = np.flatnonzero(is_space)
+        
+        return para_ends, sent_ends, space_ends
     
-    def _generate_doc_id(self, file_path: str) -> str:
+    def _generate_doc_id(self, file_path: str, file_stats: Optional[os.stat_result] = None) -> str:
         """
         파일 경로를 기반으로 문서 ID 생성
         
         Args:
             file_path (str): 파일 경로
+            file_stats (Optional[os.stat_result]): 미리 조회한 파일 정보 (None인 경우 os.stat으로 조회)
             
         Returns:
             str: 생성된 문서 ID
         """
         # 파일 이름과 수정 시간으로 ID 생성
         file_name = os.path.basename(file_path)
-        file_stats = os.stat(file_path)
+        if file_stats is None:
+            file_stats = os.stat(file_path)
         modified_time = int(file_stats.st_mtime)
         
         # 해시 생성
         hash_base = f"{file_name}_{modified_time}"
-        doc_id = hashlib.md5(hash_base.encode()).hexdigest()
+        doc_id = hashlib.blake2b(hash_base.encode(), digest_size=DOC_ID_DIGEST_SIZE).hexdigest()
         
         return doc_id
     
@@ -626,3 +1243,191 @@ class DocumentProcessor:
             "chunk_overlap": self.chunk_overlap,
             "vector_db_stats": self.vector_db.get_stats()
         }
+
+
+def _extract_cache_path(file_path: str) -> str:
+    """
+    추출 텍스트 캐시 파일 경로 생성
+    
+    파일 경로 해시와 수정 시간, 크기를 키로 사용하므로 파일이 변경되면 자동으로 무효화됩니다.
+    
+    Args:
+        file_path (str): 원본 파일 경로
+        
+    Returns:
+        str: 캐시 파일 경로
+    """
+    file_stats = os.stat(file_path)
+    path_hash = hashlib.blake2b(
+        os.path.abspath(file_path).encode('utf-8', 'surrogatepass'), digest_size=8
+    ).hexdigest()
+    key = f"{path_hash}-{file_stats.st_mtime_ns}-{file_stats.st_size}"
+    return os.path.join(EXTRACT_CACHE_DIR, f"{key}.txt.z")
+
+
+def _iter_cached_text(file_path: str, extract: Callable[[str], Iterable[str]]) -> Iterator[str]:
+    """
+    디스크 캐시를 사용하여 텍스트를 조각 단위로 반환
+    
+    캐시가 있으면 압축된 텍스트를 블록 단위로 풀어 반환하고, 없으면 추출한 조각을
+    그대로 반환하면서 캐시에 압축 저장합니다. 어느 경우든 전체 텍스트를 메모리에 만들지 않습니다.
+    
+    Args:
+        file_path (str): 처리할 파일 경로
+        extract (Callable[[str], Iterable[str]]): 캐시가 없을 때 사용할 텍스트 조각 추출 함수
+        
+    Yields:
+        str: 텍스트 조각
+    """
+    cache_path = _extract_cache_path(file_path)
+    
+    try:
+        cache_file = open(cache_path, 'rb')
+    except FileNotFoundError:
+        cache_file = None
+    except OSError as e:
+        logger.warning(f"추출 텍스트 캐시를 열 수 없어 다시 추출합니다: {cache_path} - {str(e)}")
+        cache_file = None
+    
+    if cache_file is not None:
+        logger.debug(f"추출 텍스트 캐시 사용: {file_path}")
+        # 크기 제한 시 최근 사용한 캐시가 남도록 수정 시간 갱신
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        decompressor = zlib.decompressobj()
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        try:
+            with cache_file:
+                for block in iter(lambda: cache_file.read(EXTRACT_CACHE_READ_SIZE), b''):
+                    piece = decoder.decode(decompressor.decompress(block))
+                    if piece:
+                        yield piece
+                piece = decoder.decode(decompressor.flush(), final=True)
+                if piece:
+                    yield piece
+        except (zlib.error, UnicodeDecodeError):
+            # 손상된 캐시는 삭제하여 다음 처리 시 다시 추출되도록 함
+            logger.error(f"손상된 추출 텍스트 캐시를 삭제합니다: {cache_path}")
+            os.remove(cache_path)
+            raise
+        return
+    
+    # 병렬 추출 시 부분 기록된 파일이 읽히지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(EXTRACT_CACHE_DIR, exist_ok=True)
+        tmp_file = open(tmp_path, 'wb')
+    except OSError as e:
+        logger.warning(f"추출 텍스트 캐시 저장 실패: {cache_path} - {str(e)}")
+        yield from extract(file_path)
+        return
+    
+    compressor = zlib.compressobj(1)
+    try:
+        with tmp_file:
+            for piece in extract(file_path):
+                tmp_file.write(compressor.compress(piece.encode('utf-8')))
+                yield piece
+            tmp_file.write(compressor.flush())
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        # 추출 실패 또는 중단 시 미완성 캐시 파일 제거
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    _prune_extract_cache(cache_path)
+
+
+def _prune_extract_cache(cache_path: str) -> None:
+    """
+    새 캐시 파일을 저장한 뒤 같은 원본 파일의 이전 버전 캐시를 지우고, 전체 크기 제한 적용
+    
+    Args:
+        cache_path (str): 방금 저장한 캐시 파일 경로
+    """
+    path_prefix = os.path.basename(cache_path).split('-', 1)[0] + '-'
+    try:
+        with os.scandir(EXTRACT_CACHE_DIR) as it:
+            stale = [entry.path for entry in it
+                     if entry.name.startswith(path_prefix) and entry.name.endswith('.txt.z')
+                     and entry.path != cache_path]
+    except OSError:
+        stale = []
+    
+    for path in stale:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    removed = prune_cache_dir(EXTRACT_CACHE_DIR, EXTRACT_CACHE_MAX_BYTES)
+    if stale or removed:
+        logger.debug(f"추출 텍스트 캐시 정리 (이전 버전: {len(stale)}개, 크기 제한: {removed}개)")
+
+
+def _iter_pdf_text_cached(file_path: str) -> Iterator[str]:
+    """
+    디스크 캐시를 사용하여 PDF 텍스트를 페이지 단위로 반환
+    
+    Args:
+        file_path (str): PDF 파일 경로
+        
+    Yields:
+        str: 텍스트 조각
+    """
+    return _iter_cached_text(file_path, DocumentProcessor._iter_pdf_text)
+
+
+def _cached_extract(file_path: str) -> str:
+    """
+    디스크 캐시를 사용하여 PDF/DOCX 텍스트 추출
+    
+    캐시가 있으면 압축된 텍스트를 읽어 반환하고, 없으면 추출 후 캐시에 저장합니다.
+    
+    Args:
+        file_path (str): 처리할 파일 경로
+        
+    Returns:
+        str: 추출된 텍스트
+    """
+    if file_path.lower().endswith('.pdf'):
+        return "".join(_iter_pdf_text_cached(file_path))
+    
+    return "".join(_iter_cached_text(
+        file_path, lambda path: (DocumentProcessor._extract_text_from_docx(path),)
+    ))
+
+
+def _extract_text(file_path: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    파일 형식에 따라 텍스트 추출
+    
+    프로세스 풀에서 실행할 수 있도록 모듈 수준 함수로 정의합니다.
+    PDF/DOCX는 디스크 캐시를 사용하여 변경되지 않은 파일의 재추출을 생략합니다.
+    
+    Args:
+        file_path (str): 처리할 파일 경로
+        
+    Returns:
+        Tuple[str, Optional[Dict[str, Any]]]: (추출된 텍스트, 추가 메타데이터)
+            - 추가 메타데이터는 EML 파일인 경우에만 존재
+    """
+    file_ext = os.path.splitext(file_path)[1].lower()
+    
+    if file_ext in EXTRACT_CACHE_TYPES:
+        return _cached_extract(file_path), None
+    elif file_ext == '.txt':
+        return DocumentProcessor._extract_text_from_txt(file_path), None
+    elif file_ext == '.md':
+        return DocumentProcessor._extract_text_from_md(file_path), None
+    elif file_ext == '.eml':
+        return DocumentProcessor._extract_text_from_eml(file_path)
+    else:
+        error_msg = f"지원되지 않는 파일 형식입니다: {file_ext}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
@@ -2,27 +2,145 @@
 이메일(.eml) 파일 처리 모듈
 """
 import os
+import mmap
+import codecs
 import email
+import email.message
+import email.policy
 import logging
+from email.feedparser import BytesFeedParser
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
 from email.header import decode_header
-from bs4 import BeautifulSoup
+import charset_normalizer
 from typing import Dict, List, Any, Optional, Tuple
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class AttachmentInfo:
+    """
+    첨부 파일 정보
+    """
+    filename: str
+    content_type: str
+    size: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        딕셔너리로 변환 (JSON 저장용)
+        
+        Returns:
+            Dict[str, Any]: 첨부 파일 정보
+        """
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class EmailResult:
+    """
+    EML 파일 처리 결과
+    """
+    metadata: Dict[str, str]
+    content: str
+    attachments: List[AttachmentInfo]
+    file_path: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        이전 형식(딕셔너리)으로 변환
+        
+        Returns:
+            Dict[str, Any]: 처리된 이메일 데이터
+        """
+        return {
+            "metadata": self.metadata,
+            "content": self.content,
+            "attachments": [attachment.to_dict() for attachment in self.attachments],
+            "file_path": self.file_path
+        }
+
+
+# BeautifulSoup 클래스 (HTML 본문을 처음 변환할 때 가져옴)
+_BeautifulSoup = None
+
+
+def _html_to_text(html: str) -> str:
+    """
+    HTML을 텍스트로 변환 (bs4는 처음 호출될 때 가져옴)
+    
+    Args:
+        html (str): 변환할 HTML
+        
+    Returns:
+        str: 추출된 텍스트
+    """
+    global _BeautifulSoup
+    if _BeautifulSoup is None:
+        from bs4 import BeautifulSoup
+        _BeautifulSoup = BeautifulSoup
+    
+    # C 기반 lxml 파서 사용
+    soup = _BeautifulSoup(html, 'lxml')
+    return soup.get_text(separator=' ', strip=True)
+
+
+# 메모리 매핑된 EML 파일을 파서에 전달할 때 사용하는 블록 크기
+_PARSE_BLOCK_SIZE = 1 << 16
+
+# 인코딩 자동 판별 시 후보로 사용할 한국어 인코딩
+_CANDIDATE_ENCODINGS = ['utf_8', 'euc_kr', 'cp949']
+
+
+def _smart_decode(data: bytes, hinted: Optional[str] = None) -> str:
+    """
+    바이트 데이터를 문자열로 디코딩
+    
+    지정된 인코딩이 유효하면 먼저 사용하고, 실패하거나 지정되지 않은 경우
+    charset_normalizer로 한 번에 인코딩을 판별합니다.
+    
+    Args:
+        data (bytes): 디코딩할 데이터
+        hinted (Optional[str]): 헤더 등에 지정된 인코딩 (기본값: None)
+        
+    Returns:
+        str: 디코딩된 문자열
+    """
+    # ASCII만 포함된 경우 판별 없이 바로 디코딩
+    if data.isascii():
+        return data.decode('ascii')
+    
+    if hinted:
+        try:
+            codecs.lookup(hinted)
+            return data.decode(hinted)
+        except (LookupError, UnicodeDecodeError):
+            pass
+    
+    best = charset_normalizer.from_bytes(data, cp_isolation=_CANDIDATE_ENCODINGS).best()
+    if best is not None:
+        return str(best)
+    
+    return data.decode('cp949', errors='replace')
+
 class EmailProcessor:
     """
     이메일(.eml) 파일을 처리하는 클래스
     """
     
-    def __init__(self):
+    def __init__(self, exact_size: bool = False):
         """
         이메일 처리기 초기화
+        
+        Args:
+            exact_size (bool): 첨부 파일 크기를 디코딩하여 정확히 계산할지 여부 (기본값: False)
+                False인 경우 인코딩된 본문 길이로 크기를 추정
         """
+        self.exact_size = exact_size
         logger.info("이메일 처리기 초기화")
     
-    def process_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+    def process_file(self, file_path: str) -> Optional[EmailResult]:
         """
         EML 파일을 처리하여 텍스트 및 메타데이터 추출
         
@@ -30,7 +148,7 @@ class EmailProcessor:
             file_path (str): EML 파일 경로
             
         Returns:
-            Optional[Dict[str, Any]]: 처리된 이메일 데이터 (실패 시 None)
+            Optional[EmailResult]: 처리된 이메일 데이터 (실패 시 None)
         """
         try:
             logger.info(f"EML 파일 처리 중: {file_path}")
@@ -40,26 +158,22 @@ class EmailProcessor:
                 logger.error(f"파일을 찾을 수 없습니다: {file_path}")
                 return None
                 
-            # 이메일 파일 읽기
-            with open(file_path, 'rb') as f:
-                msg = email.message_from_binary_file(f)
+            # 이메일 파일 읽기 (default 정책: 헤더를 구조화된 객체로 파싱하고 디코딩)
+            msg = self._parse_message(file_path)
             
             # 기본 메타데이터 추출
             metadata = self._extract_metadata(msg)
             
-            # 이메일 본문 추출
-            content = self._extract_content(msg)
-            
-            # 첨부 파일 정보 추출
-            attachments = self._extract_attachments(msg)
+            # 이메일 본문 및 첨부 파일 정보 추출 (MIME 트리 한 번만 순회)
+            content, attachments = self._extract_parts(msg)
             
             # 결과 데이터 구성
-            result = {
-                "metadata": metadata,
-                "content": content,
-                "attachments": attachments,
-                "file_path": file_path
-            }
+            result = EmailResult(
+                metadata=metadata,
+                content=content,
+                attachments=attachments,
+                file_path=file_path
+            )
             
             logger.info(f"EML 파일 처리 완료: {metadata.get('subject', '제목 없음')}")
             return result
@@ -68,6 +182,116 @@ class EmailProcessor:
             logger.error(f"EML 파일 처리 중 오류 발생: {str(e)}")
             return None
     
+    def process_files(self, file_paths: List[str], workers: Optional[int] = None) -> List[Optional[EmailResult]]:
+        """
+        여러 EML 파일을 프로세스 풀에서 병렬로 처리
+        
+        Args:
+            file_paths (List[str]): EML 파일 경로 목록
+            workers (Optional[int]): 사용할 프로세스 수 (기본값: None, CPU 코어 수)
+            
+        Returns:
+            List[Optional[EmailResult]]: 입력 순서대로 정렬된 처리 결과 목록 (실패한 파일은 None)
+        """
+        if not file_paths:
+            return []
+        
+        workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        
+        # 파일이 하나이거나 프로세스를 하나만 쓰는 경우 현재 프로세스에서 처리
+        if workers <= 1:
+            return [self.process_file(file_path) for file_path in file_paths]
+        
+        logger.info(f"EML 파일 {len(file_paths)}개 병렬 처리 시작 (프로세스 수: {workers})")
+        
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.process_file, file_paths, chunksize=chunksize))
+    
+    @staticmethod
+    def _parse_message(file_path: str) -> email.message.EmailMessage:
+        """
+        EML 파일을 메모리 매핑하여 블록 단위로 파서에 전달
+        
+        파일 전체를 Python 버퍼로 읽지 않고 필요한 페이지만 커널이 읽어 들입니다.
+        
+        Args:
+            file_path (str): EML 파일 경로
+            
+        Returns:
+            email.message.EmailMessage: 파싱된 이메일 메시지
+        """
+        parser = BytesFeedParser(policy=email.policy.default)
+        
+        with open(file_path, 'rb') as f:
+            # 빈 파일은 메모리 매핑할 수 없음
+            if os.fstat(f.fileno()).st_size == 0:
+                return parser.close()
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in range(0, len(mm), _PARSE_BLOCK_SIZE):
+                    parser.feed(mm[offset:offset + _PARSE_BLOCK_SIZE])
+        
+        return parser.close()
+    
+    @staticmethod
+    def _redundant_html_parts(alternative) -> List[int]:
+        """
+        multipart/alternative 파트에서 text/plain 대안이 있어 변환이 필요 없는 HTML 파트 찾기
+        
+        Args:
+            alternative: multipart/alternative 메시지 파트
+            
+        Returns:
+            List[int]: 생략할 text/html 하위 파트의 id 목록 (text/plain 대안이 없으면 빈 목록)
+        """
+        children = alternative.get_payload()
+        if not isinstance(children, list):
+            return []
+        
+        # 내용이 있는 text/plain 대안이 있는지 확인 (디코딩이나 strip() 복사 없이 원본 본문으로 판단)
+        has_plain = False
+        for child in children:
+            if child.get_content_type() != 'text/plain' or child.get_content_disposition() == 'attachment':
+                continue
+            raw = child.get_payload()
+            if isinstance(raw, str) and raw and not raw.isspace():
+                has_plain = True
+                break
+        if not has_plain:
+            return []
+        
+        return [id(child) for child in children if child.get_content_type() == 'text/html']
+    
+    def _attachment_size(self, part) -> int:
+        """
+        첨부 파일 크기 계산
+        
+        exact_size가 False이면 첨부 파일을 디코딩하지 않고 인코딩된 본문 길이로 크기를 추정합니다.
+        
+        Args:
+            part: 첨부 파일 메시지 파트
+            
+        Returns:
+            int: 첨부 파일 크기 (바이트)
+        """
+        if self.exact_size:
+            return len(part.get_payload(decode=True) or b'')
+        
+        raw = part.get_payload(decode=False)
+        if not isinstance(raw, str):
+            return 0
+        
+        encoding = part.get('Content-Transfer-Encoding', '').strip().lower()
+        if encoding == 'base64':
+            # 줄바꿈을 제외한 base64 문자 4개당 3바이트 (패딩 제외)
+            encoded_len = len(raw) - raw.count('\n') - raw.count('\r')
+            return max(0, encoded_len * 3 // 4 - raw.count('=', -4))
+        if encoding == 'quoted-printable':
+            return len(raw)
+        
+        return len(raw.encode('utf-8', 'surrogateescape'))
+    
     def _decode_header_value(self, value: str) -> str:
         """
         이메일 헤더 값 디코딩
@@ -80,6 +304,12 @@ class EmailProcessor:
         """
         if value is None:
             return ""
+        
+        # 인코딩된 단어(=?charset?...?=)가 없으면 디코딩할 필요 없음
+        # (default 정책에서는 헤더가 이미 디코딩된 문자열로 반환됨)
+        value = str(value)
+        if '=?' not in value:
+            return value
             
         try:
             decoded_parts = []
@@ -87,28 +317,12 @@ class EmailProcessor:
             
             for part, encoding in parts:
                 if isinstance(part, bytes):
-                    # 인코딩이 지정된 경우
-                    if encoding:
-                        try:
-                            decoded_part = part.decode(encoding)
-                        except:
-                            # 지정된 인코딩으로 디코딩 실패 시 대체 시도
-                            try:
-                                decoded_part = part.decode('utf-8')
-                            except:
-                                try:
-                                    decoded_part = part.decode('euc-kr')
-                                except:
-                                    decoded_part = part.decode('cp949', errors='replace')
+                    if part.isascii():
+                        # ASCII만 포함된 경우 바로 디코딩
+                        decoded_part = part.decode('ascii')
                     else:
-                        # 인코딩이 지정되지 않은 경우
-                        try:
-                            decoded_part = part.decode('utf-8')
-                        except:
-                            try:
-                                decoded_part = part.decode('euc-kr')
-                            except:
-                                decoded_part = part.decode('cp949', errors='replace')
+                        # 지정된 인코딩 우선, 실패 시 인코딩 자동 판별
+                        decoded_part = _smart_decode(part, encoding)
                 else:
                     # 이미 문자열인 경우
                     decoded_part = part
@@ -140,91 +354,57 @@ class EmailProcessor:
         
         return metadata
     
-    def _extract_content(self, msg) -> str:
+    def _extract_parts(self, msg) -> Tuple[str, List[AttachmentInfo]]:
         """
-        이메일 메시지에서 본문 내용 추출
+        이메일 메시지를 한 번만 순회하여 본문 내용과 첨부 파일 정보를 함께 추출
         
         Args:
             msg: 이메일 메시지 객체
             
         Returns:
-            str: 추출된 본문 내용
+            Tuple[str, List[AttachmentInfo]]: (추출된 본문 내용, 첨부 파일 정보 목록)
         """
         content = []
+        attachments = []
+        
+        # 같은 내용의 text/plain 대안이 있어 변환을 생략할 HTML 파트
+        skipped_html = set()
         
         # 메시지 파트 순회
         for part in msg.walk():
-            content_type = part.get_content_type()
-            content_disposition = part.get('Content-Disposition')
+            if part.get_content_type() == 'multipart/alternative':
+                skipped_html.update(self._redundant_html_parts(part))
+                continue
+            
+            if part.get_content_disposition() == 'attachment':
+                # 첨부 파일인 경우 (파일명이 있는 경우만)
+                filename = part.get_filename()
+                if filename:
+                    # 첨부 파일 정보 저장 (default 정책에서 파일명은 이미 디코딩됨)
+                    attachments.append(AttachmentInfo(
+                        filename=filename,
+                        content_type=part.get_content_type(),
+                        size=self._attachment_size(part)
+                    ))
+                continue
             
             # 첨부 파일이 아닌 본문 내용만 추출
-            if content_disposition is None or 'attachment' not in content_disposition:
-                # 텍스트 내용 추출
-                if content_type == 'text/plain':
-                    payload = part.get_payload(decode=True)
-                    if payload:
-                        charset = part.get_content_charset() or 'utf-8'
-                        try:
-                            text = payload.decode(charset)
-                        except:
-                            try:
-                                text = payload.decode('utf-8')
-                            except:
-                                try:
-                                    text = payload.decode('euc-kr')
-                                except:
-                                    text = payload.decode('cp949', errors='replace')
-                        content.append(text)
-                
-                # HTML 내용 추출 및 텍스트로 변환
-                elif content_type == 'text/html':
-                    payload = part.get_payload(decode=True)
-                    if payload:
-                        charset = part.get_content_charset() or 'utf-8'
-                        try:
-                            html = payload.decode(charset)
-                        except:
-                            try:
-                                html = payload.decode('utf-8')
-                            except:
-                                try:
-                                    html = payload.decode('euc-kr')
-                                except:
-                                    html = payload.decode('cp949', errors='replace')
-                        
-                        # HTML을 텍스트로 변환
-                        soup = BeautifulSoup(html, 'html.parser')
-                        text = soup.get_text(separator=' ', strip=True)
-                        content.append(text)
-        
-        return '\n\n'.join(content)
-    
-    def _extract_attachments(self, msg) -> List[Dict[str, Any]]:
-        """
-        이메일 메시지에서 첨부 파일 정보 추출
-        
-        Args:
-            msg: 이메일 메시지 객체
+            content_type = part.get_content_type()
             
-        Returns:
-            List[Dict[str, Any]]: 추출된 첨부 파일 정보 목록
-        """
-        attachments = []
-        
-        for part in msg.walk():
-            content_disposition = part.get('Content-Disposition')
-            filename = part.get_filename()
+            # 텍스트 내용 추출
+            if content_type == 'text/plain':
+                payload = part.get_payload(decode=True)
+                if payload:
+                    text = _smart_decode(payload, part.get_content_charset())
+                    content.append(text)
             
-            # 첨부 파일인 경우
-            if content_disposition and 'attachment' in content_disposition and filename:
-                # 파일명 디코딩
-                filename = self._decode_header_value(filename)
-                
-                # 첨부 파일 정보 저장
-                attachments.append({
-                    "filename": filename,
-                    "content_type": part.get_content_type(),
-                    "size": len(part.get_payload(decode=True))
-                })
-        
-        return attachments
+            # HTML 내용 추출 및 텍스트로 변환 (text/plain 대안이 있으면 생략)
+            elif content_type == 'text/html' and id(part) not in skipped_html:
+                payload = part.get_payload(decode=True)
+                if payload:
+                    html = _smart_decode(payload, part.get_content_charset())
+                    
+                    # HTML을 텍스트로 변환
+                    content.append(_html_to_text(html))
+        
+        return '\n\n'.join(content), attachments
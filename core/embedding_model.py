@@ -2,17 +2,18 @@
 임베딩 모델 모듈 - 문서와 질의를 벡터로 변환
 """
 import os
+import hashlib
+import contextlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Optional, Union, Any
 import numpy as np
-import torch
 from pathlib import Path
 import shutil
 import tempfile
 
-# Sentence Transformers 및 Hugging Face
-from sentence_transformers import SentenceTransformer
-from langchain_community.embeddings import HuggingFaceEmbeddings
+# torch 및 sentence_transformers는 가져오는 비용이 크므로 실제로 사용하는 메서드 안에서 가져옴
 
 # 내부 모듈
 from utils.common import setup_logger, get_project_root
@@ -27,18 +28,47 @@ logger = setup_logger(
 DEFAULT_MODEL_NAME = "sentence-transformers/distiluse-base-multilingual-cased-v2"
 DEFAULT_MODEL_PATH = os.path.join(get_project_root(), "embedding_model")
 
+# 지원하는 모델 정밀도
+# - auto: GPU에서는 fp16, CPU에서는 fp32
+# - int8: CPU 전용 동적 양자화 (Linear 레이어)
+SUPPORTED_PRECISIONS = ('auto', 'fp32', 'fp16', 'bf16', 'int8')
+
+# 프로세스 전체에서 공유하는 로드된 모델 ((모델 이름, 장치, 정밀도, 컴파일 여부) -> 모델)
+_MODEL_REGISTRY: Dict[tuple, Any] = {}
+_MODEL_REGISTRY_LOCK = threading.Lock()
+
+# 공유 모델의 encode 호출 직렬화 (HF fast tokenizer는 스레드 안전하지 않으므로 배치 단위로 한 스레드만 실행)
+_ENCODE_LOCK = threading.Lock()
+
+# 임베딩 캐시 최대 항목 수 (0이면 캐시 사용 안 함)
+EMBEDDING_CACHE_SIZE = 10000
+
+# 장치별 기본 임베딩 배치 크기
+DEFAULT_BATCH_SIZE_GPU = 128
+DEFAULT_BATCH_SIZE_CPU = 32
+
 class EmbeddingModel:
     """
     임베딩 모델 클래스 - 텍스트를 벡터로 변환
     """
     
-    def __init__(self, model_name: str = DEFAULT_MODEL_NAME):
+    def __init__(self,
+                 model_name: str = DEFAULT_MODEL_NAME,
+                 batch_size: Optional[int] = None,
+                 precision: str = 'auto',
+                 compile_model: bool = False,
+                 cache_size: int = EMBEDDING_CACHE_SIZE):
         """
         임베딩 모델 초기화
         
         Args:
             model_name (str, optional): 사용할 모델 이름 또는 경로
                 기본값: "sentence-transformers/distiluse-base-multilingual-cased-v2"
+            batch_size (Optional[int]): 임베딩 배치 크기
+                기본값: None (GPU 사용 시 128, CPU 사용 시 32)
+            precision (str): 모델 정밀도 ('auto', 'fp32', 'fp16', 'bf16', 'int8', 기본값: 'auto')
+            compile_model (bool): torch.compile로 트랜스포머 순전파를 컴파일할지 여부 (기본값: False)
+            cache_size (int): 텍스트 해시 기반 임베딩 캐시 최대 항목 수 (기본값: 10000, 0이면 사용 안 함)
         """
         try:
             # 모델 저장 경로 설정
@@ -47,10 +77,32 @@ class EmbeddingModel:
             
             logger.info(f"임베딩 모델 '{model_name}' 로딩 준비 중...")
             
+            import torch
+            
             # GPU 가용성 확인
             self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
             logger.info(f"사용 장치: {self.device}")
             
+            # 배치 크기 설정
+            if batch_size is None:
+                batch_size = DEFAULT_BATCH_SIZE_GPU if self.device == 'cuda' else DEFAULT_BATCH_SIZE_CPU
+            self.batch_size = batch_size
+            
+            # 모델 정밀도 결정
+            if precision not in SUPPORTED_PRECISIONS:
+                raise ValueError(f"지원되지 않는 정밀도입니다: {precision}")
+            if precision == 'auto':
+                precision = 'fp16' if self.device == 'cuda' else 'fp32'
+            if precision == 'int8' and self.device != 'cpu':
+                raise ValueError("int8 정밀도는 CPU에서만 지원됩니다.")
+            self.precision = precision
+            self.compile_model = compile_model
+            
+            # 임베딩 캐시 (텍스트 해시 -> 임베딩 벡터, LRU 방식)
+            self.cache_size = cache_size
+            self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+            self._cache_lock = threading.Lock()
+            
             # 모델 로딩 시도
             self._load_model(model_name)
             
@@ -66,9 +118,35 @@ class EmbeddingModel:
         모델을 로딩하는 내부 함수
         모델이 로컬에 없다면 다운로드 후 저장
         
+        같은 설정으로 이미 로드된 모델이 있으면 다시 로드하지 않고 공유합니다.
+        
         Args:
             model_name (str): 모델 이름 또는 경로
         """
+        key = (model_name, self.device, self.precision, self.compile_model)
+        
+        # 동시에 처음 로드하는 경우 한 번만 로드되도록 잠금
+        with _MODEL_REGISTRY_LOCK:
+            model = _MODEL_REGISTRY.get(key)
+            if model is not None:
+                logger.info(f"이미 로드된 모델 공유: {model_name} ({self.device}, {self.precision})")
+                self.model = model
+                self.model_name = model_name
+                self.embedding_dim = model.get_sentence_embedding_dimension()
+                return
+            
+            self._load_new_model(model_name)
+            _MODEL_REGISTRY[key] = self.model
+    
+    def _load_new_model(self, model_name: str):
+        """
+        모델을 새로 로딩하고 정밀도/컴파일 설정을 적용하는 내부 함수
+        
+        Args:
+            model_name (str): 모델 이름 또는 경로
+        """
+        from sentence_transformers import SentenceTransformer
+        
         try:
             # 로컬에 모델이 있는지 확인
             if os.path.exists(self.local_model_path):
@@ -93,14 +171,164 @@ class EmbeddingModel:
             # 임베딩 차원 정보 저장
             self.embedding_dim = self.model.get_sentence_embedding_dimension()
             
+            # 모델 정밀도 적용 (가중치/활성값 크기를 줄여 메모리 대역폭 절감)
+            self._apply_precision()
+            
+            # 트랜스포머 순전파 컴파일 (커널 융합)
+            if self.compile_model:
+                self._compile_transformer()
+            
             # 테스트 임베딩 생성
-            test_embedding = self.model.encode("테스트 문장")
+            test_embedding = self._encode(["테스트 문장"])[0]
             logger.info(f"테스트 임베딩 생성 완료: 차원={len(test_embedding)}")
             
         except Exception as e:
             logger.error(f"모델 로딩 오류: {str(e)}")
             raise
 
+    def _apply_precision(self):
+        """
+        설정된 정밀도에 따라 모델 가중치 변환
+        """
+        import torch
+        
+        if self.precision == 'fp16':
+            self.model.half()
+        elif self.precision == 'bf16':
+            self.model.to(torch.bfloat16)
+        elif self.precision == 'int8':
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        
+        logger.info(f"모델 정밀도: {self.precision}")
+    
+    def _compile_transformer(self):
+        """
+        torch.compile로 트랜스포머 모듈의 순전파 컴파일
+        
+        시퀀스 길이가 배치마다 다르므로 동적 형태로 컴파일하며,
+        컴파일을 지원하지 않는 환경에서는 기존 eager 모드를 그대로 사용합니다.
+        """
+        import torch
+        
+        if not hasattr(torch, 'compile'):
+            logger.warning("현재 PyTorch 버전은 torch.compile을 지원하지 않습니다. eager 모드로 실행합니다.")
+            return
+        
+        try:
+            # SentenceTransformer의 첫 번째 모듈(Transformer)의 내부 모델만 교체
+            transformer = self.model[0]
+            transformer.auto_model = torch.compile(transformer.auto_model, dynamic=True)
+            logger.info("트랜스포머 순전파 컴파일 설정 완료")
+        except Exception as e:
+            logger.warning(f"torch.compile 적용 실패, eager 모드로 실행합니다: {str(e)}")
+    
+    def _encode(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        설정된 정밀도로 텍스트 목록을 임베딩하고 float32 배열로 반환
+        
+        결과 배열을 미리 할당하고 배치별 결과를 바로 기록하므로, 배치 결과를 모았다가
+        합치는 방식보다 최대 메모리 사용량이 절반 수준입니다.
+        
+        Args:
+            texts (List[str]): 임베딩할 텍스트 목록
+            batch_size (Optional[int]): 한 번에 임베딩할 텍스트 수 (기본값: None, 모델 설정값 사용)
+            
+        Returns:
+            np.ndarray: float32 임베딩 벡터 배열 (정규화는 벡터 DB에서 인덱스에 맞게 수행)
+        """
+        import torch
+        
+        batch_size = batch_size or self.batch_size
+        out = np.empty((len(texts), self.embedding_dim), dtype=np.float32)
+        
+        # 패딩을 줄이기 위해 길이가 긴 텍스트부터 배치 구성 (결과는 원래 위치에 기록)
+        order = np.argsort([-len(text) for text in texts], kind='stable')
+        
+        with torch.inference_mode(), self._autocast():
+            for i in range(0, len(texts), batch_size):
+                batch_idx = order[i:i + batch_size]
+                with _ENCODE_LOCK:
+                    out[batch_idx] = self.model.encode(
+                        [texts[k] for k in batch_idx],
+                        batch_size=len(batch_idx),
+                        convert_to_numpy=True,
+                        show_progress_bar=False
+                    )
+        
+        return out
+    
+    def _autocast(self):
+        """
+        bf16 CPU 추론 시 사용할 autocast 컨텍스트 반환
+        
+        Returns:
+            컨텍스트 관리자 (bf16 CPU가 아니면 아무 동작도 하지 않음)
+        """
+        if self.precision == 'bf16' and self.device == 'cpu':
+            import torch
+            return torch.autocast('cpu', dtype=torch.bfloat16)
+        return contextlib.nullcontext()
+    
+    def _embed_cached(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """
+        캐시를 사용하여 텍스트 목록 임베딩
+        
+        캐시에 있는 텍스트는 저장된 벡터를 사용하고, 나머지 텍스트(중복 제거)만 모델로 임베딩합니다.
+        
+        Args:
+            texts (List[str]): 임베딩할 텍스트 목록
+            batch_size (int): 한 번에 임베딩할 텍스트 수
+            
+        Returns:
+            np.ndarray: 입력 순서대로 정렬된 임베딩 벡터 배열
+        """
+        if self.cache_size <= 0:
+            return self._encode(texts, batch_size)
+        
+        keys = [hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+                for text in texts]
+        result = np.empty((len(texts), self.embedding_dim), dtype=np.float32)
+        
+        # 캐시 적중 항목 채우기, 누락 항목은 키별로 위치 목록 수집
+        missing: Dict[bytes, List[int]] = {}
+        with self._cache_lock:
+            for i, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    result[i] = cached
+                else:
+                    missing.setdefault(key, []).append(i)
+        
+        if not missing:
+            logger.debug(f"임베딩 캐시 적중: {len(texts)}개 전체")
+            return result
+        
+        # 누락된 고유 텍스트만 임베딩
+        missing_keys = list(missing)
+        encoded = self._encode([texts[missing[key][0]] for key in missing_keys], batch_size)
+        
+        with self._cache_lock:
+            for key, vector in zip(missing_keys, encoded):
+                result[missing[key]] = vector
+                self._cache[key] = vector.copy()
+            
+            # 최대 크기를 넘으면 가장 오래된 항목부터 제거
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        
+        logger.debug(f"임베딩 캐시 적중: {len(texts) - sum(map(len, missing.values()))}개, 신규 임베딩: {len(missing_keys)}개")
+        return result
+    
+    def clear_cache(self):
+        """
+        임베딩 캐시 비우기
+        """
+        with self._cache_lock:
+            self._cache.clear()
+    
     def get_embedding_dim(self) -> int:
         """
         임베딩 차원 반환
@@ -110,12 +338,13 @@ class EmbeddingModel:
         """
         return self.embedding_dim
 
-    def embed_texts(self, texts: Union[str, List[str]]) -> np.ndarray:
+    def embed_texts(self, texts: Union[str, List[str]], batch_size: Optional[int] = None) -> np.ndarray:
         """
         텍스트 또는 텍스트 목록을 임베딩 벡터로 변환
         
         Args:
             texts (Union[str, List[str]]): 임베딩할 텍스트 또는 텍스트 목록
+            batch_size (Optional[int]): 한 번에 임베딩할 텍스트 수 (기본값: None, 모델 설정값 사용)
             
         Returns:
             np.ndarray: 임베딩 벡터 배열
@@ -131,23 +360,11 @@ class EmbeddingModel:
         try:
             logger.debug(f"{len(texts)}개 텍스트 임베딩 시작")
             
-            # 배치 크기 설정 (메모리 고려)
-            batch_size = 32
-            all_embeddings = []
-            
-            # 배치 처리
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i+batch_size]
-                embeddings = self.model.encode(batch, convert_to_numpy=True)
-                all_embeddings.append(embeddings)
-                
-                logger.debug(f"배치 {i//batch_size + 1} 임베딩 완료 ({len(batch)}개 텍스트)")
+            # 캐시에 없는 텍스트만 임베딩 (배치 처리는 모델에 맡김)
+            embeddings = self._embed_cached(texts, batch_size or self.batch_size)
             
-            # 모든 배치 결합
-            combined_embeddings = np.vstack(all_embeddings)
-            
-            logger.debug(f"임베딩 완료: {combined_embeddings.shape}")
-            return combined_embeddings
+            logger.debug(f"임베딩 완료: {embeddings.shape}")
+            return embeddings
             
         except Exception as e:
             error_msg = f"텍스트 임베딩 중 오류 발생: {str(e)}"
@@ -178,6 +395,27 @@ class EmbeddingModel:
         """
         return self.embed_texts(texts)
     
+    def tokenize_lengths(self, texts: List[str]) -> List[int]:
+        """
+        모델 토크나이저 기준 텍스트별 토큰 수 계산 (특수 토큰 제외)
+        
+        Args:
+            texts (List[str]): 토큰 수를 계산할 텍스트 목록
+            
+        Returns:
+            List[int]: 입력 순서대로 정렬된 토큰 수 목록
+        """
+        if not texts:
+            return []
+        
+        encoded = self.model.tokenizer(
+            list(texts),
+            add_special_tokens=False,
+            return_attention_mask=False,
+            return_token_type_ids=False
+        )
+        return [len(ids) for ids in encoded["input_ids"]]
+    
     def embed_query(self, query: str) -> np.ndarray:
         """
         단일 쿼리 텍스트를 임베딩 벡터로 변환
@@ -195,8 +433,8 @@ class EmbeddingModel:
         try:
             logger.debug(f"쿼리 임베딩 시작: '{query[:50]}...'")
             
-            # 쿼리 임베딩
-            embedding = self.model.encode([query], convert_to_numpy=True)
+            # 쿼리 임베딩 (같은 쿼리는 캐시 사용)
+            embedding = self._embed_cached([query], self.batch_size)
             
             logger.debug(f"쿼리 임베딩 완료: {embedding.shape}")
             return embedding
@@ -216,5 +454,6 @@ class EmbeddingModel:
         return {
             "model_name": self.model_name,
             "embedding_dimension": self.embedding_dim,
-            "device": self.device
+            "device": self.device,
+            "precision": self.precision
         }
@@ -55,7 +55,8 @@ class LLMConnector:
             if not service:
                 return f"오류: {llm_service} 서비스를 사용할 수 없습니다."
                 
-            response = service.generate_response(prompt)
+            # 이벤트 루프를 막지 않도록 비동기 호출
+            response = await service.agenerate_response(prompt)
             return response
             
         except Exception as e:
@@ -80,7 +81,7 @@ class LLMConnector:
                 yield f"오류: {llm_service} 서비스를 사용할 수 없습니다."
                 return
                 
-            for chunk in service.generate_stream_response(prompt):
+            async for chunk in service.agenerate_stream_response(prompt):
                 yield chunk
                 
         except Exception as e:
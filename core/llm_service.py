@@ -4,15 +4,39 @@ LLM 서비스 연결 모듈 - 외부 대규모 언어 모델 서비스와 통신
 import os
 import logging
 import json
+import re
 import time
+import asyncio
+import hashlib
+import threading
+import weakref
 import requests
-from typing import List, Dict, Optional, Union, Any, Callable
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from typing import List, Dict, Iterator, AsyncGenerator, Optional, Union, Any, Callable
 from pathlib import Path
-import openai
 from dotenv import load_dotenv
 
+# 선택적 고속 JSON 처리 (orjson이 설치되지 않은 경우 표준 json 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    def _json_loads(data: Union[bytes, str, memoryview]) -> Any:
+        return json.loads(data.tobytes() if isinstance(data, memoryview) else data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 # 내부 모듈
-from utils.common import setup_logger, get_project_root
+from utils.common import setup_logger, get_project_root, discard_session
 
 # 로거 설정
 logger = setup_logger(
@@ -23,6 +47,209 @@ logger = setup_logger(
 # 환경 변수 로드
 load_dotenv(os.path.join(get_project_root(), ".env"))
 
+# 비동기 요청 시 LM Studio 서버로 동시에 열 수 있는 최대 연결 수
+ASYNC_MAX_CONNECTIONS = 100
+
+# get_llm_service가 설정별로 공유하는 LLMService 인스턴스 최대 수
+LLM_SERVICE_CACHE_SIZE = 8
+
+# 응답 캐시 설정 (최대 항목 수, 유효 시간(초))
+RESPONSE_CACHE_SIZE = 1000
+RESPONSE_CACHE_TTL = 24 * 60 * 60
+
+# 이 값보다 temperature가 높으면 응답이 매번 달라지므로 캐시하지 않음
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.5
+
+# 여러 질문을 한 번의 호출로 묶을 때 한 묶음에 넣는 최대 질문 수 (많을수록 답변 분리 실패가 잦아짐)
+BATCH_MAX_PROMPTS = 8
+
+# 묶음 요청에서 각 질문과 답변을 구분하는 표식
+BATCH_PROMPT_MARKER = "---PROMPT {index}---"
+BATCH_ANSWER_MARKER = "###ANSWER {index}###"
+BATCH_ANSWER_PATTERN = re.compile(r"^[ \t]*###ANSWER (\d+)###[ \t]*$", re.MULTILINE)
+
+# 일시적인 네트워크/서버 오류 재시도 설정 (최대 재시도 횟수, 지수 백오프 계수, 재시도할 HTTP 상태 코드)
+# - 채팅 생성 POST 요청은 멱등이 아니므로 서버가 요청을 처리하지 않았음이 확실한 상태 코드만 재시도
+#   (500/502/504는 서버나 게이트웨이가 이미 생성을 마친 뒤 돌려줄 수 있어 재시도하면 중복 생성/과금됨)
+REQUEST_MAX_RETRIES = 3
+REQUEST_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (429, 503)
+
+# OpenAI API 요청 시간 제한 (전체, 연결) (초)
+OPENAI_TIMEOUT = 60.0
+OPENAI_CONNECT_TIMEOUT = 5.0
+
+# SSE(Server-Sent Events) 데이터 줄 프리픽스와 스트림 종료 표식
+_SSE_DATA_PREFIX = b"data: "
+_SSE_DONE = b"[DONE]"
+_SSE_DONE_MAX_LENGTH = len(_SSE_DONE) + 2
+
+# 오류 메시지에 포함할 응답 본문 최대 바이트 수
+ERROR_BODY_LIMIT = 512
+
+# JSON 요청 공통 헤더
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# 스트리밍 응답을 읽을 때 한 번에 가져오는 최대 바이트 수
+STREAM_READ_SIZE = 8192
+
+# 시스템 프롬프트가 주어지지 않았을 때 사용하는 기본 시스템 프롬프트
+DEFAULT_SYSTEM_PROMPT = """당신은 지식이 풍부하고 도움이 되는 AI 어시스턴트입니다.
+주어진 문서 정보를 바탕으로 정확하게 답변해 주세요.
+문서에서 직접적인 답을 찾을 수 없는 경우, "제공된 문서에서 해당 정보를 찾을 수 없습니다"라고 답변하세요.
+답변은 깔끔하고 간결하게 한국어로 제공해 주세요."""
+
+
+# 설정별 공유 LLMService 인스턴스 (get_llm_service에서 사용, 최근 사용 순)
+_llm_services: "OrderedDict[tuple, LLMService]" = OrderedDict()
+_llm_services_lock = threading.Lock()
+
+
+def _iter_stream_lines(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """
+    바이트 청크 스트림을 줄 단위로 분리
+
+    Args:
+        chunks (Iterator[bytes]): 네트워크에서 받은 바이트 청크
+
+    Yields:
+        bytes: 줄바꿈 문자를 제외한 한 줄
+    """
+    buf = bytearray()
+    for chunk in chunks:
+        buf.extend(chunk)
+        start = 0
+        while (end := buf.find(b"\n", start)) != -1:
+            yield bytes(buf[start:end]).rstrip(b"\r")
+            start = end + 1
+        # 처리한 줄은 한 번에 잘라내어 남은 조각만 보관
+        del buf[:start]
+    if buf:
+        yield bytes(buf).rstrip(b"\r")
+
+
+def _error_body(raw: bytes) -> str:
+    """
+    오류 응답 본문을 로그/오류 메시지용으로 앞부분만 디코딩
+
+    Args:
+        raw (bytes): 응답 본문 (전체 또는 앞부분)
+
+    Returns:
+        str: 최대 ERROR_BODY_LIMIT 바이트까지 디코딩한 본문
+    """
+    body = raw[:ERROR_BODY_LIMIT].decode("utf-8", "replace")
+    return body + "..." if len(raw) > ERROR_BODY_LIMIT else body
+
+
+def _split_batch_answers(text: str, count: int) -> Optional[List[str]]:
+    """
+    묶음 요청의 응답 텍스트를 질문별 답변으로 분리
+
+    Args:
+        text (str): 모델이 생성한 전체 응답 텍스트
+        count (int): 묶음에 포함된 질문 수
+
+    Returns:
+        Optional[List[str]]: 질문 순서대로 정렬된 답변 목록 (표식이 어긋나면 None)
+    """
+    markers = list(BATCH_ANSWER_PATTERN.finditer(text))
+    if [int(m.group(1)) for m in markers] != list(range(1, count + 1)):
+        return None
+
+    answers = []
+    for i, marker in enumerate(markers):
+        end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+        answer = text[marker.end():end].strip()
+        if not answer:
+            return None
+        answers.append(answer)
+    return answers
+
+
+class ResponseCache:
+    """
+    LLM 응답 결과를 보관하는 LRU 캐시 (항목별 유효 시간 적용)
+    """
+    
+    def __init__(self, max_size: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL):
+        """
+        응답 캐시 초기화
+        
+        Args:
+            max_size (int): 최대 보관 항목 수 (기본값: 1000)
+            ttl (float): 항목 유효 시간(초) (기본값: 24시간)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답 결과 조회
+        
+        Args:
+            key (str): 캐시 키
+            
+        Returns:
+            Optional[Dict[str, Any]]: 응답 결과 사본 (없거나 만료된 경우 None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return dict(result)
+                del self._entries[key]
+            self._misses += 1
+            return None
+    
+    def set(self, key: str, result: Dict[str, Any]):
+        """
+        응답 결과 저장 (소요 시간 정보는 제외)
+        
+        Args:
+            key (str): 캐시 키
+            result (Dict[str, Any]): 응답 결과
+        """
+        entry = {k: v for k, v in result.items() if k != "elapsed_time"}
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """
+        캐시 비우기
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 적중률 통계 반환
+        
+        Returns:
+            Dict[str, Any]: 항목 수, 적중/실패 횟수, 적중률
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0
+            }
+
+
 class LLMService:
     """
     대규모 언어 모델(LLM) 서비스 연결 클래스
@@ -55,6 +282,56 @@ class LLMService:
         # LM Studio 설정
         self.lmstudio_url = lmstudio_url
         
+        # 동기 요청용 HTTP 세션 (keep-alive 연결 재사용)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=REQUEST_MAX_RETRIES,
+                connect=REQUEST_MAX_RETRIES,
+                # 읽기 타임아웃은 서버가 이미 POST 요청을 처리 중일 수 있으므로 재시도하지 않음 (중복 생성 방지)
+                read=0,
+                backoff_factor=REQUEST_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=["POST", "GET"],
+                # 재시도 후에도 실패하면 예외 대신 마지막 응답을 반환 (상태 코드별 오류 처리 유지)
+                raise_on_status=False
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # 인스턴스가 정리되거나 인터프리터가 종료될 때 세션 연결 종료
+        self._session_finalizer = weakref.finalize(self, self._session.close)
+        
+        # 비동기 클라이언트 (이벤트 루프 안에서 처음 사용할 때 생성, 연결 재사용)
+        # 클라이언트는 만든 이벤트 루프에 묶이므로 루프를 함께 기록하고 루프가 바뀌면 다시 생성
+        self._aclient: Optional[aiohttp.ClientSession] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_openai_client = None
+        self._async_openai_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # OpenAI 모듈 및 동기 클라이언트 (OpenAI 프로바이더를 사용할 때만 가져와 한 번만 생성)
+        self._openai = None
+        self._openai_client = None
+        
+        # 동일한 요청에 대한 응답 캐시
+        self.cache = ResponseCache()
+        
+        # LM Studio 채팅 API 주소 및 요청 본문의 고정 필드 (요청마다 messages만 추가)
+        self._lmstudio_chat_url = f"{self.lmstudio_url}/v1/chat/completions"
+        self._lmstudio_request_template = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": self._resolved_max_tokens(),
+            "stream": False
+        }
+        self._lmstudio_request_template_stream = {**self._lmstudio_request_template, "stream": True}
+        
+        # 재사용할 메시지 dict ((시스템 프롬프트, 메시지), (컨텍스트 튜플, 메시지))
+        self._system_message = (None, {"role": "system", "content": DEFAULT_SYSTEM_PROMPT})
+        self._context_message = (None, None)
+        
         # API 키 설정
         if api_key is None:
             if self.provider == "openai":
@@ -65,7 +342,7 @@ class LLMService:
                 api_key_var = f"{self.provider.upper()}_API_KEY"
                 api_key = os.getenv(api_key_var)
                 if not api_key:
-                    logger.debug(f"{api_key_var} 환경 변수가 설정되지 않았습니다.")
+                    logger.debug("%s 환경 변수가 설정되지 않았습니다.", api_key_var)
         
         self.api_key = api_key
         
@@ -79,40 +356,80 @@ class LLMService:
         
         logger.info(f"LLM 서비스 초기화 완료 (프로바이더: {provider}, 모델: {model})")
     
+    def _resolved_max_tokens(self) -> int:
+        """
+        LM Studio 요청에 사용할 max_tokens 값 반환
+        
+        Returns:
+            int: 최대 토큰 수 (10000을 넘으면 무제한을 뜻하는 -1)
+        """
+        return -1 if self.max_tokens > 10000 else self.max_tokens
+    
+    def _import_openai(self):
+        """
+        openai 모듈 반환 (LM Studio만 사용하는 경우 불러오지 않도록 처음 필요할 때 가져옴)
+        
+        Returns:
+            module: openai 모듈
+        """
+        if self._openai is None:
+            import openai
+            self._openai = openai
+        return self._openai
+    
+    def _new_openai_client(self, client_class: str):
+        """
+        재시도 및 시간 제한이 설정된 OpenAI 클라이언트 생성
+        
+        Args:
+            client_class (str): 생성할 클라이언트 클래스 이름 ("OpenAI" 또는 "AsyncOpenAI")
+            
+        Returns:
+            openai.OpenAI | openai.AsyncOpenAI: OpenAI 클라이언트
+        """
+        openai = self._import_openai()
+        return getattr(openai, client_class)(
+            api_key=self.api_key,
+            max_retries=REQUEST_MAX_RETRIES,
+            timeout=openai.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT)
+        )
+    
     def _init_openai(self):
         """
         OpenAI API 초기화
+        
+        API 키 유효성은 별도 요청으로 확인하지 않고 첫 응답 생성 요청에서 확인됩니다.
         """
         if self.api_key:
-            openai.api_key = self.api_key
-            try:
-                # API 키 유효성 확인 (모델 목록 가져오기)
-                logger.debug("OpenAI API 연결 확인 중...")
-                client = openai.OpenAI(api_key=self.api_key)
-                models = client.models.list()
-                logger.debug("OpenAI API 연결 성공")
-            except Exception as e:
-                logger.error(f"OpenAI API 초기화 오류: {str(e)}")
+            self._openai_client = self._new_openai_client("OpenAI")
+            logger.debug("OpenAI API 클라이언트 생성 완료 (API 키는 첫 요청에서 확인)")
         else:
             logger.warning("OpenAI API 키가 설정되지 않았습니다.")
     
     def _init_lmstudio(self):
         """
-        LM Studio API 초기화 및 연결 확인
+        LM Studio API 초기화
+        
+        서버 연결 확인은 생성자에서 하지 않고 첫 요청의 응답으로 대신합니다 (_verify_once 참고).
         """
-        try:
-            # 간단한 ping 요청으로 LM Studio 서버 연결 확인
-            logger.debug(f"LM Studio API 서버 연결 확인 중... (URL: {self.lmstudio_url})")
-            # LM Studio의 /v1/models 엔드포인트로 연결 확인
-            response = requests.get(f"{self.lmstudio_url}/v1/models", timeout=5)
-            
-            if response.status_code == 200:
-                logger.debug("LM Studio API 서버 연결 성공")
-            else:
-                logger.warning(f"LM Studio API 서버 응답 코드: {response.status_code}")
-        except Exception as e:
-            logger.error(f"LM Studio API 서버 연결 확인 중 오류: {str(e)}")
-            logger.warning("LM Studio 서버가 실행 중인지 확인하세요 (기본 URL: http://localhost:4982)")
+        self._lmstudio_verified = False
+        logger.debug("LM Studio API 서버 연결은 첫 요청에서 확인합니다 (URL: %s)", self.lmstudio_url)
+    
+    def _verify_once(self, status_code: int):
+        """
+        첫 LM Studio 응답의 상태 코드로 서버 연결 상태를 한 번만 기록
+        
+        Args:
+            status_code (int): HTTP 응답 상태 코드
+        """
+        if self._lmstudio_verified:
+            return
+        
+        self._lmstudio_verified = True
+        if status_code == 200:
+            logger.debug("LM Studio API 서버 연결 성공")
+        else:
+            logger.warning(f"LM Studio API 서버 응답 코드: {status_code}")
     
     def generate_response(self, 
                          prompt: str, 
@@ -132,15 +449,124 @@ class LLMService:
         if not prompt.strip():
             return {"error": "빈 프롬프트가 제공되었습니다."}
         
+        # 캐시 확인
+        cache_key = self._cache_key(prompt, context, system_prompt)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug("응답 캐시 적중")
+                cached["elapsed_time"] = 0.0
+                return cached
+        
         # 프로바이더별 처리
         if self.provider == "openai":
-            return self._generate_openai_response(prompt, context, system_prompt)
+            result = self._generate_openai_response(prompt, context, system_prompt)
         elif self.provider == "lmstudio":
-            return self._generate_lmstudio_response(prompt, context, system_prompt)
+            result = self._generate_lmstudio_response(prompt, context, system_prompt)
         else:
             error_msg = f"지원되지 않는 프로바이더입니다: {self.provider}"
             logger.error(error_msg)
             return {"error": error_msg}
+        
+        if cache_key is not None and result.get("success"):
+            self.cache.set(cache_key, result)
+        return result
+    
+    def generate_batch(self,
+                       prompts: List[str],
+                       context: Optional[List[str]] = None,
+                       system_prompt: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        여러 질문을 한 번의 LLM 호출로 묶어 응답 생성
+        
+        질문은 최대 BATCH_MAX_PROMPTS개씩 묶어 전송하며, 모델이 답변 표식을 지키지 않아
+        답변을 분리할 수 없는 묶음은 질문별 개별 호출로 다시 처리합니다.
+        
+        Args:
+            prompts (List[str]): 사용자 질의 텍스트 목록
+            context (Optional[List[str]]): 모든 질문에 공통으로 사용할 컨텍스트 텍스트 목록
+            system_prompt (Optional[str]): 시스템 프롬프트
+            
+        Returns:
+            List[Dict[str, Any]]: 질문 순서대로 정렬된 응답 결과 목록
+        """
+        results = []
+        for start in range(0, len(prompts), BATCH_MAX_PROMPTS):
+            group = prompts[start:start + BATCH_MAX_PROMPTS]
+            
+            # 빈 질문이 섞여 있거나 질문이 하나뿐이면 묶지 않음
+            if len(group) == 1 or any(not prompt.strip() for prompt in group):
+                results.extend(self.generate_response(prompt, context, system_prompt) for prompt in group)
+                continue
+            
+            result = self.generate_response(self._build_batch_prompt(group), context, system_prompt)
+            answers = _split_batch_answers(result["text"], len(group)) if result.get("success") else None
+            
+            if answers is None:
+                logger.warning(f"묶음 응답을 질문별로 분리하지 못해 개별 호출로 처리합니다 (질문 수: {len(group)})")
+                results.extend(self.generate_response(prompt, context, system_prompt) for prompt in group)
+                continue
+            
+            for answer in answers:
+                results.append({
+                    "text": answer,
+                    "model": self.model,
+                    "elapsed_time": result["elapsed_time"],
+                    "success": True,
+                    "batched": True
+                })
+        
+        return results
+    
+    @staticmethod
+    def _build_batch_prompt(prompts: List[str]) -> str:
+        """
+        여러 질문을 답변 표식 지시와 함께 하나의 프롬프트로 결합
+        
+        Args:
+            prompts (List[str]): 사용자 질의 텍스트 목록
+            
+        Returns:
+            str: 결합된 프롬프트
+        """
+        questions = "\n\n".join(
+            f"{BATCH_PROMPT_MARKER.format(index=i + 1)}\n{prompt}" for i, prompt in enumerate(prompts)
+        )
+        return (
+            f"다음 {len(prompts)}개의 질문에 순서대로 각각 따로 답변해 주세요.\n"
+            f"각 답변은 반드시 '{BATCH_ANSWER_MARKER.format(index='번호')}' 형식의 줄로 시작하고, "
+            f"번호는 질문 번호와 같아야 합니다 (예: {BATCH_ANSWER_MARKER.format(index=1)}).\n\n"
+            f"{questions}"
+        )
+    
+    def _cache_key(self,
+                   prompt: str,
+                   context: Optional[List[str]] = None,
+                   system_prompt: Optional[str] = None) -> Optional[str]:
+        """
+        요청 내용으로 응답 캐시 키 생성
+        
+        Args:
+            prompt (str): 사용자 질의 텍스트
+            context (Optional[List[str]]): 추가 컨텍스트 텍스트 목록
+            system_prompt (Optional[str]): 시스템 프롬프트
+            
+        Returns:
+            Optional[str]: 캐시 키 (temperature가 높아 캐시하지 않는 경우 None)
+        """
+        if self.temperature > RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+        
+        payload = json.dumps({
+            "provider": self.provider,
+            "model": self.model,
+            "temp": self.temperature,
+            "max_tokens": self.max_tokens,
+            "system": system_prompt,
+            "context": context,
+            "prompt": prompt
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
     
     def _generate_openai_response(self, 
                                  prompt: str, 
@@ -161,36 +587,13 @@ class LLMService:
             return {"error": "OpenAI API 키가 설정되지 않았습니다."}
         
         try:
-            messages = []
-            
-            # 시스템 프롬프트 추가
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            else:
-                # 기본 시스템 프롬프트
-                default_system_prompt = """
-                당신은 지식이 풍부하고 도움이 되는 AI 어시스턴트입니다. 
-                주어진 문서 정보를 바탕으로 정확하게 답변해 주세요.
-                문서에서 직접적인 답을 찾을 수 없는 경우, "제공된 문서에서 해당 정보를 찾을 수 없습니다"라고 답변하세요.
-                답변은 깔끔하고 간결하게 한국어로 제공해 주세요.
-                """
-                messages.append({"role": "system", "content": default_system_prompt})
-            
-            # 컨텍스트 있으면 추가
-            if context and len(context) > 0:
-                context_text = "\n\n".join([f"문서 내용 #{i+1}:\n{doc}" for i, doc in enumerate(context)])
-                context_message = f"다음은 질문에 답하는 데 도움이 될 관련 문서 내용입니다:\n\n{context_text}"
-                messages.append({"role": "user", "content": context_message})
-            
-            # 사용자 프롬프트 추가
-            messages.append({"role": "user", "content": prompt})
+            messages = self._build_messages(prompt, context, system_prompt)
             
             start_time = time.time()
-            logger.debug(f"OpenAI API 요청 시작 - 프롬프트: '{prompt[:50]}...'")
+            logger.debug("OpenAI API 요청 시작 - 프롬프트: '%s...'", prompt[:50])
             
             # API 호출
-            client = openai.OpenAI(api_key=self.api_key)
-            response = client.chat.completions.create(
+            response = self._get_openai_client().chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
@@ -247,56 +650,23 @@ class LLMService:
             Dict[str, Any]: 응답 결과
         """
         try:
-            # API 요청을 위한 메시지 구성
-            messages = []
-            
-            # 시스템 프롬프트 추가
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            else:
-                # 기본 시스템 프롬프트
-                default_system_prompt = """
-                당신은 지식이 풍부하고 도움이 되는 AI 어시스턴트입니다. 
-                주어진 문서 정보를 바탕으로 정확하게 답변해 주세요.
-                문서에서 직접적인 답을 찾을 수 없는 경우, "제공된 문서에서 해당 정보를 찾을 수 없습니다"라고 답변하세요.
-                답변은 깔끔하고 간결하게 한국어로 제공해 주세요.
-                """
-                messages.append({"role": "system", "content": default_system_prompt})
-            
-            # 컨텍스트 있으면 추가
-            if context and len(context) > 0:
-                context_text = "\n\n".join([f"문서 내용 #{i+1}:\n{doc}" for i, doc in enumerate(context)])
-                context_message = f"다음은 질문에 답하는 데 도움이 될 관련 문서 내용입니다:\n\n{context_text}"
-                messages.append({"role": "user", "content": context_message})
-            
-            # 사용자 프롬프트 추가
-            messages.append({"role": "user", "content": prompt})
+            messages = self._build_messages(prompt, context, system_prompt)
             
             start_time = time.time()
-            logger.debug(f"LM Studio API 요청 시작 - 프롬프트: '{prompt[:50]}...'")
+            logger.debug("LM Studio API 요청 시작 - 프롬프트: '%s...'", prompt[:50])
             
             # LM Studio API 호출
-            url = f"{self.lmstudio_url}/v1/chat/completions"
-            headers = {"Content-Type": "application/json"}
-            
-            # max_tokens가 -1이면 무제한 토큰 생성
-            max_tokens = -1 if self.max_tokens > 10000 else self.max_tokens
-            
-            data = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": self.temperature,
-                "max_tokens": max_tokens,
-                "stream": False
-            }
+            data = {**self._lmstudio_request_template, "messages": messages}
+            
+            response = self._session.post(self._lmstudio_chat_url, headers=JSON_HEADERS, data=_json_dumps(data), timeout=60)
             
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            self._verify_once(response.status_code)
             
             elapsed_time = time.time() - start_time
             
             # 응답 처리
             if response.status_code == 200:
-                response_data = response.json()
+                response_data = _json_loads(response.content)
                 
                 if "choices" in response_data and len(response_data["choices"]) > 0:
                     answer = response_data["choices"][0]["message"]["content"]
@@ -324,7 +694,7 @@ class LLMService:
                     logger.error(error_msg)
                     return {"error": error_msg, "success": False}
             else:
-                error_msg = f"LM Studio API 오류 (코드: {response.status_code}): {response.text}"
+                error_msg = f"LM Studio API 오류 (코드: {response.status_code}): {_error_body(response.content)}"
                 logger.error(error_msg)
                 return {"error": error_msg, "success": False}
                 
@@ -385,35 +755,12 @@ class LLMService:
             raise ValueError("OpenAI API 키가 설정되지 않았습니다.")
         
         try:
-            messages = []
-            
-            # 시스템 프롬프트 추가
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            else:
-                # 기본 시스템 프롬프트
-                default_system_prompt = """
-                당신은 지식이 풍부하고 도움이 되는 AI 어시스턴트입니다. 
-                주어진 문서 정보를 바탕으로 정확하게 답변해 주세요.
-                문서에서 직접적인 답을 찾을 수 없는 경우, "제공된 문서에서 해당 정보를 찾을 수 없습니다"라고 답변하세요.
-                답변은 깔끔하고 간결하게 한국어로 제공해 주세요.
-                """
-                messages.append({"role": "system", "content": default_system_prompt})
-            
-            # 컨텍스트 있으면 추가
-            if context and len(context) > 0:
-                context_text = "\n\n".join([f"문서 내용 #{i+1}:\n{doc}" for i, doc in enumerate(context)])
-                context_message = f"다음은 질문에 답하는 데 도움이 될 관련 문서 내용입니다:\n\n{context_text}"
-                messages.append({"role": "user", "content": context_message})
+            messages = self._build_messages(prompt, context, system_prompt)
             
-            # 사용자 프롬프트 추가
-            messages.append({"role": "user", "content": prompt})
-            
-            logger.debug(f"OpenAI API 스트림 요청 시작 - 프롬프트: '{prompt[:50]}...'")
+            logger.debug("OpenAI API 스트림 요청 시작 - 프롬프트: '%s...'", prompt[:50])
             
             # API 호출 (스트림 모드)
-            client = openai.OpenAI(api_key=self.api_key)
-            return client.chat.completions.create(
+            return self._get_openai_client().chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
@@ -442,71 +789,41 @@ class LLMService:
             Generator: 응답 텍스트 조각을 생성하는 제너레이터
         """
         try:
-            # API 요청을 위한 메시지 구성
-            messages = []
-            
-            # 시스템 프롬프트 추가
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            else:
-                # 기본 시스템 프롬프트
-                default_system_prompt = """
-                당신은 지식이 풍부하고 도움이 되는 AI 어시스턴트입니다. 
-                주어진 문서 정보를 바탕으로 정확하게 답변해 주세요.
-                문서에서 직접적인 답을 찾을 수 없는 경우, "제공된 문서에서 해당 정보를 찾을 수 없습니다"라고 답변하세요.
-                답변은 깔끔하고 간결하게 한국어로 제공해 주세요.
-                """
-                messages.append({"role": "system", "content": default_system_prompt})
-            
-            # 컨텍스트 있으면 추가
-            if context and len(context) > 0:
-                context_text = "\n\n".join([f"문서 내용 #{i+1}:\n{doc}" for i, doc in enumerate(context)])
-                context_message = f"다음은 질문에 답하는 데 도움이 될 관련 문서 내용입니다:\n\n{context_text}"
-                messages.append({"role": "user", "content": context_message})
+            messages = self._build_messages(prompt, context, system_prompt)
             
-            # 사용자 프롬프트 추가
-            messages.append({"role": "user", "content": prompt})
-            
-            logger.debug(f"LM Studio API 스트림 요청 시작 - 프롬프트: '{prompt[:50]}...'")
+            logger.debug("LM Studio API 스트림 요청 시작 - 프롬프트: '%s...'", prompt[:50])
             
             # LM Studio API 호출 (스트림 모드)
-            url = f"{self.lmstudio_url}/v1/chat/completions"
-            headers = {"Content-Type": "application/json"}
-            
-            # max_tokens가 -1이면 무제한 토큰 생성
-            max_tokens = -1 if self.max_tokens > 10000 else self.max_tokens
-            
-            data = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": self.temperature,
-                "max_tokens": max_tokens,
-                "stream": True
-            }
+            data = {**self._lmstudio_request_template_stream, "messages": messages}
             
             # 스트림 응답 처리
-            with requests.post(url, headers=headers, json=data, stream=True, timeout=60) as response:
+            with self._session.post(self._lmstudio_chat_url, headers=JSON_HEADERS, data=_json_dumps(data), stream=True, timeout=60) as response:
+                self._verify_once(response.status_code)
                 if response.status_code != 200:
-                    error_msg = f"LM Studio API 오류 (코드: {response.status_code}): {response.text}"
+                    # 오류 본문은 앞부분만 읽음
+                    body = _error_body(next(response.iter_content(ERROR_BODY_LIMIT + 1), b""))
+                    error_msg = f"LM Studio API 오류 (코드: {response.status_code}): {body}"
                     logger.error(error_msg)
                     raise RuntimeError(error_msg)
                 
-                # 청크 스트림 처리
-                for line in response.iter_lines():
+                # 청크 스트림 처리 (수신한 바이트를 직접 줄 단위로 분리)
+                chunks = response.iter_content(chunk_size=STREAM_READ_SIZE, decode_unicode=False)
+                for line in _iter_stream_lines(chunks):
                     if not line:
                         continue
                         
-                    # "data: " 프리픽스 제거
-                    if line.startswith(b'data: '):
-                        line = line[6:]
+                    # "data: " 프리픽스 제거 (복사 없이 memoryview로 잘라냄)
+                    payload = memoryview(line)
+                    if line.startswith(_SSE_DATA_PREFIX):
+                        payload = payload[len(_SSE_DATA_PREFIX):]
                         
-                    # '[DONE]' 메시지 처리
-                    if line.strip() == b'[DONE]':
+                    # '[DONE]' 메시지 처리 (길이가 맞을 때만 비교)
+                    if len(payload) <= _SSE_DONE_MAX_LENGTH and payload.tobytes().strip() == _SSE_DONE:
                         break
                         
                     try:
                         # JSON 데이터 파싱
-                        chunk = json.loads(line)
+                        chunk = _json_loads(payload)
                         if 'choices' in chunk and len(chunk['choices']) > 0:
                             # 델타 내용 추출
                             delta = chunk['choices'][0].get('delta', {})
@@ -526,6 +843,474 @@ class LLMService:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
     
+    def _build_messages(self,
+                        prompt: str,
+                        context: Optional[List[str]] = None,
+                        system_prompt: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        채팅 API 요청용 메시지 목록 구성
+
+        제공자 측 프롬프트 캐시가 앞부분을 재사용할 수 있도록 고정된 내용부터 배치합니다
+        (시스템 프롬프트 → 컨텍스트 → 사용자 프롬프트).
+
+        Args:
+            prompt (str): 사용자 질의 텍스트
+            context (Optional[List[str]]): 추가 컨텍스트 텍스트 목록
+            system_prompt (Optional[str]): 시스템 프롬프트
+
+        Returns:
+            List[Dict[str, str]]: 메시지 목록
+        """
+        # 시스템 메시지는 같은 프롬프트가 반복되는 동안 같은 dict를 재사용
+        system_key, system_message = self._system_message
+        if system_key != system_prompt:
+            # 앞뒤 공백 차이로 프롬프트 앞부분이 달라지지 않도록 정리
+            content = system_prompt.strip() if system_prompt else ""
+            system_message = {"role": "system", "content": content or DEFAULT_SYSTEM_PROMPT}
+            self._system_message = (system_prompt, system_message)
+        messages = [system_message]
+
+        # 컨텍스트 있으면 추가 (직전 호출과 내용이 같은 컨텍스트면 만들어 둔 메시지 재사용)
+        if context and len(context) > 0:
+            context_key = tuple(context)
+            last_context_key, context_message = self._context_message
+            if context_key != last_context_key:
+                context_text = "\n\n".join([f"문서 내용 #{i+1}:\n{doc}" for i, doc in enumerate(context)])
+                context_message = {
+                    "role": "user",
+                    "content": f"다음은 질문에 답하는 데 도움이 될 관련 문서 내용입니다:\n\n{context_text}"
+                }
+                self._context_message = (context_key, context_message)
+            messages.append(context_message)
+
+        # 사용자 프롬프트 추가
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _get_aclient(self) -> aiohttp.ClientSession:
+        """
+        LM Studio 비동기 요청에 사용할 HTTP 세션 반환
+
+        같은 이벤트 루프 안에서는 세션을 재사용하고, 다른 루프(예: asyncio.run을 다시 호출)에서
+        사용하면 이전 루프에 묶인 세션을 버리고 새로 만듭니다.
+
+        Returns:
+            aiohttp.ClientSession: 연결을 재사용하는 HTTP 세션
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is not None and not self._aclient.closed and self._aclient_loop is not loop:
+            discard_session(self._aclient, self._aclient_loop)
+        if self._aclient is None or self._aclient.closed:
+            self._aclient = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=ASYNC_MAX_CONNECTIONS),
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    def _get_openai_client(self):
+        """
+        OpenAI 동기 클라이언트 반환 (close 이후에 다시 사용하면 새로 생성)
+
+        Returns:
+            openai.OpenAI: OpenAI 동기 클라이언트
+        """
+        if self._openai_client is None:
+            self._openai_client = self._new_openai_client("OpenAI")
+        return self._openai_client
+
+    def _get_async_openai_client(self):
+        """
+        OpenAI 비동기 클라이언트 반환 (처음 사용할 때 한 번만 생성)
+
+        다른 이벤트 루프에서 사용하면 새로 생성합니다 (내부 HTTP 연결이 루프에 묶이기 때문).
+
+        Returns:
+            openai.AsyncOpenAI: OpenAI 비동기 클라이언트
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_openai_client is None or self._async_openai_loop is not loop:
+            self._async_openai_client = self._new_openai_client("AsyncOpenAI")
+            self._async_openai_loop = loop
+        return self._async_openai_client
+
+    def close(self):
+        """
+        HTTP 세션 및 OpenAI 클라이언트 연결 종료
+
+        닫은 뒤에 다시 사용하면 클라이언트를 새로 만듭니다 (공유 인스턴스를 정리할 때도 안전).
+        비동기 세션은 그 이벤트 루프가 실행 중이면 루프에 종료를 예약하고, 닫혔으면 버립니다.
+        """
+        self._session.close()
+
+        if self._openai_client is not None:
+            self._openai_client.close()
+            self._openai_client = None
+
+        if self._aclient is not None and not self._aclient.closed:
+            discard_session(self._aclient, self._aclient_loop)
+        self._aclient = None
+        self._aclient_loop = None
+
+    async def aclose(self):
+        """
+        비동기 클라이언트 연결 종료
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is not None and not self._aclient.closed:
+            if self._aclient_loop is loop:
+                await self._aclient.close()
+            else:
+                discard_session(self._aclient, self._aclient_loop)
+        self._aclient = None
+        self._aclient_loop = None
+
+        if self._async_openai_client is not None:
+            if self._async_openai_loop is loop:
+                await self._async_openai_client.close()
+            self._async_openai_client = None
+            self._async_openai_loop = None
+
+    async def agenerate_response(self,
+                                 prompt: str,
+                                 context: Optional[List[str]] = None,
+                                 system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        LLM에 프롬프트를 비동기로 전송하고 응답 생성
+
+        Args:
+            prompt (str): 사용자 질의 텍스트
+            context (Optional[List[str]]): 추가 컨텍스트 텍스트 목록
+            system_prompt (Optional[str]): 시스템 프롬프트
+
+        Returns:
+            Dict[str, Any]: 응답 결과 (텍스트, 토큰 수 등)
+        """
+        if not prompt.strip():
+            return {"error": "빈 프롬프트가 제공되었습니다."}
+
+        # 캐시 확인
+        cache_key = self._cache_key(prompt, context, system_prompt)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug("응답 캐시 적중")
+                cached["elapsed_time"] = 0.0
+                return cached
+
+        # 프로바이더별 처리
+        if self.provider == "openai":
+            result = await self._agenerate_openai_response(prompt, context, system_prompt)
+        elif self.provider == "lmstudio":
+            result = await self._agenerate_lmstudio_response(prompt, context, system_prompt)
+        else:
+            error_msg = f"지원되지 않는 프로바이더입니다: {self.provider}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+
+        if cache_key is not None and result.get("success"):
+            self.cache.set(cache_key, result)
+        return result
+
+    async def agenerate_batch(self,
+                              prompts: List[str],
+                              context: Optional[List[str]] = None,
+                              system_prompt: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        여러 프롬프트를 동시에 전송하고 응답 생성
+
+        Args:
+            prompts (List[str]): 사용자 질의 텍스트 목록
+            context (Optional[List[str]]): 모든 프롬프트에 공통으로 사용할 컨텍스트 텍스트 목록
+            system_prompt (Optional[str]): 시스템 프롬프트
+
+        Returns:
+            List[Dict[str, Any]]: 프롬프트 순서대로 정렬된 응답 결과 목록
+        """
+        return await asyncio.gather(
+            *(self.agenerate_response(prompt, context, system_prompt) for prompt in prompts)
+        )
+
+    async def _agenerate_openai_response(self,
+                                         prompt: str,
+                                         context: Optional[List[str]] = None,
+                                         system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        OpenAI API를 사용하여 비동기로 응답 생성
+
+        Args:
+            prompt (str): 사용자 질의 텍스트
+            context (Optional[List[str]]): 추가 컨텍스트 텍스트 목록
+            system_prompt (Optional[str]): 시스템 프롬프트
+
+        Returns:
+            Dict[str, Any]: 응답 결과
+        """
+        if not self.api_key:
+            return {"error": "OpenAI API 키가 설정되지 않았습니다."}
+
+        try:
+            messages = self._build_messages(prompt, context, system_prompt)
+
+            start_time = time.time()
+            logger.debug("OpenAI API 비동기 요청 시작 - 프롬프트: '%s...'", prompt[:50])
+
+            # API 호출
+            response = await self._get_async_openai_client().chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens
+            )
+
+            elapsed_time = time.time() - start_time
+
+            # 응답 처리
+            if hasattr(response, 'choices') and len(response.choices) > 0:
+                result = {
+                    "text": response.choices[0].message.content,
+                    "model": self.model,
+                    "elapsed_time": elapsed_time,
+                    "success": True
+                }
+
+                # 토큰 사용량 정보 추출 (있는 경우)
+                if hasattr(response, 'usage'):
+                    result["tokens"] = {
+                        "prompt_tokens": response.usage.prompt_tokens,
+                        "completion_tokens": response.usage.completion_tokens,
+                        "total_tokens": response.usage.total_tokens
+                    }
+
+                logger.info(f"응답 생성 완료 (걸린 시간: {elapsed_time:.2f}초)")
+                return result
+            else:
+                error_msg = "OpenAI API에서 응답을 받았지만 내용이 없습니다."
+                logger.error(error_msg)
+                return {"error": error_msg, "success": False}
+
+        except Exception as e:
+            error_msg = f"OpenAI API 호출 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg, "success": False}
+
+    async def _agenerate_lmstudio_response(self,
+                                           prompt: str,
+                                           context: Optional[List[str]] = None,
+                                           system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        LM Studio 로컬 API를 사용하여 비동기로 응답 생성
+
+        Args:
+            prompt (str): 사용자 질의 텍스트
+            context (Optional[List[str]]): 추가 컨텍스트 텍스트 목록
+            system_prompt (Optional[str]): 시스템 프롬프트
+
+        Returns:
+            Dict[str, Any]: 응답 결과
+        """
+        try:
+            messages = self._build_messages(prompt, context, system_prompt)
+
+            start_time = time.time()
+            logger.debug("LM Studio API 비동기 요청 시작 - 프롬프트: '%s...'", prompt[:50])
+
+            data = {**self._lmstudio_request_template, "messages": messages}
+
+            async with self._get_aclient().post(
+                self._lmstudio_chat_url,
+                data=_json_dumps(data),
+                headers=JSON_HEADERS
+            ) as response:
+                self._verify_once(response.status)
+                if response.status != 200:
+                    # 오류 본문은 앞부분만 읽음
+                    body = _error_body(await response.content.read(ERROR_BODY_LIMIT + 1))
+                    error_msg = f"LM Studio API 오류 (코드: {response.status}): {body}"
+                    logger.error(error_msg)
+                    return {"error": error_msg, "success": False}
+
+                response_data = _json_loads(await response.read())
+
+            elapsed_time = time.time() - start_time
+
+            if "choices" in response_data and len(response_data["choices"]) > 0:
+                result = {
+                    "text": response_data["choices"][0]["message"]["content"],
+                    "model": self.model,
+                    "elapsed_time": elapsed_time,
+                    "success": True
+                }
+
+                # 토큰 사용량 정보 추출 (있는 경우)
+                if "usage" in response_data:
+                    result["tokens"] = {
+                        "prompt_tokens": response_data["usage"].get("prompt_tokens", 0),
+                        "completion_tokens": response_data["usage"].get("completion_tokens", 0),
+                        "total_tokens": response_data["usage"].get("total_tokens", 0)
+                    }
+
+                logger.info(f"응답 생성 완료 (걸린 시간: {elapsed_time:.2f}초)")
+                return result
+            else:
+                error_msg = "LM Studio API에서 응답을 받았지만 내용이 없습니다."
+                logger.error(error_msg)
+                return {"error": error_msg, "success": False}
+
+        except aiohttp.ClientConnectionError:
+            error_msg = f"LM Studio 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요 (URL: {self.lmstudio_url})"
+            logger.error(error_msg)
+            return {"error": error_msg, "success": False}
+
+        except Exception as e:
+            error_msg = f"LM Studio API 호출 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg, "success": False}
+
+    async def agenerate_stream_response(self,
+                                        prompt: str,
+                                        context: Optional[List[str]] = None,
+                                        system_prompt: Optional[str] = None) -> AsyncGenerator[str, None]:
+        """
+        스트림 방식으로 LLM에 프롬프트를 비동기 전송하고 응답 생성
+
+        Args:
+            prompt (str): 사용자 질의 텍스트
+            context (Optional[List[str]]): 추가 컨텍스트 텍스트 목록
+            system_prompt (Optional[str]): 시스템 프롬프트
+
+        Yields:
+            str: 응답 텍스트 조각
+        """
+        if not prompt.strip():
+            raise ValueError("빈 프롬프트가 제공되었습니다.")
+
+        # 프로바이더별 처리
+        if self.provider == "openai":
+            stream = self._agenerate_openai_stream_response(prompt, context, system_prompt)
+        elif self.provider == "lmstudio":
+            stream = self._agenerate_lmstudio_stream_response(prompt, context, system_prompt)
+        else:
+            error_msg = f"지원되지 않는 프로바이더입니다: {self.provider}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        async for content in stream:
+            yield content
+
+    async def _agenerate_openai_stream_response(self,
+                                                prompt: str,
+                                                context: Optional[List[str]] = None,
+                                                system_prompt: Optional[str] = None) -> AsyncGenerator[str, None]:
+        """
+        OpenAI API를 사용하여 비동기 스트림 방식으로 응답 생성
+
+        Args:
+            prompt (str): 사용자 질의 텍스트
+            context (Optional[List[str]]): 추가 컨텍스트 텍스트 목록
+            system_prompt (Optional[str]): 시스템 프롬프트
+
+        Yields:
+            str: 응답 텍스트 조각
+        """
+        if not self.api_key:
+            raise ValueError("OpenAI API 키가 설정되지 않았습니다.")
+
+        try:
+            messages = self._build_messages(prompt, context, system_prompt)
+
+            logger.debug("OpenAI API 비동기 스트림 요청 시작 - 프롬프트: '%s...'", prompt[:50])
+
+            # API 호출 (스트림 모드)
+            stream = await self._get_async_openai_client().chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                stream=True
+            )
+
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            error_msg = f"OpenAI API 스트림 호출 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+    async def _agenerate_lmstudio_stream_response(self,
+                                                  prompt: str,
+                                                  context: Optional[List[str]] = None,
+                                                  system_prompt: Optional[str] = None) -> AsyncGenerator[str, None]:
+        """
+        LM Studio 로컬 API를 사용하여 비동기 스트림 방식으로 응답 생성
+
+        Args:
+            prompt (str): 사용자 질의 텍스트
+            context (Optional[List[str]]): 추가 컨텍스트 텍스트 목록
+            system_prompt (Optional[str]): 시스템 프롬프트
+
+        Yields:
+            str: 응답 텍스트 조각
+        """
+        try:
+            messages = self._build_messages(prompt, context, system_prompt)
+
+            logger.debug("LM Studio API 비동기 스트림 요청 시작 - 프롬프트: '%s...'", prompt[:50])
+
+            data = {**self._lmstudio_request_template_stream, "messages": messages}
+
+            async with self._get_aclient().post(
+                self._lmstudio_chat_url,
+                data=_json_dumps(data),
+                headers=JSON_HEADERS
+            ) as response:
+                self._verify_once(response.status)
+                if response.status != 200:
+                    # 오류 본문은 앞부분만 읽음
+                    body = _error_body(await response.content.read(ERROR_BODY_LIMIT + 1))
+                    error_msg = f"LM Studio API 오류 (코드: {response.status}): {body}"
+                    logger.error(error_msg)
+                    raise RuntimeError(error_msg)
+
+                # 청크 스트림 처리 (줄 단위, 토큰 사이에 이벤트 루프 양보)
+                async for line in response.content:
+                    line = line.rstrip(b'\r\n')
+                    if not line:
+                        continue
+
+                    # "data: " 프리픽스 제거 (복사 없이 memoryview로 잘라냄)
+                    payload = memoryview(line)
+                    if line.startswith(_SSE_DATA_PREFIX):
+                        payload = payload[len(_SSE_DATA_PREFIX):]
+
+                    # '[DONE]' 메시지 처리 (길이가 맞을 때만 비교)
+                    if len(payload) <= _SSE_DONE_MAX_LENGTH and payload.tobytes().strip() == _SSE_DONE:
+                        break
+
+                    try:
+                        # JSON 데이터 파싱
+                        chunk = _json_loads(payload)
+                        if 'choices' in chunk and len(chunk['choices']) > 0:
+                            # 델타 내용 추출
+                            delta = chunk['choices'][0].get('delta', {})
+                            if 'content' in delta and delta['content']:
+                                yield delta['content']
+                    except json.JSONDecodeError:
+                        logger.warning(f"JSON 파싱 오류: {line}")
+                        continue
+
+        except aiohttp.ClientConnectionError:
+            error_msg = f"LM Studio 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요 (URL: {self.lmstudio_url})"
+            logger.error(error_msg)
+            raise ConnectionError(error_msg)
+
+        except Exception as e:
+            error_msg = f"LM Studio API 스트림 호출 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
     def get_model_info(self) -> Dict[str, Any]:
         """
         현재 LLM 모델 설정 정보 반환
@@ -544,3 +1329,55 @@ class LLMService:
             info["lmstudio_url"] = self.lmstudio_url
             
         return info
+
+
+def get_llm_service(provider: str = "lmstudio",
+                    model: str = "kanana-nano-2.1b-instruct",
+                    temperature: float = 0.3,
+                    max_tokens: int = 1024,
+                    lmstudio_url: str = "http://localhost:4982",
+                    api_key: Optional[str] = None) -> LLMService:
+    """
+    설정별로 공유되는 LLMService 인스턴스 반환
+
+    같은 설정으로 다시 호출하면 이미 만들어 둔 인스턴스(연결 풀, 응답 캐시 포함)를 재사용합니다.
+    요청마다 LLMService를 새로 만드는 대신 이 함수를 사용하세요.
+    비동기 클라이언트는 호출한 이벤트 루프에 맞춰 다시 만들어지므로 여러 루프에서 공유해도 됩니다.
+    최대 LLM_SERVICE_CACHE_SIZE개까지 보관하며, 밀려난 인스턴스는 연결을 닫습니다.
+
+    Args:
+        provider (str): LLM 제공자 (기본값: "lmstudio", 옵션: "openai", "lmstudio")
+        model (str): 사용할 모델 (기본값: "kanana-nano-2.1b-instruct")
+        temperature (float): 응답 무작위성 정도 (0.0-1.0, 기본값: 0.3)
+        max_tokens (int): 최대 응답 토큰 수 (기본값: 1024)
+        lmstudio_url (str): LM Studio API 서버 URL (기본값: "http://localhost:4982")
+        api_key (Optional[str]): API 키 (None인 경우 환경 변수에서 로드)
+
+    Returns:
+        LLMService: 공유 LLM 서비스 인스턴스
+    """
+    key = (provider.lower(), model, temperature, max_tokens, lmstudio_url, api_key)
+    with _llm_services_lock:
+        service = _llm_services.get(key)
+        if service is not None:
+            _llm_services.move_to_end(key)
+            return service
+
+        service = LLMService(
+            provider=provider,
+            model=model,
+            api_key=api_key,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            lmstudio_url=lmstudio_url
+        )
+        _llm_services[key] = service
+
+        # 가장 오래 사용하지 않은 인스턴스를 밀어내고 연결 종료
+        evicted = None
+        if len(_llm_services) > LLM_SERVICE_CACHE_SIZE:
+            _, evicted = _llm_services.popitem(last=False)
+
+    if evicted is not None:
+        evicted.close()
+    return service
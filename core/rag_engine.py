@@ -2,20 +2,26 @@
 RAG 엔진 모듈 - 검색 증강 생성 기능 구현
 """
 import os
+import asyncio
+import hashlib
 import logging
+import queue
+import threading
+from concurrent.futures import Future
 from typing import List, Dict, Optional, Union, Any, Tuple
 import numpy as np
 from pathlib import Path
 
-# 랭체인 텍스트 분할기
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-
 # 내부 모듈
-from utils.common import setup_logger, get_project_root, sanitize_filename
+from utils.common import setup_logger, get_project_root, sanitize_filename, prune_cache_dir
 from utils.document_processor import DocumentProcessor
 from core.embedding_model import EmbeddingModel
-from core.vector_db import VectorDB
+from core.vector_db import (
+    VectorDB, INDEX_FILE_NAME, DEFAULT_INDEX_FACTORY, IVF_NPROBE, IVF_TRAIN_SIZE, IVF_K_REFINE_FACTOR,
+    DEFAULT_QUANTIZATION
+)
 from core.llm_connector import LLMConnector
+from core._text_splitter import SpanTextSplitter
 
 # 로거 설정
 logger = setup_logger(
@@ -23,6 +29,199 @@ logger = setup_logger(
     os.path.join(get_project_root(), "logs", "rag_engine.log")
 )
 
+# 여러 문서의 청크를 모아 한 번에 임베딩할 때의 설정 (최대 텍스트 수, 추가 요청 대기 시간(초))
+EMBED_BATCH_MAX_TEXTS = 1024
+EMBED_BATCH_MAX_WAIT = 0.01
+
+# 동시에 들어온 질의를 모아 한 번에 임베딩할 때의 설정 (최대 질의 수, 추가 질의 대기 시간(초))
+QUERY_BATCH_MAX_TEXTS = 32
+QUERY_BATCH_MAX_WAIT = 0.01
+
+# 프롬프트에 넣을 컨텍스트의 최대 토큰 수 (청크 저장 시 계산한 토큰 수 기준)
+CONTEXT_TOKEN_BUDGET = 3500
+
+# RAG 프롬프트의 문서 번호 머리말 (질의마다 번호를 다시 포맷하지 않도록 미리 생성, 초과분은 그때 생성)
+PROMPT_MAX_DOCS = 32
+PROMPT_DOC_LABELS = tuple(f"문서 {i}:\n" for i in range(1, PROMPT_MAX_DOCS + 1))
+
+# 문서 처리 결과 캐시 설정 (벡터 DB 디렉토리 아래 폴더 이름, 파일 해시 계산 시 읽기 단위(바이트), 최대 전체 크기(바이트))
+# - 전체 크기가 최대 크기를 넘으면 오래 사용하지 않은 파일부터 삭제
+INGEST_CACHE_DIR_NAME = "ingest_cache"
+INGEST_CACHE_READ_SIZE = 1024 * 1024
+INGEST_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# 문서 청크를 CPU에서 임베딩할 때의 배치 크기
+# - 모델을 여러 스레드에서 동시에 호출하지 않고, 작업 스레드 하나가 큰 배치로 torch 내부 스레드를 모두 활용
+EMBED_CPU_BATCH_SIZE = 128
+
+
+class _EmbedBatcher:
+    """
+    동시에 처리 중인 여러 문서의 청크를 모아 한 번의 embed_texts 호출로 임베딩하는 작업 큐
+    
+    백그라운드 스레드 하나가 큐에서 요청을 꺼내, 잠시 기다리는 동안 도착한 요청까지 합쳐
+    임베딩한 뒤 문서별 Future에 결과를 나누어 전달합니다.
+    """
+    
+    def __init__(self,
+                 embedding_model: EmbeddingModel,
+                 max_texts: int = EMBED_BATCH_MAX_TEXTS,
+                 max_wait: float = EMBED_BATCH_MAX_WAIT,
+                 cpu_batch_size: Optional[int] = None):
+        """
+        임베딩 작업 큐 초기화
+        
+        Args:
+            embedding_model (EmbeddingModel): 임베딩 모델
+            max_texts (int): 한 번에 임베딩할 최대 텍스트 수 (기본값: 1024)
+            max_wait (float): 첫 요청 이후 추가 요청을 기다리는 최대 시간(초) (기본값: 0.01)
+            cpu_batch_size (Optional[int]): CPU 임베딩 시 모델 배치 크기 (기본값: None, 모델 설정값 사용)
+        """
+        self.embedding_model = embedding_model
+        self.max_texts = max_texts
+        self.max_wait = max_wait
+        self.cpu_batch_size = cpu_batch_size
+        self._queue: "queue.Queue[Tuple[List[str], Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        
+        # GPU 임베딩용 작업 스레드 전용 CUDA 스트림 (문서/질의 작업 큐의 커널 실행이 서로 겹칠 수 있도록)
+        self._cuda_stream = None
+    
+    def submit(self, texts: List[str]) -> Future:
+        """
+        임베딩 요청 등록
+        
+        Args:
+            texts (List[str]): 임베딩할 텍스트 목록
+            
+        Returns:
+            Future: 입력 순서대로 정렬된 임베딩 배열을 결과로 갖는 Future
+        """
+        future: Future = Future()
+        self._queue.put((texts, future))
+        self._ensure_worker()
+        return future
+    
+    def _ensure_worker(self):
+        """
+        백그라운드 작업 스레드가 없으면 시작
+        """
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="embed-batcher", daemon=True)
+                self._worker.start()
+    
+    def _run(self):
+        """
+        큐에서 요청을 모아 임베딩하는 작업 루프
+        
+        처리 중 예외가 나도 작업 스레드는 종료되지 않고, 해당 묶음의 요청에만 예외를 전달합니다.
+        """
+        while True:
+            batch = self._collect_batch()
+            try:
+                self._embed_batch(batch)
+            except Exception as e:
+                logger.error(f"임베딩 작업 큐 처리 중 오류 발생: {str(e)}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+    
+    def _take(self, timeout: Optional[float] = None) -> Optional[Tuple[List[str], Future]]:
+        """
+        큐에서 요청 하나를 꺼내 실행 상태로 표시 (이미 취소된 요청은 버림)
+        
+        실행 상태가 된 Future는 더 이상 취소되지 않으므로, 결과 전달 중 취소로 인한 오류가 생기지 않습니다.
+        
+        Args:
+            timeout (Optional[float]): 최대 대기 시간(초) (기본값: None, 요청이 올 때까지 대기)
+            
+        Returns:
+            Optional[Tuple[List[str], Future]]: (텍스트 목록, Future), 취소된 요청이면 None
+            
+        Raises:
+            queue.Empty: 대기 시간 안에 요청이 없는 경우
+        """
+        texts, future = self._queue.get(timeout=timeout)
+        if not future.set_running_or_notify_cancel():
+            return None
+        return texts, future
+    
+    def _collect_batch(self) -> List[Tuple[List[str], Future]]:
+        """
+        첫 요청을 기다린 뒤, 대기 시간 안에 도착한 요청을 최대 텍스트 수까지 합쳐 반환
+        
+        Returns:
+            List[Tuple[List[str], Future]]: 취소되지 않은 (텍스트 목록, Future) 목록 (1개 이상)
+        """
+        item = None
+        while item is None:
+            item = self._take()
+        batch = [item]
+        total = len(item[0])
+        
+        while total < self.max_texts:
+            try:
+                item = self._take(timeout=self.max_wait)
+            except queue.Empty:
+                break
+            if item is not None:
+                batch.append(item)
+                total += len(item[0])
+        
+        return batch
+    
+    def _embed_batch(self, batch: List[Tuple[List[str], Future]]):
+        """
+        모은 요청을 한 번에 임베딩하고 요청별로 결과 분배
+        
+        Args:
+            batch (List[Tuple[List[str], Future]]): (텍스트 목록, Future) 목록
+        """
+        all_texts = [text for texts, _ in batch for text in texts]
+        try:
+            embeddings = self._embed_texts(all_texts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        # 누적 위치로 잘라 문서별로 전달 (복사 없는 뷰)
+        offsets = np.cumsum([len(texts) for texts, _ in batch[:-1]])
+        for (_, future), part in zip(batch, np.split(embeddings, offsets)):
+            if not future.done():
+                future.set_result(part)
+        
+        if len(batch) > 1:
+            logger.debug(f"{len(batch)}개 문서의 청크 {len(all_texts)}개를 한 번에 임베딩")
+    
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        텍스트 목록 임베딩 (CPU에서는 설정된 큰 배치 크기로 한 번에 처리)
+        
+        GPU 모델이면 이 작업 큐 전용 CUDA 스트림에서 실행합니다.
+        
+        Args:
+            texts (List[str]): 임베딩할 텍스트 목록
+            
+        Returns:
+            np.ndarray: 입력 순서대로 정렬된 임베딩 배열
+        """
+        device = getattr(self.embedding_model, "device", "cpu")
+        if device != "cuda":
+            batch_size = self.cpu_batch_size if device == "cpu" else None
+            return self.embedding_model.embed_texts(texts, batch_size=batch_size)
+        
+        import torch
+        # 작업 스레드 하나만 호출하므로 잠금 없이 처음 호출 시 생성
+        if self._cuda_stream is None:
+            self._cuda_stream = torch.cuda.Stream()
+        with torch.cuda.stream(self._cuda_stream):
+            return self.embedding_model.embed_texts(texts)
+
+
 class RAGEngine:
     """
     RAG(Retrieval Augmented Generation) 엔진 클래스
@@ -57,27 +256,17 @@ class RAGEngine:
         # 모듈 초기화
         self.doc_processor = DocumentProcessor()
         
-        # 임베딩 모델 초기화
-        logger.info(f"임베딩 모델 '{embedding_model_name}' 초기화 중...")
-        self.embedding_model = EmbeddingModel(model_name=embedding_model_name)
-        
-        # 벡터 DB 초기화
+        # 임베딩 모델, 벡터 DB, LLM 커넥터는 처음 사용할 때 생성 (문서 목록 조회 등은 모델 로딩 불필요)
         if vector_db_path is None:
             vector_db_path = os.path.join(get_project_root(), "data", "vector_db")
-            
-        logger.info(f"벡터 DB 초기화 중... (경로: {vector_db_path})")
-        self.vector_db = VectorDB(
-            db_path=vector_db_path,
-            dimension=self.embedding_model.embedding_dim
-        )
+        self._embedding_model_name = embedding_model_name
+        self._vector_db_path = vector_db_path
+        self._lazy_init_lock = threading.RLock()
         
-        # LLM 커넥터 초기화
-        logger.info(f"LLM 서비스 초기화 중... (서비스: {llm_service})")
-        self.llm_connector = LLMConnector(config=self.config, logger=logger)
         self.current_llm_service = llm_service
         
-        # 텍스트 분할기 초기화
-        self.text_splitter = RecursiveCharacterTextSplitter(
+        # 텍스트 분할기 초기화 (랭체인 RecursiveCharacterTextSplitter와 같은 결과, 구분자 위치 기반 분할)
+        self.text_splitter = SpanTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             length_function=len,
@@ -88,8 +277,120 @@ class RAGEngine:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         
+        # 여러 스레드에서 문서를 처리할 때 벡터 DB 변경을 직렬화
+        self._vector_db_lock = threading.Lock()
+        
         logger.info("RAG 엔진 초기화 완료")
     
+    def _lazy(self, name: str, factory):
+        """
+        처음 접근할 때 한 번만 생성하는 구성 요소 반환 (여러 스레드에서 동시에 접근해도 한 번만 생성)
+        
+        Args:
+            name (str): 구성 요소 이름
+            factory: 구성 요소를 생성하는 함수
+            
+        Returns:
+            생성된 구성 요소
+        """
+        value = self.__dict__.get(name)
+        if value is None:
+            with self._lazy_init_lock:
+                value = self.__dict__.get(name)
+                if value is None:
+                    value = self.__dict__[name] = factory()
+        return value
+    
+    @property
+    def embedding_model(self) -> EmbeddingModel:
+        """
+        임베딩 모델 (처음 사용할 때 로드)
+        """
+        return self._lazy("_embedding_model", self._create_embedding_model)
+    
+    def _create_embedding_model(self) -> EmbeddingModel:
+        """
+        임베딩 모델 생성
+        
+        Returns:
+            EmbeddingModel: 임베딩 모델
+        """
+        logger.info(f"임베딩 모델 '{self._embedding_model_name}' 초기화 중...")
+        # 정규화는 벡터 DB가 인덱스 거리 방식에 맞춰 한 곳에서 수행
+        return EmbeddingModel(model_name=self._embedding_model_name)
+    
+    @property
+    def vector_db(self) -> VectorDB:
+        """
+        벡터 DB (처음 사용할 때 로드)
+        """
+        return self._lazy("_vector_db", self._create_vector_db)
+    
+    def _create_vector_db(self) -> VectorDB:
+        """
+        벡터 DB 생성 (저장된 인덱스가 있으면 임베딩 모델 없이 로드)
+        
+        Returns:
+            VectorDB: 벡터 DB
+        """
+        logger.info(f"벡터 DB 초기화 중... (경로: {self._vector_db_path})")
+        
+        # 저장된 인덱스가 있으면 그 차원을 사용
+        if os.path.exists(os.path.join(self._vector_db_path, INDEX_FILE_NAME)):
+            dimension = None
+        else:
+            dimension = self.embedding_model.embedding_dim
+        
+        return VectorDB(
+            db_path=self._vector_db_path,
+            dimension=dimension,
+            index_factory=self.config.get("index_factory", DEFAULT_INDEX_FACTORY),
+            nprobe=self.config.get("nprobe", IVF_NPROBE),
+            train_size=self.config.get("ivf_train_size", IVF_TRAIN_SIZE),
+            k_refine_factor=self.config.get("k_refine_factor", IVF_K_REFINE_FACTOR),
+            quantization=self.config.get("quantization", DEFAULT_QUANTIZATION),
+            num_threads=self.config.get("faiss_threads"),
+            read_only=self.config.get("vector_db_read_only", False)
+        )
+    
+    @property
+    def llm_connector(self) -> LLMConnector:
+        """
+        LLM 커넥터 (처음 사용할 때 생성)
+        """
+        return self._lazy("_llm_connector", self._create_llm_connector)
+    
+    def _create_llm_connector(self) -> LLMConnector:
+        """
+        LLM 커넥터 생성
+        
+        Returns:
+            LLMConnector: LLM 커넥터
+        """
+        logger.info(f"LLM 서비스 초기화 중... (서비스: {self.current_llm_service})")
+        return LLMConnector(config=self.config, logger=logger)
+    
+    @property
+    def _embed_batcher(self) -> _EmbedBatcher:
+        """
+        동시에 처리되는 문서들의 청크를 모아 임베딩하는 작업 큐
+        """
+        return self._lazy("_embed_batcher_instance", lambda: _EmbedBatcher(
+            self.embedding_model,
+            cpu_batch_size=self.config.get("embed_cpu_batch_size", EMBED_CPU_BATCH_SIZE)
+        ))
+    
+    @property
+    def _query_batcher(self) -> _EmbedBatcher:
+        """
+        동시에 들어온 질의들을 모아 임베딩하는 작업 큐 (문서 청크와 섞이지 않도록 별도 큐 사용)
+        """
+        return self._lazy("_query_batcher_instance", lambda: _EmbedBatcher(
+            self.embedding_model,
+            max_texts=self.config.get("query_batch_max_texts", QUERY_BATCH_MAX_TEXTS),
+            max_wait=self.config.get("query_batch_max_wait", QUERY_BATCH_MAX_WAIT)
+        ))
+    
     def process_document(self, file_path: str) -> Dict[str, Any]:
         """
         문서 파일을 처리하여 벡터 DB에 저장
@@ -109,38 +410,59 @@ class RAGEngine:
                 logger.error(error_msg)
                 return {"success": False, "error": error_msg}
             
-            # 문서 처리기로 텍스트 추출
-            title, contents = self.doc_processor.process_document(file_path)
-            logger.info(f"문서 '{title}' 텍스트 추출 완료 ({len(contents)} 부분)")
-            
-            # 내용이 없으면 오류 반환
-            if not contents:
-                error_msg = f"문서 '{title}'에서 추출된 텍스트가 없습니다."
-                logger.error(error_msg)
-                return {"success": False, "error": error_msg}
-            
-            # 텍스트 결합 및 청크 분할
-            combined_text = "\n\n".join(contents)
-            chunks = self.text_splitter.split_text(combined_text)
+            # 같은 내용의 파일을 다시 처리하는 경우 텍스트 추출/분할/임베딩 결과 재사용
+            cache_key = self._ingest_cache_key(file_path)
+            cached = self._load_ingest_cache(cache_key)
             
-            if not chunks:
-                error_msg = f"문서 '{title}'를 청크로 분할할 수 없습니다."
-                logger.error(error_msg)
-                return {"success": False, "error": error_msg}
+            if cached is not None:
+                title, chunks, embeddings = cached
+                logger.info(f"문서 '{title}' 처리 결과 캐시 사용 (청크 수: {len(chunks)})")
+            else:
+                # 문서 처리기로 텍스트 추출
+                title, contents = self.doc_processor.process_document(file_path)
+                logger.info(f"문서 '{title}' 텍스트 추출 완료 ({len(contents)} 부분)")
                 
-            logger.info(f"문서를 {len(chunks)}개 청크로 분할 완료")
+                # 내용이 없으면 오류 반환
+                if not contents:
+                    error_msg = f"문서 '{title}'에서 추출된 텍스트가 없습니다."
+                    logger.error(error_msg)
+                    return {"success": False, "error": error_msg}
+                
+                # 텍스트 결합 및 청크 분할
+                combined_text = "\n\n".join(contents)
+                chunks = self.text_splitter.split_text(combined_text)
+                
+                if not chunks:
+                    error_msg = f"문서 '{title}'를 청크로 분할할 수 없습니다."
+                    logger.error(error_msg)
+                    return {"success": False, "error": error_msg}
+                
+                logger.info(f"문서를 {len(chunks)}개 청크로 분할 완료")
+                
+                # 청크 임베딩 (동시에 처리 중인 다른 문서의 청크와 함께 배치 처리,
+                # 패딩을 줄이기 위한 길이순 배치 구성과 원래 순서 복원은 EmbeddingModel._encode에서 처리)
+                embeddings = self._embed_batcher.submit(chunks).result()
+                logger.info(f"청크 임베딩 완료 (차원: {embeddings.shape})")
+                
+                # 벡터 DB 잠금 대기 중 메모리를 줄이기 위해 float16으로 보관
+                # (IVF 인덱스의 재정렬 단계도 float16으로 저장하며, 정밀도 손실은 검색 순위에 거의 영향 없음)
+                embeddings = embeddings.astype(np.float16)
+                
+                # 다음 처리를 위해 결과 캐시에 저장
+                self._save_ingest_cache(cache_key, title, chunks, embeddings)
             
-            # 청크 임베딩
-            embeddings = self.embedding_model.embed_texts(chunks)
-            logger.info(f"청크 임베딩 완료 (차원: {embeddings.shape})")
+            # 청크별 토큰 수 (질의 시 컨텍스트 토큰 예산 계산용)
+            token_counts = self.embedding_model.tokenize_lengths(chunks)
             
             # 벡터 DB에 문서 추가
-            doc_id = self.vector_db.add_document(
-                title=title,
-                file_path=file_path,
-                chunks=chunks,
-                embeddings=embeddings
-            )
+            with self._vector_db_lock:
+                doc_id = self.vector_db.add_document(
+                    title=title,
+                    file_path=file_path,
+                    chunks=chunks,
+                    embeddings=embeddings,
+                    token_counts=token_counts
+                )
             
             logger.info(f"문서 '{title}' 처리 및 저장 완료 (ID: {doc_id}, 청크 수: {len(chunks)})")
             
@@ -157,6 +479,125 @@ class RAGEngine:
             logger.error(error_msg)
             return {"success": False, "error": error_msg}
     
+    def _ingest_cache_key(self, file_path: str) -> str:
+        """
+        문서 처리 결과 캐시 키 계산
+        
+        파일 내용뿐 아니라 임베딩 모델과 청크 설정도 포함하여, 설정이 바뀌면 캐시를 사용하지 않습니다.
+        
+        Args:
+            file_path (str): 파일 경로
+            
+        Returns:
+            str: SHA-256 16진수 문자열
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(INGEST_CACHE_READ_SIZE), b""):
+                digest.update(block)
+        
+        model_name = getattr(self.embedding_model, "model_name", "")
+        digest.update(f"|{model_name}|{self.chunk_size}|{self.chunk_overlap}".encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _ingest_cache_path(self, cache_key: str) -> str:
+        """
+        문서 처리 결과 캐시 파일 경로 반환
+        
+        Args:
+            cache_key (str): 캐시 키
+            
+        Returns:
+            str: 벡터 DB 디렉토리 아래의 .npz 파일 경로
+        """
+        return os.path.join(self.vector_db.db_path, INGEST_CACHE_DIR_NAME, f"{cache_key}.npz")
+    
+    def _load_ingest_cache(self, cache_key: str) -> Optional[Tuple[str, List[str], np.ndarray]]:
+        """
+        캐시된 문서 처리 결과 읽기
+        
+        Args:
+            cache_key (str): 캐시 키
+            
+        Returns:
+            Optional[Tuple[str, List[str], np.ndarray]]: (제목, 청크 목록, float16 임베딩), 없거나 읽을 수 없으면 None
+        """
+        cache_path = self._ingest_cache_path(cache_key)
+        if not os.path.exists(cache_path):
+            return None
+        
+        try:
+            with np.load(cache_path) as data:
+                title = str(data["title"])
+                text = str(data["text"])
+                offsets = data["offsets"]
+                embeddings = data["embeddings"]
+        except Exception as e:
+            logger.warning(f"문서 처리 결과 캐시를 읽을 수 없습니다 ({cache_path}): {str(e)}")
+            return None
+        
+        # 크기 제한 시 최근 사용한 캐시가 남도록 수정 시간 갱신
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        
+        # 이어 붙인 청크 텍스트를 경계 위치로 다시 분할
+        chunks = [text[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+        return title, chunks, embeddings
+    
+    def _save_ingest_cache(self, cache_key: str, title: str, chunks: List[str], embeddings: np.ndarray):
+        """
+        문서 처리 결과를 캐시에 저장하고 캐시 크기 제한 적용 (실패해도 문서 처리는 계속 진행)
+        
+        청크는 pickle 없이 읽을 수 있도록 하나의 문자열과 경계 위치 배열로 저장합니다.
+        
+        Args:
+            cache_key (str): 캐시 키
+            title (str): 문서 제목
+            chunks (List[str]): 청크 목록
+            embeddings (np.ndarray): float16 임베딩 배열
+        """
+        cache_path = self._ingest_cache_path(cache_key)
+        tmp_path = f"{cache_path}.tmp"
+        
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+            np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+            
+            # 임시 파일에 쓴 뒤 교체하여 동시 처리 중에도 불완전한 캐시 파일이 보이지 않도록 함
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    title=np.array(title),
+                    text=np.array("".join(chunks)),
+                    offsets=offsets,
+                    embeddings=embeddings
+                )
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"문서 처리 결과 캐시 저장 실패 ({cache_path}): {str(e)}")
+            return
+        
+        removed = prune_cache_dir(os.path.dirname(cache_path), INGEST_CACHE_MAX_BYTES)
+        if removed:
+            logger.debug(f"문서 처리 결과 캐시 {removed}개 삭제 (크기 제한)")
+    
+    async def aprocess_document(self, file_path: str) -> Dict[str, Any]:
+        """
+        문서 파일을 비동기로 처리하여 벡터 DB에 저장
+        
+        여러 문서를 asyncio.gather로 동시에 처리하면 각 문서의 청크가 모여 한 번에 임베딩됩니다.
+        
+        Args:
+            file_path (str): 처리할 파일 경로
+            
+        Returns:
+            Dict[str, Any]: 처리 결과 (성공 여부, 문서 ID, 청크 수 등)
+        """
+        return await asyncio.to_thread(self.process_document, file_path)
+    
     async def query(self, 
              query_text: str, 
              top_k: int = 5,
@@ -174,6 +615,7 @@ class RAGEngine:
         Returns:
             Dict[str, Any]: 쿼리 결과 (성공 여부, 응답 텍스트, 참조 문서 등)
         """
+        model_info_task = None
         try:
             # 사용할 LLM 서비스 결정
             if llm_service is None:
@@ -184,12 +626,17 @@ class RAGEngine:
                 
             logger.info(f"쿼리 처리 시작: '{query_text[:50]}...' (서비스: {llm_service})")
             
-            # 질의 임베딩
-            query_embedding = self.embedding_model.embed_query(query_text)
+            # 모델 정보는 검색 결과와 무관하므로 미리 조회 시작 (결과 반환 시점에 대기)
+            model_info_task = asyncio.create_task(
+                asyncio.to_thread(self.llm_connector.get_model_info, llm_service)
+            )
+            
+            # 질의 임베딩 (동기 연산이므로 이벤트 루프를 막지 않도록 별도 스레드에서 실행)
+            query_embedding = await self._aembed_query(query_text)
             logger.debug(f"쿼리 임베딩 완료 (차원: {query_embedding.shape})")
             
             # 벡터 DB에서 유사한 청크 검색
-            search_results = self.vector_db.search(query_embedding, top_k=top_k)
+            search_results = await asyncio.to_thread(self.vector_db.search, query_embedding, top_k=top_k)
             
             # 검색 결과가 없는 경우
             if not search_results:
@@ -212,31 +659,20 @@ class RAGEngine:
                     "answer": llm_response,
                     "references": [],
                     "search_results": [],
-                    "model_info": self.llm_connector.get_model_info(llm_service)
+                    "model_info": await model_info_task
                 }
                 
             logger.info(f"검색 결과: {len(search_results)} 개 청크 찾음")
             
-            # 참조 문서 정보 수집
-            references = self._collect_references(search_results)
+            # 참조 문서 정보 수집 및 컨텍스트 구성 (검색 결과를 한 번만 순회)
+            references, context = self._collect_references_and_context(search_results)
             
-            # 컨텍스트 구성
-            context = self._build_context(search_results)
-            
-            # LLM 프롬프트 구성
-            if system_prompt:
-                # 시스템 프롬프트가 있는 경우
-                prompt = self._build_rag_prompt_with_system(
-                    query=query_text,
-                    context=context,
-                    system_prompt=system_prompt
-                )
-            else:
-                # 시스템 프롬프트가 없는 경우
-                prompt = self._build_rag_prompt(
-                    query=query_text,
-                    context=context
-                )
+            # LLM 프롬프트 구성 (시스템 프롬프트가 있으면 앞에 추가)
+            prompt = self._build_rag_prompt(
+                query=query_text,
+                context=context,
+                system_prompt=system_prompt
+            )
                 
             logger.debug(f"LLM 프롬프트 구성 완료 (길이: {len(prompt)}자)")
             
@@ -254,10 +690,12 @@ class RAGEngine:
                 "answer": llm_response,
                 "references": references,
                 "search_results": search_results,
-                "model_info": self.llm_connector.get_model_info(llm_service)
+                "model_info": await model_info_task
             }
             
         except Exception as e:
+            if model_info_task is not None:
+                model_info_task.cancel()
             error_msg = f"쿼리 처리 중 오류 발생: {str(e)}"
             logger.error(error_msg)
             return {
@@ -270,7 +708,8 @@ class RAGEngine:
                      query_text: str,
                      top_k: int = 5,
                      system_prompt: Optional[str] = None,
-                     llm_service: Optional[str] = None):
+                     llm_service: Optional[str] = None,
+                     skip_retrieval: bool = False):
         """
         스트리밍 방식으로 쿼리를 처리하여 관련 문서를 검색하고 LLM으로 응답 생성
         
@@ -279,6 +718,7 @@ class RAGEngine:
             top_k (int): 검색할 최대 결과 수 (기본값: 5)
             system_prompt (Optional[str]): 시스템 프롬프트 (기본값: None)
             llm_service (Optional[str]): 사용할 LLM 서비스 (기본값: None, 현재 설정된 서비스 사용)
+            skip_retrieval (bool): 임베딩/검색 없이 바로 응답을 생성할지 여부 (기본값: False)
             
         Yields:
             str: 응답 토큰
@@ -293,15 +733,22 @@ class RAGEngine:
                 
             logger.info(f"스트리밍 쿼리 처리 시작: '{query_text[:50]}...' (서비스: {llm_service})")
             
-            # 질의 임베딩
-            query_embedding = self.embedding_model.embed_query(query_text)
-            
-            # 벡터 DB에서 유사한 청크 검색
-            search_results = self.vector_db.search(query_embedding, top_k=top_k)
+            # 호출자가 검색 생략을 요청하면 임베딩/검색 없이 바로 응답 생성
+            if skip_retrieval:
+                search_results = []
+            else:
+                # 질의 임베딩 (동기 연산이므로 이벤트 루프를 막지 않도록 별도 스레드에서 실행)
+                query_embedding = await self._aembed_query(query_text)
+                
+                # 벡터 DB에서 유사한 청크 검색
+                search_results = await asyncio.to_thread(self.vector_db.search, query_embedding, top_k=top_k)
             
-            # 검색 결과가 없는 경우
+            # 검색 결과가 없는 경우 (검색을 생략한 경우 포함)
             if not search_results:
-                logger.warning("검색 결과가 없습니다.")
+                if skip_retrieval:
+                    logger.info("요청에 따라 문서 검색을 생략합니다.")
+                else:
+                    logger.warning("검색 결과가 없습니다.")
                 
                 # 그래도 LLM에 질의는 전송 (검색 결과 없이)
                 if system_prompt:
@@ -317,26 +764,15 @@ class RAGEngine:
                     
                 return
                 
-            # 참조 문서 정보 수집
-            references = self._collect_references(search_results)
-            
-            # 컨텍스트 구성
+            # 컨텍스트 구성 (스트리밍 응답에서는 참조 문서 정보를 사용하지 않으므로 수집하지 않음)
             context = self._build_context(search_results)
             
-            # LLM 프롬프트 구성
-            if system_prompt:
-                # 시스템 프롬프트가 있는 경우
-                prompt = self._build_rag_prompt_with_system(
-                    query=query_text,
-                    context=context,
-                    system_prompt=system_prompt
-                )
-            else:
-                # 시스템 프롬프트가 없는 경우
-                prompt = self._build_rag_prompt(
-                    query=query_text,
-                    context=context
-                )
+            # LLM 프롬프트 구성 (시스템 프롬프트가 있으면 앞에 추가)
+            prompt = self._build_rag_prompt(
+                query=query_text,
+                context=context,
+                system_prompt=system_prompt
+            )
                 
             # LLM 스트리밍 응답 생성
             async for token in self.llm_connector.generate_stream_response(
@@ -387,42 +823,108 @@ class RAGEngine:
         """
         return self.current_llm_service
     
-    def _collect_references(self, search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _aembed_query(self, query_text: str) -> np.ndarray:
         """
-        참조 문서 정보를 수집합니다.
+        이벤트 루프를 막지 않고 질의를 임베딩합니다.
+        
+        질의는 공백 정규화 후 임베딩하므로, 공백만 다른 질의(재시도, 앞뒤 공백 등)가 임베딩 모델의
+        캐시를 함께 사용합니다. 동시에 들어온 질의들은 질의 작업 큐에서 모여 한 번의 embed_texts 호출로
+        임베딩됩니다.
+        
+        Args:
+            query_text (str): 사용자 질의 텍스트
+        
+        Returns:
+            np.ndarray: 질의 임베딩 벡터 (shape: [1, 임베딩 차원])
+        """
+        query_text = " ".join(query_text.split())
+        
+        # 빈 질의는 embed_query의 처리(영벡터 반환)를 그대로 사용
+        if not query_text:
+            return await asyncio.to_thread(self.embedding_model.embed_query, query_text)
+        
+        return await asyncio.wrap_future(self._query_batcher.submit([query_text]))
+    
+    def _lookup_results(self, search_results: List[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        검색 결과의 청크 정보와 문서 정보를 한 번에 조회합니다.
         
         Args:
             search_results (List[Dict[str, Any]]): 검색 결과
         
         Returns:
-            List[Dict[str, Any]]: 참조 문서 정보 목록
+            Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]: (청크 ID: 청크 정보, 문서 ID: 문서 정보)
+        """
+        chunks_by_id = self.vector_db.get_chunks_by_ids([result["chunk_id"] for result in search_results])
+        docs_by_id = self.vector_db.get_documents_by_ids(list({result["doc_id"] for result in search_results}))
+        return chunks_by_id, docs_by_id
+    
+    def _collect_references_and_context(self,
+                                        search_results: List[Dict[str, Any]],
+                                        include_references: bool = True) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        참조 문서 정보 수집과 컨텍스트 구성을 한 번의 순회로 처리합니다.
+        
+        저장된 청크 토큰 수의 합이 컨텍스트 토큰 예산을 넘게 되는 청크는 건너뜁니다
+        (첫 청크는 항상 포함, 토큰 수가 없는 이전 청크는 0으로 계산).
+        
+        Args:
+            search_results (List[Dict[str, Any]]): 검색 결과
+            include_references (bool): 참조 문서 정보도 수집할지 여부 (False이면 빈 목록 반환)
+        
+        Returns:
+            Tuple[List[Dict[str, Any]], List[str]]: (참조 문서 정보 목록, 컨텍스트 목록)
         """
+        chunks_by_id, docs_by_id = self._lookup_results(search_results)
+        token_budget = self.config.get("context_token_budget", CONTEXT_TOKEN_BUDGET)
+        
         references = []
+        referenced_doc_ids = set()
+        context = []
+        context_tokens = 0
         for result in search_results:
-            chunk_id = result["chunk_id"]
             doc_id = result["doc_id"]
             
             # 전체 청크 정보 가져오기
-            chunk_info = self.vector_db.get_chunk_by_id(chunk_id)
-            doc_info = self.vector_db.get_document_by_id(doc_id)
+            chunk_info = chunks_by_id.get(str(result["chunk_id"]))
+            doc_info = docs_by_id.get(str(doc_id))
             
             if chunk_info and doc_info:
+                # 컨텍스트 토큰 예산을 넘기는 청크는 제외
+                n_tokens = chunk_info.get("n_tokens", 0)
+                if context and context_tokens + n_tokens > token_budget:
+                    continue
+                context_tokens += n_tokens
+                
                 # 실제 전체 텍스트가 메타데이터에 없을 수 있음 (미리보기만 저장했을 수 있음)
                 chunk_text = chunk_info.get("text", "")
                 
-                # 참조 문서 정보 추가
-                reference = {
-                    "doc_id": doc_id,
-                    "title": doc_info.get("title", f"문서 {doc_id}"),
-                    "similarity": result["similarity"],
-                    "preview": chunk_text[:100] + ("..." if len(chunk_text) > 100 else "")
-                }
+                # 컨텍스트에 추가
+                context.append(chunk_text)
                 
                 # 중복 제거 (같은 문서는 한 번만 참조에 포함)
-                if not any(ref["doc_id"] == doc_id for ref in references):
-                    references.append(reference)
+                if include_references and doc_id not in referenced_doc_ids:
+                    referenced_doc_ids.add(doc_id)
+                    references.append({
+                        "doc_id": doc_id,
+                        "title": doc_info.get("title", f"문서 {doc_id}"),
+                        "similarity": result["similarity"],
+                        "preview": chunk_text[:100] + ("..." if len(chunk_text) > 100 else "")
+                    })
+        
+        return references, context
+    
+    def _collect_references(self, search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        참조 문서 정보를 수집합니다.
+        
+        Args:
+            search_results (List[Dict[str, Any]]): 검색 결과
         
-        return references
+        Returns:
+            List[Dict[str, Any]]: 참조 문서 정보 목록
+        """
+        return self._collect_references_and_context(search_results)[0]
     
     def _build_context(self, search_results: List[Dict[str, Any]]) -> List[str]:
         """
@@ -434,40 +936,25 @@ class RAGEngine:
         Returns:
             List[str]: 컨텍스트 목록
         """
-        context = []
-        for result in search_results:
-            chunk_id = result["chunk_id"]
-            doc_id = result["doc_id"]
-            
-            # 전체 청크 정보 가져오기
-            chunk_info = self.vector_db.get_chunk_by_id(chunk_id)
-            doc_info = self.vector_db.get_document_by_id(doc_id)
-            
-            if chunk_info and doc_info:
-                # 실제 전체 텍스트가 메타데이터에 없을 수 있음 (미리보기만 저장했을 수 있음)
-                chunk_text = chunk_info.get("text", "")
-                
-                # 컨텍스트에 추가
-                context.append(chunk_text)
-        
-        return context
+        return self._collect_references_and_context(search_results, include_references=False)[1]
     
-    def _build_rag_prompt(self, query: str, context: List[str]) -> str:
+    def _build_rag_prompt(self, query: str, context: List[str], system_prompt: Optional[str] = None) -> str:
         """
         RAG 프롬프트를 구성합니다.
         
         Args:
             query (str): 질의 텍스트
             context (List[str]): 컨텍스트 목록
+            system_prompt (Optional[str]): 시스템 프롬프트 (있으면 프롬프트 앞에 추가)
         
         Returns:
             str: RAG 프롬프트
         """
-        prompt = f"질문: {query}\n\n"
+        parts = [f"{system_prompt}\n\n질문: {query}\n\n" if system_prompt else f"질문: {query}\n\n"]
         for i, ctx in enumerate(context):
-            prompt += f"문서 {i+1}:\n{ctx}\n\n"
-        
-        return prompt
+            label = PROMPT_DOC_LABELS[i] if i < PROMPT_MAX_DOCS else f"문서 {i+1}:\n"
+            parts += (label, ctx, "\n\n")
+        return "".join(parts)
     
     def _build_rag_prompt_with_system(self, query: str, context: List[str], system_prompt: str) -> str:
         """
@@ -481,11 +968,7 @@ class RAGEngine:
         Returns:
             str: RAG 프롬프트
         """
-        prompt = f"{system_prompt}\n\n질문: {query}\n\n"
-        for i, ctx in enumerate(context):
-            prompt += f"문서 {i+1}:\n{ctx}\n\n"
-        
-        return prompt
+        return self._build_rag_prompt(query, context, system_prompt)
     
     def get_documents(self) -> List[Dict[str, Any]]:
         """
@@ -538,7 +1021,7 @@ class RAGEngine:
             Dict[str, Any]: 엔진 정보
         """
         return {
-            "embedding_model": self.embedding_model.model_name,
+            "embedding_model": self._embedding_model_name,
             "llm_service": self.current_llm_service,
             "chunk_size": self.chunk_size,
             "chunk_overlap": self.chunk_overlap
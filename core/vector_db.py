@@ -2,6 +2,7 @@
 벡터 데이터베이스 관리 모듈 - FAISS를 사용한 벡터 저장 및 검색
 """
 import os
+import glob
 import json
 import shutil
 import logging
@@ -10,9 +11,27 @@ from typing import List, Dict, Optional, Tuple, Any
 from pathlib import Path
 import faiss
 import pickle
+from contextlib import contextmanager
+
+# 선택적 고속 JSON 처리 (orjson이 설치되지 않은 경우 표준 json 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 # 내부 모듈
 from utils.common import setup_logger, get_project_root, get_timestamp
+from core._embedding_kernels import l2_normalize
 
 # 로거 설정
 logger = setup_logger(
@@ -20,20 +39,146 @@ logger = setup_logger(
     os.path.join(get_project_root(), "logs", "vector_db.log")
 )
 
+# 벡터 DB 디렉토리 안의 파일 이름
+INDEX_FILE_NAME = "faiss_index.bin"
+METADATA_FILE_NAME = "metadata.json"
+
+# 근사 검색(IVF-PQ) 인덱스 설정
+# - 벡터 수가 IVF_TRAIN_SIZE에 도달하면 플랫 인덱스를 학습된 IVF-PQ 인덱스로 전환
+# - 기본 구성은 4비트 PQ 고속 스캔(SIMD 조회표) 후보를 float16으로 저장된 벡터로 재정렬
+#   (재정렬 단계에서만 복원하므로 float32 대비 메모리/디스크 사용량 절반, int8은 "Refine(SQ8)")
+# - 구성의 "{nlist}"는 학습 시점의 벡터 수 N에 맞춰 max(IVF_MIN_NLIST, 4·√N)개 클러스터로 결정
+#   (클러스터당 학습 벡터가 IVF_MIN_POINTS_PER_CENTROID개 이상이 되도록 제한)
+# - IVF_NPROBE: 검색 시 탐색할 클러스터 수 (클수록 정확하지만 느림)
+# - IVF_K_REFINE_FACTOR: 재정렬을 위해 top_k의 몇 배수만큼 후보를 가져올지
+DEFAULT_INDEX_FACTORY = "IVF{nlist},PQ32x4fs,Refine(SQfp16)"
+IVF_TRAIN_SIZE = 50000
+IVF_NPROBE = 16
+IVF_K_REFINE_FACTOR = 5
+IVF_MIN_NLIST = 64
+IVF_MIN_POINTS_PER_CENTROID = 39
+
+# 플랫 인덱스(IVF 전환 전) 벡터 저장 형식
+# - "fp32": 원본 그대로 (차원당 4바이트)
+# - "fp16": 반정밀도 스칼라 양자화 (차원당 2바이트, 학습 불필요)
+# - "sq8": 8비트 스칼라 양자화 (차원당 1바이트, 차원별 값 범위 학습 필요)
+#   학습 표본이 SQ8_MIN_TRAIN_VECTORS개 모일 때까지는 fp16으로 저장하다가 모이면 학습하여 전환
+FLAT_QUANTIZATIONS = {
+    "fp32": None,
+    "fp16": faiss.ScalarQuantizer.QT_fp16,
+    "sq8": faiss.ScalarQuantizer.QT_8bit,
+}
+DEFAULT_QUANTIZATION = "fp16"
+SQ8_MIN_TRAIN_VECTORS = 1000
+
+# FAISS(OpenMP) 스레드 수 기본값 (여러 워커 프로세스가 코어를 과점하지 않도록 코어 수의 절반)
+FAISS_NUM_THREADS = max(1, (os.cpu_count() or 1) // 2)
+
+# 삭제 표시(톰스톤)된 벡터가 전체 벡터의 이 비율을 넘으면 저장 시 인덱스에서 실제로 제거
+COMPACT_DELETED_RATIO = 0.1
+
+# 청크 메타데이터에 저장할 미리보기 길이 (문자 수)
+CHUNK_PREVIEW_LENGTH = 200
+
+# 저장 시 백업(.bak) 생성 주기 (몇 번 저장할 때마다 한 번 백업할지)
+BACKUP_INTERVAL = 50
+# 파일별로 남겨 둘 최근 백업 수
+BACKUP_KEEP = 5
+
+@contextmanager
+def _omp_threads(num_threads: int):
+    """
+    블록 안에서 FAISS(OpenMP) 스레드 수를 지정하고 끝나면 원래 값으로 복원
+    
+    OpenMP 스레드 수는 호출한 스레드마다 따로 적용되므로 검색/학습을 호출하는 쪽에서 설정합니다.
+    
+    Args:
+        num_threads (int): 사용할 스레드 수
+    """
+    previous = faiss.omp_get_max_threads()
+    if previous == num_threads:
+        yield
+        return
+    
+    faiss.omp_set_num_threads(num_threads)
+    try:
+        yield
+    finally:
+        faiss.omp_set_num_threads(previous)
+
 class VectorDB:
     """
     벡터 데이터베이스 관리 클래스 - FAISS를 이용한 벡터 저장 및 검색
+    
+    문서 추가/삭제는 기본적으로 바로 저장되며, 여러 문서를 한 번에 넣을 때는
+    `with db:` 블록 안에서 처리하면 블록이 끝날 때 한 번만 저장합니다.
     """
     
-    def __init__(self, db_path: Optional[str] = None, dimension: int = 768):
+    def __init__(self,
+                 db_path: Optional[str] = None,
+                 dimension: Optional[int] = 768,
+                 index_factory: Optional[str] = DEFAULT_INDEX_FACTORY,
+                 nprobe: int = IVF_NPROBE,
+                 train_size: int = IVF_TRAIN_SIZE,
+                 k_refine_factor: float = IVF_K_REFINE_FACTOR,
+                 quantization: str = DEFAULT_QUANTIZATION,
+                 num_threads: Optional[int] = None,
+                 read_only: bool = False):
         """
         벡터 데이터베이스 초기화
         
         Args:
             db_path (Optional[str]): 벡터 DB 저장 경로. 
                 None인 경우 기본 경로 사용 (data/vector_db)
-            dimension (int): 벡터 차원 (기본값: 768)
+            dimension (Optional[int]): 벡터 차원 (기본값: 768, None이면 저장된 인덱스의 차원 사용)
+            index_factory (Optional[str]): 벡터 수가 train_size에 도달했을 때 전환할 FAISS 인덱스 구성
+                (기본값: "IVF{nlist},PQ32x4fs,Refine(SQfp16)", None이면 항상 플랫 인덱스 사용)
+            nprobe (int): IVF 인덱스 검색 시 탐색할 클러스터 수 (기본값: 16)
+            train_size (int): IVF 인덱스 학습에 사용할 벡터 수이자 전환 기준 (기본값: 50000)
+            k_refine_factor (float): 재정렬 인덱스 사용 시 top_k 대비 후보 배수 (기본값: 5)
+            quantization (str): 새 플랫 인덱스의 벡터 저장 형식 ("fp32", "fp16", "sq8", 기본값: "fp16").
+                기존 인덱스를 로드한 경우 저장된 형식을 사용
+            num_threads (Optional[int]): 여러 쿼리 검색 및 IVF 학습에 쓸 FAISS 스레드 수
+                (기본값: None, 코어 수의 절반). 단일 쿼리 검색은 항상 1개 스레드 사용
+            read_only (bool): 읽기 전용 모드 (기본값: False). 문서 추가/삭제와 저장을 막고 인덱스 파일을
+                메모리 매핑으로 엶. 메모리 매핑은 IVF 인덱스에만 효과가 있어 검색한 클러스터만 페이지 캐시로
+                읽으며, 플랫 인덱스는 일반 로드와 같이 전체를 메모리로 읽음.
+                이전 형식 인덱스는 변환이 필요하므로 읽기 전용으로 열 수 없음
+        
+        Raises:
+            RuntimeError: 읽기 전용 모드에서 이전 형식 인덱스를 연 경우
         """
+        if quantization not in FLAT_QUANTIZATIONS:
+            raise ValueError(
+                f"지원하지 않는 양자화 형식입니다: {quantization} "
+                f"(지원: {', '.join(FLAT_QUANTIZATIONS)})"
+            )
+        
+        # 근사 검색 인덱스 설정
+        self.index_factory = index_factory
+        self.nprobe = nprobe
+        self.train_size = train_size
+        self.k_refine_factor = k_refine_factor
+        self.quantization = quantization
+        self.num_threads = num_threads or FAISS_NUM_THREADS
+        self.read_only = read_only
+        
+        # 입력 벡터 변환 경고를 이미 출력했는지 여부 (한 번만 출력)
+        self._conversion_warned = False
+        
+        # 삭제 표시만 되고 아직 인덱스에 남아 있는 벡터 ID와, 이를 제외하는 검색 파라미터 캐시
+        self._deleted = set()
+        self._search_params = None
+        
+        # 저장 지연 상태 (with 블록 중첩 깊이, 저장되지 않은 변경 여부, 저장 횟수)
+        self._batch_depth = 0
+        self._dirty_metadata = False
+        self._dirty_index = False
+        self._flush_count = 0
+        
+        # 내용 변경 횟수 (문서 추가/삭제마다 증가, 검색 결과 캐시의 무효화 판단에 사용)
+        self.version = 0
+        
         # 기본 경로 설정
         if db_path is None:
             self.db_path = os.path.join(get_project_root(), "data", "vector_db")
@@ -44,8 +189,8 @@ class VectorDB:
         os.makedirs(self.db_path, exist_ok=True)
         
         # 인덱스 파일 경로
-        self.index_path = os.path.join(self.db_path, "faiss_index.bin")
-        self.metadata_path = os.path.join(self.db_path, "metadata.json")
+        self.index_path = os.path.join(self.db_path, INDEX_FILE_NAME)
+        self.metadata_path = os.path.join(self.db_path, METADATA_FILE_NAME)
         
         # 차원 저장
         self.dimension = dimension
@@ -62,8 +207,9 @@ class VectorDB:
         # 메타데이터 초기화
         if os.path.exists(self.metadata_path):
             try:
-                with open(self.metadata_path, 'r', encoding='utf-8') as f:
-                    self.metadata = json.load(f)
+                with open(self.metadata_path, 'rb') as f:
+                    self.metadata = _json_loads(f.read())
+                self._deleted = set(self.metadata.get("deleted_ids", []))
                 logger.info(f"메타데이터 로드 완료: {len(self.metadata['documents'])}개 문서")
             except Exception as e:
                 logger.error(f"메타데이터 로드 오류: {str(e)}")
@@ -74,21 +220,404 @@ class VectorDB:
         # FAISS 인덱스 초기화
         if os.path.exists(self.index_path):
             try:
-                self.index = faiss.read_index(self.index_path)
+                if self.read_only:
+                    # 메모리 매핑: IVF 인덱스는 역색인 목록을 전부 읽지 않고 여러 프로세스가 페이지 캐시를 공유
+                    # (플랫 인덱스에는 적용되지 않아 전체를 읽음)
+                    self.index = faiss.read_index(
+                        self.index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                    )
+                else:
+                    self.index = faiss.read_index(self.index_path)
                 logger.info(f"FAISS 인덱스 로드 완료: {self.index.ntotal}개 벡터")
                 
                 # 차원이 메타데이터와 일치하는지 확인
-                if self.index.d != self.dimension:
+                if self.dimension is not None and self.index.d != self.dimension:
                     logger.warning(
                         f"로드된 인덱스의 차원({self.index.d})이 설정된 차원({self.dimension})과 다릅니다. "
                         "로드된 인덱스의 차원을 사용합니다."
                     )
-                    self.dimension = self.index.d
+                self.dimension = self.index.d
+                self.quantization = self.metadata.get("quantization", "fp32")
             except Exception as e:
                 logger.error(f"FAISS 인덱스 로드 오류: {str(e)}")
                 self._create_new_index()
         else:
             self._create_new_index()
+        
+        # 이전 형식(벡터 위치를 ID로 사용하거나 L2 거리 기반)의 인덱스는 정규화된 내적 인덱스로 변환
+        # (읽기 전용 모드에서는 변환 결과를 저장할 수 없으므로 변환하지 않고 오류 발생)
+        if self._uses_vector_positions() or not self._uses_inner_product():
+            if self.read_only:
+                error_msg = (
+                    f"이전 형식의 인덱스는 읽기 전용 모드로 열 수 없습니다: {self.index_path} "
+                    "(쓰기 모드로 한 번 열어 변환한 뒤 사용하세요)"
+                )
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+            self._migrate_legacy_index()
+        
+        self._configure_ivf()
+    
+    def _configure_ivf(self):
+        """
+        현재 인덱스가 IVF 인덱스이면 검색 파라미터(nprobe, 재정렬 후보 배수) 설정
+        """
+        ivf = faiss.try_extract_index_ivf(self.index)
+        if ivf is not None:
+            ivf.nprobe = self.nprobe
+        
+        inner = self._unwrap_id_map()
+        if isinstance(inner, faiss.IndexRefine):
+            inner.k_factor = self.k_refine_factor
+    
+    def _unwrap_id_map(self):
+        """
+        ID 매핑 래퍼를 벗긴 실제 인덱스 반환
+        
+        Returns:
+            faiss.Index: 내부 인덱스 (래퍼가 없으면 현재 인덱스)
+        """
+        if isinstance(self.index, (faiss.IndexIDMap, faiss.IndexIDMap2)):
+            return faiss.downcast_index(self.index.index)
+        return self.index
+    
+    def _uses_inner_product(self) -> bool:
+        """
+        현재 인덱스가 내적(정규화된 벡터의 코사인 유사도) 기반인지 확인
+        
+        이전에 만든 인덱스는 L2 거리 기반일 수 있으므로 인덱스에서 직접 확인합니다.
+        
+        Returns:
+            bool: 내적 기반이면 True
+        """
+        return self.index.metric_type == faiss.METRIC_INNER_PRODUCT
+    
+    def _prepare_vectors(self, vectors: np.ndarray, name: str = "vectors", allow_1d: bool = True) -> np.ndarray:
+        """
+        입력 벡터를 검증하고 FAISS에 넘길 float32 연속 배열로 변환 (내적 인덱스면 단위 길이로 정규화)
+        
+        float32/float16 이외의 자료형이나 연속되지 않은 배열은 변환 복사가 필요하므로 처음 한 번 경고합니다.
+        정규화는 변환 복사본에 제자리로 수행하며, 변환 없이 입력 배열을 그대로 쓰게 되는 경우에만
+        한 번 복사하므로 호출자의 배열은 바뀌지 않습니다.
+        
+        Args:
+            vectors (np.ndarray): (N, D) 또는 (D,) 벡터 (float16 입력 및 리스트 허용)
+            name (str): 오류/경고 메시지에 표시할 인자 이름
+            allow_1d (bool): (D,) 형태의 단일 벡터를 허용할지 여부 (기본값: True)
+            
+        Returns:
+            np.ndarray: (N, D) float32 배열 (입력 배열과 메모리를 공유하지 않음, 단 정규화하지 않는 L2 인덱스는 예외)
+            
+        Raises:
+            ValueError: 배열 차원이나 벡터 차원이 인덱스와 맞지 않는 경우
+        """
+        original = vectors
+        vectors = np.asarray(vectors)
+        if not allow_1d and vectors.ndim != 2:
+            error_msg = f"{name} 배열은 2차원이어야 합니다 (입력 차원: {vectors.ndim})"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        vectors = np.atleast_2d(vectors)
+        if vectors.ndim != 2 or vectors.shape[1] != self.index.d:
+            error_msg = f"{name}의 형태 {vectors.shape}가 인덱스 차원({self.index.d})과 맞지 않습니다."
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if not self._conversion_warned and (
+            vectors.dtype not in (np.float32, np.float16) or not vectors.flags.c_contiguous
+        ):
+            logger.warning(
+                f"{name}이(가) float32 연속 배열이 아니어서 변환합니다 "
+                f"(자료형: {vectors.dtype}, 연속 배열: {vectors.flags.c_contiguous})"
+            )
+            self._conversion_warned = True
+        
+        # 이미 float32 연속 배열이면 복사 없이 그대로 사용
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if not self._uses_inner_product():
+            return vectors
+        
+        # 변환 복사가 일어나지 않았거나(호출자 배열) 쓰기 불가 배열이면 정규화 전에 복사
+        if (not vectors.flags.writeable
+                or (isinstance(original, np.ndarray) and np.shares_memory(vectors, original))):
+            vectors = vectors.copy()
+        l2_normalize(vectors)
+        return vectors
+    
+    def _get_search_params(self) -> Optional[faiss.SearchParameters]:
+        """
+        삭제 표시된 벡터를 FAISS 안에서 제외하는 검색 파라미터 반환 (삭제 표시가 바뀔 때만 새로 생성)
+        
+        Returns:
+            Optional[faiss.SearchParameters]: 검색 파라미터 (삭제 표시가 없으면 None)
+        """
+        if not self._deleted:
+            return None
+        
+        if self._search_params is None:
+            deleted = np.fromiter(self._deleted, dtype=np.int64, count=len(self._deleted))
+            batch = faiss.IDSelectorBatch(deleted)
+            selector = faiss.IDSelectorNot(batch)
+            ivf = faiss.try_extract_index_ivf(self.index)
+            inner = self._unwrap_id_map()
+            
+            # FAISS 객체는 서로를 포인터로만 참조하므로 파이썬 쪽에서 함께 보관
+            refs = [batch, selector]
+            if isinstance(inner, faiss.IndexRefine):
+                # 재정렬 인덱스는 ID 매핑이 변환한 선택자를 기본 인덱스에 넘기지 않으므로
+                # 내부 위치 -> 청크 ID 변환 선택자를 기본 인덱스 파라미터에 직접 지정
+                translated = faiss.IDSelectorTranslated(self.index.id_map, selector)
+                base_params = faiss.SearchParametersIVF() if ivf is not None else faiss.SearchParameters()
+                base_params.sel = translated
+                if ivf is not None:
+                    base_params.nprobe = self.nprobe
+                params = faiss.IndexRefineSearchParameters()
+                params.k_factor = self.k_refine_factor
+                params.base_index_params = base_params
+                refs += [translated, base_params]
+            elif ivf is not None:
+                params = faiss.SearchParametersIVF()
+                params.nprobe = self.nprobe
+                params.sel = selector
+            else:
+                params = faiss.SearchParameters()
+                params.sel = selector
+            
+            self._search_params = (params, refs)
+        
+        return self._search_params[0]
+    
+    def _compact(self):
+        """
+        삭제 표시된 벡터를 인덱스에서 실제로 제거하고 삭제 표시 초기화
+        """
+        if not self._deleted:
+            return
+        
+        count = len(self._deleted)
+        self._remove_ids(np.fromiter(self._deleted, dtype=np.int64, count=count))
+        self._deleted.clear()
+        self._search_params = None
+        logger.info(f"삭제 표시된 벡터 {count}개 제거 완료 (남은 벡터: {self.index.ntotal}개)")
+    
+    def compact(self):
+        """
+        삭제 표시된 벡터를 인덱스에서 실제로 제거하고 저장
+        
+        삭제 표시가 전체의 COMPACT_DELETED_RATIO를 넘으면 저장 시 자동으로 수행되며,
+        한가한 시간에 직접 호출할 수도 있습니다.
+        """
+        self._check_writable()
+        if not self._deleted:
+            return
+        
+        self._compact()
+        self._mark_dirty()
+    
+    def _is_ivf(self) -> bool:
+        """
+        현재 인덱스가 IVF(근사 검색) 인덱스인지 확인
+        
+        Returns:
+            bool: IVF 인덱스 여부
+        """
+        return faiss.try_extract_index_ivf(self.index) is not None
+    
+    def _export_vectors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        인덱스에 저장된 모든 벡터와 해당 ID 반환
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (int64 ID 배열, float32 벡터 배열)
+        """
+        inner = self._unwrap_id_map()
+        vectors = inner.reconstruct_n(0, inner.ntotal)
+        if inner is self.index:
+            ids = np.arange(inner.ntotal, dtype=np.int64)
+        else:
+            ids = faiss.vector_to_array(self.index.id_map)
+        return ids, vectors
+    
+    def _uses_vector_positions(self) -> bool:
+        """
+        인덱스가 이전 형식(청크 메타데이터의 vector_index로 벡터 위치를 기록)인지 확인
+        
+        Returns:
+            bool: 이전 형식이면 True
+        """
+        if not isinstance(self.index, (faiss.IndexIDMap, faiss.IndexIDMap2)):
+            return True
+        return any("vector_index" in chunk_info for chunk_info in self.metadata["chunks"].values())
+    
+    def _migrate_legacy_index(self):
+        """
+        이전 형식 인덱스를 청크 ID를 벡터 ID로 쓰는 정규화된 내적 인덱스로 다시 구성
+        
+        - 벡터 위치를 ID로 쓰던 인덱스는 청크 메타데이터의 vector_index로 청크 ID를 찾고 기록을 제거
+        - L2 거리 기반 인덱스는 정규화되지 않은 벡터를 담고 있으므로 정규화하여 내적 인덱스에 다시 추가
+          (L2 인덱스에 단위 벡터가 섞이면 크기가 작은 벡터가 항상 가까워져 검색 순위가 깨짐)
+        - 삭제 표시된 벡터는 이때 함께 제거
+        """
+        logger.info("이전 형식 인덱스 변환 시작...")
+        ids, vectors = self._export_vectors()
+        
+        if self._uses_vector_positions():
+            # 벡터 위치 -> 청크 ID 대응표를 정렬된 배열로 만들어 한 번에 조회
+            mapped = [
+                (chunk_info["vector_index"], int(chunk_id))
+                for chunk_id, chunk_info in self.metadata["chunks"].items()
+                if "vector_index" in chunk_info
+            ]
+            positions = np.array([p for p, _ in mapped], dtype=np.int64)
+            position_chunk_ids = np.array([c for _, c in mapped], dtype=np.int64)
+            order = np.argsort(positions, kind="stable")
+            positions, position_chunk_ids = positions[order], position_chunk_ids[order]
+            
+            slots = np.searchsorted(positions, ids)
+            keep = slots < len(positions)
+            keep[keep] = positions[slots[keep]] == ids[keep]
+            ids, vectors = position_chunk_ids[slots[keep]], vectors[keep]
+            
+            for chunk_info in self.metadata["chunks"].values():
+                chunk_info.pop("vector_index", None)
+            self.metadata.pop("next_vector_index", None)
+        
+        if self._deleted:
+            keep = ~np.isin(ids, np.fromiter(self._deleted, dtype=np.int64, count=len(self._deleted)))
+            ids, vectors = ids[keep], vectors[keep]
+            self._deleted.clear()
+            self._search_params = None
+        
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        l2_normalize(vectors)
+        
+        self.index = self._new_flat_index(self.index.d)
+        if len(ids):
+            self.index.add_with_ids(vectors, ids)
+        self.metadata["quantization"] = self.quantization
+        
+        # 벡터 수가 충분하면 8비트 양자화 또는 근사 검색 인덱스로 다시 전환
+        self._maybe_train_sq8()
+        self._maybe_train_ivf()
+        
+        self._save_metadata()
+        self._save_index()
+        logger.info(f"이전 형식 인덱스 변환 완료 ({self.index.ntotal}개 벡터)")
+    
+    def _remove_ids(self, ids: np.ndarray):
+        """
+        인덱스에서 주어진 ID의 벡터 삭제
+        
+        IVF 인덱스(ID 매핑은 내부 번호가 당겨진다고 가정하지만 IVF는 번호를 유지함)와
+        재정렬 인덱스처럼 직접 삭제를 지원하지 않는 구성은 남길 벡터만 다시 추가합니다
+        (학습 결과는 유지되므로 재학습은 하지 않음).
+        
+        Args:
+            ids (np.ndarray): 삭제할 벡터 ID 배열 (int64)
+        """
+        if not self._is_ivf():
+            try:
+                self.index.remove_ids(ids)
+                return
+            except RuntimeError:
+                pass
+        
+        all_ids, vectors = self._export_vectors()
+        keep = ~np.isin(all_ids, ids)
+        
+        self.index.reset()
+        if keep.any():
+            self.index.add_with_ids(vectors[keep], all_ids[keep])
+    
+    def _resolve_index_factory(self, num_vectors: int) -> str:
+        """
+        인덱스 구성의 "{nlist}" 자리에 벡터 수에 맞는 클러스터 수를 채움
+        
+        Args:
+            num_vectors (int): 학습 시점의 벡터 수
+            
+        Returns:
+            str: FAISS index_factory 구성 문자열
+        """
+        if "{nlist}" not in self.index_factory:
+            return self.index_factory
+        
+        train_count = min(num_vectors, self.train_size)
+        nlist = max(IVF_MIN_NLIST, int(4 * np.sqrt(num_vectors)))
+        nlist = max(1, min(nlist, train_count // IVF_MIN_POINTS_PER_CENTROID))
+        return self.index_factory.replace("{nlist}", str(nlist))
+    
+    def _maybe_train_sq8(self):
+        """
+        저장 형식이 "sq8"이고 fp16으로 모아 둔 벡터가 SQ8_MIN_TRAIN_VECTORS개 이상이면
+        모든 벡터로 차원별 값 범위를 학습한 8비트 양자화 인덱스로 교체
+        
+        한두 개의 벡터로 학습하면 값 범위가 0에 가까워져 모든 벡터가 같은 코드로 저장되므로
+        충분한 표본이 모일 때까지 학습을 미룹니다. 벡터 ID(청크 ID)는 그대로 유지됩니다.
+        """
+        if self.quantization != "sq8" or self._is_ivf():
+            return
+        
+        inner = self._unwrap_id_map()
+        if (not isinstance(inner, faiss.IndexScalarQuantizer)
+                or inner.sq.qtype != faiss.ScalarQuantizer.QT_fp16
+                or inner.ntotal - len(self._deleted) < SQ8_MIN_TRAIN_VECTORS):
+            return
+        
+        self._compact()
+        ids, vectors = self._export_vectors()
+        new_index = faiss.IndexIDMap2(faiss.IndexScalarQuantizer(
+            self.index.d, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+        ))
+        with _omp_threads(self.num_threads):
+            new_index.train(vectors)
+            new_index.add_with_ids(vectors, ids)
+        
+        self.index = new_index
+        self._search_params = None
+        logger.info(f"8비트 양자화 인덱스 전환 완료 ({self.index.ntotal}개 벡터)")
+    
+    def _maybe_train_ivf(self):
+        """
+        플랫 인덱스의 벡터 수가 학습 기준에 도달하면 IVF-PQ 인덱스를 학습시켜 교체
+        
+        벡터 ID(청크 ID)는 그대로 유지됩니다.
+        """
+        if self.index_factory is None or self._is_ivf() or self.index.ntotal < self.train_size:
+            return
+        
+        try:
+            # 삭제 표시된 벡터는 학습 및 새 인덱스에서 제외
+            self._compact()
+            
+            index_factory = self._resolve_index_factory(self.index.ntotal)
+            logger.info(f"IVF 인덱스 학습 시작 (구성: {index_factory}, 벡터 수: {self.index.ntotal})")
+            ids, vectors = self._export_vectors()
+            
+            # 재정렬(Refine) 인덱스는 ID 지정 추가를 지원하지 않으므로 ID 매핑으로 감쌈
+            new_index = faiss.IndexIDMap2(
+                faiss.index_factory(self.index.d, index_factory, self.index.metric_type)
+            )
+            
+            # 학습은 최대 train_size개 표본으로 수행
+            with _omp_threads(self.num_threads):
+                if len(vectors) > self.train_size:
+                    sample = np.random.default_rng(0).choice(len(vectors), self.train_size, replace=False)
+                    new_index.train(vectors[sample])
+                else:
+                    new_index.train(vectors)
+                
+                new_index.add_with_ids(vectors, ids)
+            
+            self.index = new_index
+            self._search_params = None
+            self._configure_ivf()
+            logger.info(f"IVF 인덱스 전환 완료 ({self.index.ntotal}개 벡터)")
+        except Exception as e:
+            # 전환에 실패해도 플랫 인덱스로 계속 동작
+            logger.warning(f"IVF 인덱스 전환 실패, 플랫 인덱스를 유지합니다: {str(e)}")
+            self.index_factory = None
     
     def _create_new_metadata(self):
         """
@@ -105,49 +634,188 @@ class VectorDB:
         self._save_metadata()
         logger.info("새 메타데이터 생성 완료")
     
+    def _new_flat_index(self, dimension: int) -> faiss.Index:
+        """
+        저장 형식(quantization)에 맞는 빈 플랫 인덱스 생성
+        
+        정규화된 벡터의 내적(코사인 유사도) 기반이며, 청크 ID를 벡터 ID로 사용하여
+        ID로 바로 삭제할 수 있도록 ID 매핑으로 감쌉니다.
+        
+        Args:
+            dimension (int): 벡터 차원
+            
+        Returns:
+            faiss.Index: ID 매핑으로 감싼 플랫 인덱스
+        """
+        qtype = FLAT_QUANTIZATIONS[self.quantization]
+        if qtype == faiss.ScalarQuantizer.QT_8bit:
+            # 학습 표본이 모일 때까지 학습이 필요 없는 fp16으로 저장 (_maybe_train_sq8에서 전환)
+            qtype = faiss.ScalarQuantizer.QT_fp16
+        if qtype is None:
+            flat_index = faiss.IndexFlatIP(dimension)
+        else:
+            flat_index = faiss.IndexScalarQuantizer(dimension, qtype, faiss.METRIC_INNER_PRODUCT)
+        return faiss.IndexIDMap2(flat_index)
+    
     def _create_new_index(self):
         """
         새 FAISS 인덱스 생성
         """
-        # L2 거리 측정 기반 인덱스 생성
-        self.index = faiss.IndexFlatL2(self.dimension)
+        if self.dimension is None:
+            raise ValueError("새 FAISS 인덱스를 만들려면 벡터 차원이 필요합니다.")
+        
+        self.index = self._new_flat_index(self.dimension)
+        
+        # 저장 형식은 메타데이터에 기록 (인덱스 로드 시 복원)
+        self.metadata["quantization"] = self.quantization
+        self._save_metadata()
         
         # 인덱스 저장
-        faiss.write_index(self.index, self.index_path)
-        logger.info(f"새 FAISS 인덱스 생성 완료 (차원: {self.dimension})")
+        self._save_index(backup=False)
+        logger.info(f"새 FAISS 인덱스 생성 완료 (차원: {self.dimension}, 저장 형식: {self.quantization})")
     
-    def _save_metadata(self):
+    def __enter__(self) -> "VectorDB":
+        """
+        저장 지연 블록 시작 (블록 안의 추가/삭제는 블록이 끝날 때 한 번에 저장)
+        """
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        """
+        저장 지연 블록 종료 (가장 바깥 블록이 끝나면 변경사항 저장)
+        """
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+        return False
+    
+    def _mark_dirty(self, metadata: bool = True, index: bool = True):
+        """
+        변경사항을 기록하고, 저장 지연 블록 밖이면 바로 저장
+        
+        Args:
+            metadata (bool): 메타데이터 변경 여부
+            index (bool): 인덱스 변경 여부
+        """
+        self.version += 1
+        self._dirty_metadata |= metadata
+        self._dirty_index |= index
+        if self._batch_depth == 0:
+            self.flush()
+    
+    def flush(self):
+        """
+        저장되지 않은 변경사항을 파일에 저장 (백업은 BACKUP_INTERVAL번 저장마다 한 번 생성)
+        """
+        if not (self._dirty_metadata or self._dirty_index):
+            return
+        
+        # 삭제 표시가 많이 쌓였으면 인덱스에서 실제로 제거
+        if len(self._deleted) > COMPACT_DELETED_RATIO * self.index.ntotal:
+            self._compact()
+            self._dirty_metadata = self._dirty_index = True
+        
+        backup = self._flush_count % BACKUP_INTERVAL == 0
+        timestamp = get_timestamp() if backup else None
+        if self._dirty_metadata:
+            self._save_metadata(backup=backup, timestamp=timestamp)
+            self._dirty_metadata = False
+        if self._dirty_index:
+            self._save_index(backup=backup, timestamp=timestamp)
+            self._dirty_index = False
+        self._flush_count += 1
+    
+    def _check_writable(self):
+        """
+        읽기 전용 모드이면 오류 발생
+        
+        Raises:
+            RuntimeError: 읽기 전용 모드인 경우
+        """
+        if self.read_only:
+            error_msg = "읽기 전용 모드의 벡터 DB는 수정할 수 없습니다."
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+    
+    def _backup_file(self, path: str, timestamp: Optional[str] = None):
+        """
+        저장 직전의 파일을 백업하고 오래된 백업 정리
+        
+        새 파일은 임시 파일에 쓴 뒤 교체하므로 하드 링크만으로 이전 내용이 보존됩니다.
+        하드 링크를 만들 수 없는 파일 시스템에서는 복사합니다.
+        
+        Args:
+            path (str): 백업할 파일 경로
+            timestamp (Optional[str]): 백업 파일 이름에 붙일 시각 (기본값: None, 현재 시각)
+        """
+        if not os.path.exists(path):
+            return
+        
+        backup_path = f"{path}.{timestamp or get_timestamp()}.bak"
+        if not os.path.exists(backup_path):
+            try:
+                os.link(path, backup_path)
+            except OSError:
+                shutil.copy2(path, backup_path)
+            logger.debug(f"백업 생성: {backup_path}")
+        
+        # 시각 순으로 정렬되므로 최근 BACKUP_KEEP개만 남김
+        for old_path in sorted(glob.glob(f"{glob.escape(path)}.*.bak"))[:-BACKUP_KEEP]:
+            try:
+                os.remove(old_path)
+            except OSError as e:
+                logger.warning(f"오래된 백업 삭제 실패: {old_path} ({str(e)})")
+    
+    def _save_metadata(self, backup: bool = True, timestamp: Optional[str] = None):
         """
         메타데이터 저장
+        
+        Args:
+            backup (bool): 저장 전에 기존 파일을 백업할지 여부 (기본값: True)
+            timestamp (Optional[str]): 백업 파일 이름에 붙일 시각 (기본값: None, 현재 시각)
         """
+        if self.read_only:
+            return
+        
         try:
             # 백업 생성
-            if os.path.exists(self.metadata_path):
-                backup_path = f"{self.metadata_path}.{get_timestamp()}.bak"
-                shutil.copy2(self.metadata_path, backup_path)
-                logger.debug(f"메타데이터 백업 생성: {backup_path}")
-            
-            # 메타데이터 저장
-            with open(self.metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, ensure_ascii=False, indent=2)
+            if backup:
+                self._backup_file(self.metadata_path, timestamp)
+            
+            self.metadata["deleted_ids"] = sorted(self._deleted)
+            
+            # 메타데이터 저장 (들여쓰기 없는 UTF-8 JSON, 기존 파일과 같은 형식)
+            # 임시 파일에 쓴 뒤 교체하여 백업 링크가 이전 내용을 유지하도록 함
+            tmp_path = f"{self.metadata_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(self.metadata))
+            os.replace(tmp_path, self.metadata_path)
                 
             logger.debug("메타데이터 저장 완료")
         except Exception as e:
             logger.error(f"메타데이터 저장 중 오류 발생: {str(e)}")
     
-    def _save_index(self):
+    def _save_index(self, backup: bool = True, timestamp: Optional[str] = None):
         """
         FAISS 인덱스 저장
+        
+        Args:
+            backup (bool): 저장 전에 기존 파일을 백업할지 여부 (기본값: True)
+            timestamp (Optional[str]): 백업 파일 이름에 붙일 시각 (기본값: None, 현재 시각)
         """
+        if self.read_only:
+            return
+        
         try:
             # 백업 생성
-            if os.path.exists(self.index_path):
-                backup_path = f"{self.index_path}.{get_timestamp()}.bak"
-                shutil.copy2(self.index_path, backup_path)
-                logger.debug(f"인덱스 백업 생성: {backup_path}")
+            if backup:
+                self._backup_file(self.index_path, timestamp)
             
-            # 인덱스 저장
-            faiss.write_index(self.index, self.index_path)
+            # 인덱스 저장 (임시 파일에 쓴 뒤 교체)
+            tmp_path = f"{self.index_path}.tmp"
+            faiss.write_index(self.index, tmp_path)
+            os.replace(tmp_path, self.index_path)
             logger.debug(f"FAISS 인덱스 저장 완료 ({self.index.ntotal}개 벡터)")
         except Exception as e:
             logger.error(f"인덱스 저장 중 오류 발생: {str(e)}")
@@ -156,7 +824,8 @@ class VectorDB:
                     title: str, 
                     file_path: str, 
                     chunks: List[str], 
-                    embeddings: np.ndarray) -> int:
+                    embeddings: np.ndarray,
+                    token_counts: Optional[List[int]] = None) -> int:
         """
         문서와 해당 청크들을 벡터 DB에 추가
         
@@ -164,11 +833,14 @@ class VectorDB:
             title (str): 문서 제목
             file_path (str): 원본 파일 경로
             chunks (List[str]): 텍스트 청크 목록
-            embeddings (np.ndarray): 청크 임베딩 벡터 배열
+            embeddings (np.ndarray): 청크 임베딩 벡터 배열 (float16 입력 허용, 내부에서 float32로 변환)
+            token_counts (Optional[List[int]]): 청크별 토큰 수 (주어지면 청크 메타데이터의 "n_tokens"로 저장)
             
         Returns:
             int: 생성된 문서 ID
         """
+        self._check_writable()
+        
         if len(chunks) == 0 or embeddings.shape[0] == 0:
             error_msg = "빈 청크 또는 임베딩이 제공되었습니다."
             logger.error(error_msg)
@@ -178,45 +850,65 @@ class VectorDB:
             error_msg = f"청크 수({len(chunks)})와 임베딩 수({embeddings.shape[0]})가 일치하지 않습니다."
             logger.error(error_msg)
             raise ValueError(error_msg)
+        
+        # 메타데이터를 바꾸기 전에 벡터 검증 및 변환 (float32 연속 배열, 내적 인덱스면 정규화)
+        vectors = self._prepare_vectors(embeddings, "embeddings")
             
         try:
             # 새 문서 ID 할당
             doc_id = str(self.metadata["next_doc_id"])
             self.metadata["next_doc_id"] += 1
             
+            # 문서와 청크는 같은 등록 시각을 공유
+            created_at = get_timestamp()
+            
             # 문서 메타데이터 추가
             self.metadata["documents"][doc_id] = {
                 "title": title,
                 "file_path": file_path,
                 "chunk_count": len(chunks),
-                "created_at": get_timestamp()
+                "created_at": created_at
             }
             
+            # 청크 ID 할당 (청크 ID를 그대로 FAISS 벡터 ID로 사용)
+            first_chunk_id = self.metadata["next_chunk_id"]
+            self.metadata["next_chunk_id"] += len(chunks)
+            
             # 청크 벡터 FAISS에 추가
-            self.index.add(embeddings)
+            self.index.add_with_ids(
+                vectors,
+                np.arange(first_chunk_id, first_chunk_id + len(chunks), dtype=np.int64)
+            )
             
-            # 청크 메타데이터 추가
-            chunk_ids = []
-            for i, chunk_text in enumerate(chunks):
-                chunk_id = str(self.metadata["next_chunk_id"])
-                self.metadata["next_chunk_id"] += 1
-                
-                # 청크 메타데이터 저장
-                self.metadata["chunks"][chunk_id] = {
+            # 청크 메타데이터 추가 (미리보기만 저장)
+            previews = [
+                text[:CHUNK_PREVIEW_LENGTH] + "..." if len(text) > CHUNK_PREVIEW_LENGTH else text
+                for text in chunks
+            ]
+            chunk_ids = [str(first_chunk_id + i) for i in range(len(chunks))]
+            new_chunks = {
+                chunk_id: {
                     "doc_id": doc_id,
                     "index": i,
-                    "vector_index": self.index.ntotal - len(chunks) + i,
-                    "text": chunk_text[:200] + ("..." if len(chunk_text) > 200 else ""),  # 미리보기만 저장
-                    "created_at": get_timestamp()
+                    "text": previews[i],
+                    "created_at": created_at
                 }
-                chunk_ids.append(chunk_id)
+                for i, chunk_id in enumerate(chunk_ids)
+            }
+            if token_counts is not None:
+                for chunk_info, n_tokens in zip(new_chunks.values(), token_counts):
+                    chunk_info["n_tokens"] = int(n_tokens)
+            self.metadata["chunks"].update(new_chunks)
             
             # 문서에 청크 ID 목록 추가
             self.metadata["documents"][doc_id]["chunk_ids"] = chunk_ids
             
-            # 저장
-            self._save_metadata()
-            self._save_index()
+            # 벡터 수가 충분해지면 8비트 양자화 또는 근사 검색 인덱스로 전환
+            self._maybe_train_sq8()
+            self._maybe_train_ivf()
+            
+            # 저장 (저장 지연 블록 안이면 블록이 끝날 때 저장)
+            self._mark_dirty()
             
             logger.info(f"문서 '{title}' 추가 완료 (ID: {doc_id}, 청크 수: {len(chunks)})")
             return int(doc_id)
@@ -236,60 +928,89 @@ class VectorDB:
         Returns:
             List[Dict[str, Any]]: 유사도 상위 청크 정보 및 메타데이터
         """
+        return self.search_batch(np.reshape(query_vector, (1, -1)), top_k)[0]
+    
+    def search_batch(self, query_vectors: np.ndarray, top_k: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        여러 쿼리 벡터를 한 번의 FAISS 검색으로 처리
+        
+        Args:
+            query_vectors (np.ndarray): (M, D) 쿼리 임베딩 행렬 (리스트 허용)
+            top_k (int): 쿼리마다 검색할 최대 결과 수 (기본값: 5)
+            
+        Returns:
+            List[List[Dict[str, Any]]]: 쿼리 순서대로 유사도 상위 청크 정보 목록
+        """
+        # 2차원 float32 연속 배열로 검증 및 변환 (내적 인덱스면 정규화)
+        query_vectors = self._prepare_vectors(query_vectors, "query_vectors", allow_1d=False)
+        
         if self.index.ntotal == 0:
             logger.warning("검색할 벡터가 없습니다.")
-            return []
+            return [[] for _ in range(len(query_vectors))]
             
         try:
-            # 벡터가 2D 배열이 아니면 변환
-            if len(query_vector.shape) == 1:
-                query_vector = query_vector.reshape(1, -1)
-            
-            # 상위 K개 검색
-            distances, indices = self.index.search(query_vector, top_k)
-            
-            results = []
-            for i, (distance, idx) in enumerate(zip(distances[0], indices[0])):
-                # 잘못된 인덱스 건너뛰기
-                if idx == -1:
-                    continue
-                
-                # 해당 벡터 인덱스를 가진 청크 찾기
-                chunk_id = None
-                chunk_info = None
-                
-                for c_id, c_info in self.metadata["chunks"].items():
-                    if c_info["vector_index"] == idx:
-                        chunk_id = c_id
-                        chunk_info = c_info
-                        break
-                
-                if chunk_id is None:
-                    logger.warning(f"인덱스 {idx}에 해당하는 청크 정보를 찾을 수 없습니다.")
-                    continue
-                
-                # 문서 정보 가져오기
-                doc_id = chunk_info["doc_id"]
-                doc_info = self.metadata["documents"][doc_id]
-                
-                # 결과 추가
-                results.append({
-                    "chunk_id": chunk_id,
-                    "doc_id": doc_id,
-                    "doc_title": doc_info["title"],
-                    "chunk_index": chunk_info["index"],
-                    "similarity": float(1.0 / (1.0 + distance)),  # 거리를 유사도로 변환
-                    "distance": float(distance),
-                    "text_preview": chunk_info["text"]
-                })
-            
-            logger.debug(f"쿼리에 대해 {len(results)}개 결과 검색 완료")
+            # 상위 K개 검색 (모든 쿼리를 한 번에, 단일 쿼리는 메모리 대역폭이 병목이므로 1개 스레드)
+            num_threads = self.num_threads if len(query_vectors) > 1 else 1
+            with _omp_threads(num_threads):
+                scores, indices = self.index.search(
+                    query_vectors, top_k, params=self._get_search_params()
+                )
+            results = [self._postprocess_hits(row_scores, row_indices)
+                       for row_scores, row_indices in zip(scores, indices)]
+            
+            logger.debug(f"{len(results)}개 쿼리에 대해 검색 완료")
             return results
             
         except Exception as e:
             logger.error(f"검색 중 오류 발생: {str(e)}")
             raise
     
+    def _postprocess_hits(self, scores: np.ndarray, indices: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        FAISS 검색 결과 한 행을 청크 정보 목록으로 변환
+        
+        인덱스는 항상 정규화된 벡터의 내적 기반이므로 점수가 그대로 코사인 유사도이며,
+        "distance"는 코사인 거리(1 - 유사도)입니다.
+        
+        Args:
+            scores (np.ndarray): 검색 점수 (코사인 유사도)
+            indices (np.ndarray): 벡터 ID (-1은 결과 없음)
+            
+        Returns:
+            List[Dict[str, Any]]: 유사도 상위 청크 정보 및 메타데이터
+        """
+        # 결과 처리는 NumPy 스칼라 대신 파이썬 값으로 (ID가 곧 청크 ID이므로 조회는 dict 한 번)
+        results = []
+        for score, idx in zip(scores.tolist(), indices.tolist()):
+            # 잘못된 인덱스 건너뛰기
+            if idx == -1:
+                continue
+            
+            # 벡터 ID가 곧 청크 ID
+            chunk_id = str(idx)
+            chunk_info = self.metadata["chunks"].get(chunk_id)
+            
+            if chunk_info is None:
+                logger.warning(f"인덱스 {idx}에 해당하는 청크 정보를 찾을 수 없습니다.")
+                continue
+            
+            # 문서 정보 가져오기
+            doc_id = chunk_info["doc_id"]
+            doc_info = self.metadata["documents"][doc_id]
+            
+            # 결과 추가
+            results.append({
+                "chunk_id": chunk_id,
+                "doc_id": doc_id,
+                "doc_title": doc_info["title"],
+                "chunk_index": chunk_info["index"],
+                "similarity": score,
+                "distance": 1.0 - score,
+                "text_preview": chunk_info["text"]
+            })
+        
+        return results
+    
     def get_document_by_id(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """
         ID로 문서 정보 조회
@@ -316,6 +1037,32 @@ class VectorDB:
         chunk_id = str(chunk_id)  # 문자열로 변환
         return self.metadata["chunks"].get(chunk_id)
     
+    def get_documents_by_ids(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 문서 정보를 한 번에 조회
+        
+        Args:
+            doc_ids (List[str]): 문서 ID 목록
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: 존재하는 문서 정보 (ID: 문서정보)
+        """
+        documents = self.metadata["documents"]
+        return {doc_id: documents[doc_id] for doc_id in map(str, doc_ids) if doc_id in documents}
+    
+    def get_chunks_by_ids(self, chunk_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 청크 정보를 한 번에 조회
+        
+        Args:
+            chunk_ids (List[str]): 청크 ID 목록
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: 존재하는 청크 정보 (ID: 청크정보)
+        """
+        chunks = self.metadata["chunks"]
+        return {chunk_id: chunks[chunk_id] for chunk_id in map(str, chunk_ids) if chunk_id in chunks}
+    
     def get_all_documents(self) -> Dict[str, Dict[str, Any]]:
         """
         모든 문서 정보 조회
@@ -352,6 +1099,7 @@ class VectorDB:
         Returns:
             bool: 삭제 성공 여부
         """
+        self._check_writable()
         doc_id = str(doc_id)  # 문자열로 변환
         
         if doc_id not in self.metadata["documents"]:
@@ -362,59 +1110,23 @@ class VectorDB:
             # 문서에 속한 청크 ID 목록 가져오기
             chunk_ids = self.metadata["documents"][doc_id].get("chunk_ids", [])
             
-            # 벡터 인덱스 목록 구성
-            vector_indices = []
+            # 청크 메타데이터 삭제 및 삭제할 벡터 ID(청크 ID) 목록 구성
+            vector_ids = []
             for chunk_id in chunk_ids:
                 if chunk_id in self.metadata["chunks"]:
-                    vector_idx = self.metadata["chunks"][chunk_id].get("vector_index")
-                    if vector_idx is not None:
-                        vector_indices.append(vector_idx)
-                    
-                    # 청크 메타데이터 삭제
+                    vector_ids.append(int(chunk_id))
                     del self.metadata["chunks"][chunk_id]
             
-            # 현재 FAISS는 벡터 삭제를 직접 지원하지 않으므로 재구성 필요
-            # 이 부분은 간단한 구현을 위해 새 인덱스를 만들고 유지할 벡터만 복사
-            if vector_indices:
-                logger.info(f"문서 {doc_id} 삭제로 인한 인덱스 재구성 시작...")
-                
-                # 전체 벡터 수
-                total_vectors = self.index.ntotal
-                
-                # 유지할 벡터 인덱스 구성 (삭제할 것 제외)
-                keep_indices = [i for i in range(total_vectors) if i not in vector_indices]
-                
-                if keep_indices:
-                    # 유지할 벡터만 가져오기
-                    keep_vectors = np.zeros((len(keep_indices), self.index.d), dtype=np.float32)
-                    for new_idx, old_idx in enumerate(keep_indices):
-                        # FAISS는 직접 벡터 접근을 제공하지 않으므로 검색으로 가져옴
-                        # 정확히 일치하는 벡터를 찾기 위해 해당 인덱스 벡터로 검색
-                        original_vec = np.array([[0.0] * self.index.d], dtype=np.float32)
-                        self.index.reconstruct(old_idx, original_vec.reshape(-1))
-                        keep_vectors[new_idx] = original_vec
-                    
-                    # 청크 메타데이터의 벡터 인덱스 업데이트
-                    index_mapping = {old_idx: new_idx for new_idx, old_idx in enumerate(keep_indices)}
-                    for chunk_id, chunk_info in self.metadata["chunks"].items():
-                        old_idx = chunk_info["vector_index"]
-                        if old_idx in index_mapping:
-                            chunk_info["vector_index"] = index_mapping[old_idx]
-                    
-                    # 새 인덱스 생성 및 벡터 추가
-                    new_index = faiss.IndexFlatL2(self.index.d)
-                    new_index.add(keep_vectors)
-                    self.index = new_index
-                else:
-                    # 유지할 벡터가 없으면 빈 인덱스로 초기화
-                    self._create_new_index()
+            # 벡터는 삭제 표시만 하고 검색에서 제외 (인덱스에서 실제 제거는 압축 시 일괄 처리)
+            if vector_ids:
+                self._deleted.update(vector_ids)
+                self._search_params = None
             
             # 문서 메타데이터 삭제
             del self.metadata["documents"][doc_id]
             
-            # 변경사항 저장
-            self._save_metadata()
-            self._save_index()
+            # 변경사항 저장 (인덱스는 그대로이므로 메타데이터만, 저장 지연 블록 안이면 블록이 끝날 때 저장)
+            self._mark_dirty(index=False)
             
             logger.info(f"문서 ID {doc_id} 및 관련 청크 {len(chunk_ids)}개 삭제 완료")
             return True
@@ -433,13 +1145,15 @@ class VectorDB:
         try:
             doc_count = len(self.metadata["documents"])
             chunk_count = len(self.metadata["chunks"])
-            vector_count = self.index.ntotal
+            vector_count = self.index.ntotal - len(self._deleted)
             
             return {
                 "document_count": doc_count,
                 "chunk_count": chunk_count,
                 "vector_count": vector_count,
+                "deleted_vector_count": len(self._deleted),
                 "dimension": self.dimension,
+                "quantization": self.quantization,
                 "db_path": self.db_path
             }
         except Exception as e:
@@ -452,7 +1166,10 @@ class VectorDB:
         
         외부에서 호출 가능한 공개 메서드입니다.
         """
+        self._check_writable()
         logger.info("인덱스 및 메타데이터 저장 시작")
-        self._save_metadata()
-        self._save_index()
+        timestamp = get_timestamp()
+        self._save_metadata(timestamp=timestamp)
+        self._save_index(timestamp=timestamp)
+        self._dirty_metadata = self._dirty_index = False
         logger.info("인덱스 및 메타데이터 저장 완료")
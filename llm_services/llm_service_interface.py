@@ -1,8 +1,9 @@
 """
 LLM 서비스 인터페이스 모듈
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Generator, Any, Optional
+from typing import Dict, Generator, AsyncGenerator, Any, Optional
 
 
 class ILLMService(ABC):
@@ -37,6 +38,42 @@ class ILLMService(ABC):
         """
         pass
     
+    async def agenerate_response(self, prompt: str) -> str:
+        """
+        프롬프트에 대한 응답을 비동기로 생성합니다.
+        
+        기본 구현은 동기 generate_response를 별도 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
+        네이티브 비동기 클라이언트가 있는 서비스는 재정의할 수 있습니다.
+        
+        Args:
+            prompt (str): LLM에 전달할 프롬프트
+            
+        Returns:
+            str: LLM 응답 텍스트
+        """
+        return await asyncio.to_thread(self.generate_response, prompt)
+    
+    async def agenerate_stream_response(self, prompt: str) -> AsyncGenerator[Any, None]:
+        """
+        프롬프트에 대한 스트리밍 응답을 비동기로 생성합니다.
+        
+        기본 구현은 동기 제너레이터의 각 단계를 별도 스레드에서 실행합니다.
+        
+        Args:
+            prompt (str): LLM에 전달할 프롬프트
+            
+        Yields:
+            Any: 응답 토큰
+        """
+        iterator = self.generate_stream_response(prompt)
+        done = object()
+        
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, done)
+            if chunk is done:
+                break
+            yield chunk
+    
     @abstractmethod
     def is_available(self) -> bool:
         """
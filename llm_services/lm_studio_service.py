@@ -2,10 +2,13 @@
 LM Studio API 서비스 구현 모듈
 """
 import json
+import asyncio
 import logging
 import requests
-from typing import Dict, Generator, Any, Optional
+import aiohttp
+from typing import Dict, Generator, AsyncGenerator, Any, Optional
 
+from utils.common import discard_session
 from .llm_service_interface import ILLMService
 
 
@@ -28,6 +31,101 @@ class LMStudioService(ILLMService):
         self.logger = logger or logging.getLogger(__name__)
         self.model = "LM Studio Model"  # LM Studio에서는 모델 이름이 고정되지 않을 수 있음
         
+        # 비동기 요청용 HTTP 세션 (이벤트 루프 안에서 처음 사용할 때 생성, 연결 재사용)
+        # 세션은 만든 이벤트 루프에 묶이므로 루프를 함께 기록하고 루프가 바뀌면 다시 생성
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _build_headers(self) -> Dict[str, str]:
+        """
+        API 요청 헤더를 구성합니다.
+        
+        Returns:
+            Dict[str, str]: 요청 헤더
+        """
+        headers = {
+            "Content-Type": "application/json"
+        }
+        
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        
+        return headers
+    
+    def _build_payload(self, prompt: str, stream: bool) -> Dict[str, Any]:
+        """
+        채팅 완성 API 요청 본문을 구성합니다.
+        
+        Args:
+            prompt (str): LLM에 전달할 프롬프트
+            stream (bool): 스트리밍 응답 여부
+            
+        Returns:
+            Dict[str, Any]: 요청 본문
+        """
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 2048,
+            "stream": stream
+        }
+    
+    def _parse_stream_line(self, line: str) -> Optional[str]:
+        """
+        스트리밍 응답의 한 줄(SSE)에서 응답 토큰을 추출합니다.
+        
+        Args:
+            line (str): 스트리밍 응답 한 줄
+            
+        Returns:
+            Optional[str]: 응답 토큰 (토큰이 없으면 None)
+        """
+        try:
+            data = json.loads(line)
+            if 'choices' in data and len(data['choices']) > 0:
+                delta = data['choices'][0].get('delta', {})
+                if 'content' in delta:
+                    return delta['content']
+        except json.JSONDecodeError as e:
+            self.logger.error(f"JSON 파싱 오류: {str(e)} - {line}")
+        
+        return None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        비동기 요청에 사용할 HTTP 세션을 반환합니다.
+        
+        같은 이벤트 루프 안에서는 세션을 재사용하고, 다른 루프에서 사용하면 새로 만듭니다.
+        
+        Returns:
+            aiohttp.ClientSession: 연결을 재사용하는 HTTP 세션
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is not loop:
+            discard_session(self._session, self._session_loop)
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._build_headers(),
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def aclose(self):
+        """
+        비동기 HTTP 세션을 닫습니다.
+        """
+        if self._session is not None and not self._session.closed:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+            else:
+                discard_session(self._session, self._session_loop)
+        self._session = None
+        self._session_loop = None
+        
     def generate_response(self, prompt: str) -> str:
         """
         프롬프트에 대한 응답을 생성합니다.
@@ -39,22 +137,8 @@ class LMStudioService(ILLMService):
             str: LLM 응답 텍스트
         """
         try:
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-                
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.7,
-                "max_tokens": 2048,
-                "stream": False
-            }
+            headers = self._build_headers()
+            payload = self._build_payload(prompt, stream=False)
             
             response = requests.post(
                 f"{self.api_base_url}/chat/completions",
@@ -87,22 +171,8 @@ class LMStudioService(ILLMService):
             Generator[str, None, None]: 응답 토큰을 생성하는 제너레이터
         """
         try:
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-                
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.7,
-                "max_tokens": 2048,
-                "stream": True
-            }
+            headers = self._build_headers()
+            payload = self._build_payload(prompt, stream=True)
             
             response = requests.post(
                 f"{self.api_base_url}/chat/completions",
@@ -129,18 +199,79 @@ class LMStudioService(ILLMService):
                     
                     if line == "[DONE]":
                         break
+                    
+                    content = self._parse_stream_line(line)
+                    if content is not None:
+                        yield content
                         
-                    try:
-                        data = json.loads(line)
-                        if 'choices' in data and len(data['choices']) > 0:
-                            delta = data['choices'][0].get('delta', {})
-                            if 'content' in delta:
-                                content = delta['content']
-                                yield content
-                    except json.JSONDecodeError as e:
-                        self.logger.error(f"JSON 파싱 오류: {str(e)} - {line}")
+        except Exception as e:
+            error_msg = f"LM Studio 스트리밍 응답 생성 중 오류 발생: {str(e)}"
+            self.logger.error(error_msg)
+            yield f"오류: {error_msg}"
+    
+    async def agenerate_response(self, prompt: str) -> str:
+        """
+        프롬프트에 대한 응답을 비동기로 생성합니다.
+        
+        Args:
+            prompt (str): LLM에 전달할 프롬프트
+            
+        Returns:
+            str: LLM 응답 텍스트
+        """
+        try:
+            async with self._get_session().post(
+                f"{self.api_base_url}/chat/completions",
+                json=self._build_payload(prompt, stream=False)
+            ) as response:
+                if response.status != 200:
+                    error_msg = f"LM Studio API 요청 실패: {response.status} - {await response.text()}"
+                    self.logger.error(error_msg)
+                    return f"오류: {error_msg}"
+                
+                response_data = await response.json()
+                return response_data['choices'][0]['message']['content']
+            
+        except Exception as e:
+            error_msg = f"LM Studio 응답 생성 중 오류 발생: {str(e)}"
+            self.logger.error(error_msg)
+            return f"오류: {error_msg}"
+    
+    async def agenerate_stream_response(self, prompt: str) -> AsyncGenerator[str, None]:
+        """
+        프롬프트에 대한 스트리밍 응답을 비동기로 생성합니다.
+        
+        Args:
+            prompt (str): LLM에 전달할 프롬프트
+            
+        Yields:
+            str: 응답 토큰
+        """
+        try:
+            async with self._get_session().post(
+                f"{self.api_base_url}/chat/completions",
+                json=self._build_payload(prompt, stream=True)
+            ) as response:
+                if response.status != 200:
+                    error_msg = f"LM Studio API 스트리밍 요청 실패: {response.status} - {await response.text()}"
+                    self.logger.error(error_msg)
+                    yield f"오류: {error_msg}"
+                    return
+                
+                # 스트리밍 응답 처리 (줄 단위)
+                async for raw_line in response.content:
+                    line = raw_line.decode('utf-8').strip()
+                    if not line.startswith('data: '):
                         continue
-                        
+                    
+                    line = line[6:]  # 'data: ' 부분 제거
+                    if line == "[DONE]":
+                        break
+                    
+                    content = self._parse_stream_line(line)
+                    if content is not None:
+                        yield content
+            
         except Exception as e:
             error_msg = f"LM Studio 스트리밍 응답 생성 중 오류 발생: {str(e)}"
             self.logger.error(error_msg)
@@ -0,0 +1,137 @@
+"""
+묶음 질의 응답 분리 테스트 스크립트
+답변 표식 파싱과, 표식이 어긋난 경우 질문별 개별 호출로 처리하는 동작 테스트
+"""
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# 내부 모듈
+from core.llm_service import LLMService, _split_batch_answers, BATCH_ANSWER_MARKER
+
+
+def _batch_text(*answers: str) -> str:
+    """
+    답변 목록을 표식이 붙은 묶음 응답 텍스트로 결합
+
+    Args:
+        *answers (str): 질문 순서대로의 답변
+
+    Returns:
+        str: 묶음 응답 텍스트
+    """
+    return "\n".join(f"{BATCH_ANSWER_MARKER.format(index=i + 1)}\n{answer}" for i, answer in enumerate(answers))
+
+
+class _ScriptedLLMService(LLMService):
+    """
+    네트워크 호출 없이 미리 정한 응답을 반환하는 LLM 서비스 (묶음 응답은 batch_reply 사용)
+    """
+
+    def __init__(self, batch_reply: str):
+        super().__init__(provider="lmstudio")
+        self.batch_reply = batch_reply
+        self.calls: List[str] = []
+
+    def generate_response(self,
+                          prompt: str,
+                          context: Optional[List[str]] = None,
+                          system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        self.calls.append(prompt)
+        text = self.batch_reply if BATCH_ANSWER_MARKER.format(index="번호") in prompt else f"개별 답변: {prompt}"
+        return {"text": text, "model": self.model, "elapsed_time": 0.1, "success": True}
+
+
+def test_split_well_formed_answers():
+    """
+    표식이 순서대로 있으면 질문별 답변으로 분리되는지 테스트
+    """
+    text = "다음은 답변입니다.\n" + _batch_text("첫 번째 답변", "두 번째\n여러 줄 답변", "세 번째 답변")
+
+    assert _split_batch_answers(text, 3) == ["첫 번째 답변", "두 번째\n여러 줄 답변", "세 번째 답변"]
+
+
+def test_split_allows_marker_padding():
+    """
+    표식 줄 앞뒤의 공백은 허용되는지 테스트
+    """
+    text = "  ###ANSWER 1###  \n답변 A\n\t###ANSWER 2###\n답변 B\n"
+
+    assert _split_batch_answers(text, 2) == ["답변 A", "답변 B"]
+
+
+def test_split_rejects_mismatched_markers():
+    """
+    표식이 빠지거나, 순서가 다르거나, 답변이 비어 있으면 None을 반환하는지 테스트
+    """
+    assert _split_batch_answers(_batch_text("답변 A", "답변 B"), 3) is None
+    assert _split_batch_answers("###ANSWER 2###\n답변 B\n###ANSWER 1###\n답변 A", 2) is None
+    assert _split_batch_answers(_batch_text("답변 A", "   "), 2) is None
+    assert _split_batch_answers("표식 없는 답변", 2) is None
+
+    # 줄 중간에 있는 표식은 표식으로 보지 않음
+    assert _split_batch_answers("###ANSWER 1###\n답변 A 그리고 ###ANSWER 2### 답변 B", 2) is None
+
+
+def test_generate_batch_uses_split_answers():
+    """
+    묶음 응답이 올바르면 한 번의 호출로 질문별 결과를 만드는지 테스트
+    """
+    service = _ScriptedLLMService(_batch_text("답변 A", "답변 B"))
+
+    results = service.generate_batch(["질문 A", "질문 B"])
+
+    assert len(service.calls) == 1
+    assert [result["text"] for result in results] == ["답변 A", "답변 B"]
+    assert all(result["success"] and result["batched"] for result in results)
+
+
+def test_generate_batch_falls_back_to_single_calls():
+    """
+    묶음 응답을 분리할 수 없으면 질문별 개별 호출 결과를 반환하는지 테스트
+    """
+    service = _ScriptedLLMService("표식을 지키지 않은 응답")
+
+    results = service.generate_batch(["질문 A", "질문 B"])
+
+    assert service.calls[1:] == ["질문 A", "질문 B"]
+    assert [result["text"] for result in results] == ["개별 답변: 질문 A", "개별 답변: 질문 B"]
+    assert not any(result.get("batched") for result in results)
+
+
+def main():
+    """
+    메인 함수
+    """
+    tests = [
+        test_split_well_formed_answers,
+        test_split_allows_marker_padding,
+        test_split_rejects_mismatched_markers,
+        test_generate_batch_uses_split_answers,
+        test_generate_batch_falls_back_to_single_calls,
+    ]
+
+    print(f"\n{'=' * 60}")
+    print(f"묶음 응답 분리 테스트 시작")
+    print(f"{'=' * 60}")
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"- {test.__name__}: 통과")
+        except AssertionError as e:
+            failed += 1
+            print(f"- {test.__name__}: 실패 {str(e)}")
+
+    print(f"\n{'=' * 60}")
+    print(f"테스트 완료 (실패: {failed}개)")
+    print(f"{'=' * 60}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
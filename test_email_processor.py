@@ -0,0 +1,118 @@
+"""
+이메일 처리기 테스트 스크립트
+프로젝트에 포함된 Windsurf.eml 파일의 메타데이터, 본문, 첨부 파일 추출 결과 테스트
+"""
+import os
+import sys
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# 내부 모듈
+from core.email_processor import EmailProcessor, EmailResult, AttachmentInfo
+from utils.common import get_project_root
+
+
+# 테스트용 EML 파일
+SAMPLE_EML_PATH = os.path.join(get_project_root(), "Windsurf.eml")
+
+# 기대하는 첨부 파일 (파일 이름, 형식, 디코딩한 크기(바이트))
+EXPECTED_ATTACHMENTS = [
+    AttachmentInfo(filename="Invoice-6818F766-0001.pdf", content_type="application/pdf", size=134431),
+    AttachmentInfo(filename="Receipt-2503-6322.pdf", content_type="application/pdf", size=146878),
+]
+
+
+def test_metadata():
+    """
+    인코딩된 헤더(제목 등)가 디코딩되어 메타데이터로 추출되는지 테스트
+    """
+    result = EmailProcessor().process_file(SAMPLE_EML_PATH)
+
+    assert isinstance(result, EmailResult)
+    assert result.metadata["subject"] == "Windsurf 영수증 #2503-6322"
+    assert result.metadata["from"] == "Windsurf <invoice+statements+acct_1NRMxXFKuRRGjKOF@stripe.com>"
+    assert result.metadata["to"] == "serendipity.code@gmail.com"
+    assert result.metadata["date"] == "Sun, 06 Apr 2025 23:38:52 +0000"
+    assert result.file_path == SAMPLE_EML_PATH
+
+
+def test_content_is_plain_text():
+    """
+    HTML 본문이 태그 없는 텍스트로 변환되고 한글 내용이 유지되는지 테스트
+    """
+    result = EmailProcessor().process_file(SAMPLE_EML_PATH)
+
+    assert "Windsurf 영수증 US$15.00 2025년 4월 6일에 결제됨" in result.content
+    assert "contact@codeium.com" in result.content
+    assert "<" not in result.content
+    assert result.content == result.content.strip()
+
+
+def test_attachments():
+    """
+    첨부 파일 정보가 추출되고, 추정 크기가 디코딩한 크기와 같은지 테스트
+    """
+    estimated = EmailProcessor().process_file(SAMPLE_EML_PATH)
+    exact = EmailProcessor(exact_size=True).process_file(SAMPLE_EML_PATH)
+
+    assert exact.attachments == EXPECTED_ATTACHMENTS
+    assert estimated.attachments == EXPECTED_ATTACHMENTS
+
+
+def test_to_dict():
+    """
+    이전 형식(딕셔너리)으로 변환한 결과 테스트
+    """
+    data = EmailProcessor().process_file(SAMPLE_EML_PATH).to_dict()
+
+    assert set(data) == {"metadata", "content", "attachments", "file_path"}
+    assert data["attachments"] == [attachment.to_dict() for attachment in EXPECTED_ATTACHMENTS]
+
+
+def test_process_files_matches_process_file():
+    """
+    여러 파일 병렬 처리 결과가 파일별 처리 결과와 같고 입력 순서를 유지하는지 테스트
+    """
+    processor = EmailProcessor()
+    missing_path = os.path.join(get_project_root(), "missing.eml")
+
+    results = processor.process_files([SAMPLE_EML_PATH, missing_path, SAMPLE_EML_PATH], workers=2)
+
+    expected = processor.process_file(SAMPLE_EML_PATH)
+    assert results == [expected, None, expected]
+
+
+def main():
+    """
+    메인 함수
+    """
+    tests = [
+        test_metadata,
+        test_content_is_plain_text,
+        test_attachments,
+        test_to_dict,
+        test_process_files_matches_process_file,
+    ]
+
+    print(f"\n{'=' * 60}")
+    print(f"이메일 처리기 테스트 시작")
+    print(f"{'=' * 60}")
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"- {test.__name__}: 통과")
+        except AssertionError as e:
+            failed += 1
+            print(f"- {test.__name__}: 실패 {str(e)}")
+
+    print(f"\n{'=' * 60}")
+    print(f"테스트 완료 (실패: {failed}개)")
+    print(f"{'=' * 60}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
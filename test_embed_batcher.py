@@ -0,0 +1,146 @@
+"""
+임베딩 작업 큐 테스트 스크립트
+취소된 요청이나 임베딩 오류가 같은 묶음의 다른 요청과 작업 스레드에 영향을 주지 않는지 테스트
+"""
+import os
+import sys
+import asyncio
+import threading
+from typing import List
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# 내부 모듈
+from core.rag_engine import _EmbedBatcher
+
+
+# 테스트 설정 (임베딩 차원, 결과 대기 시간(초))
+DIMENSION = 8
+RESULT_TIMEOUT = 5.0
+
+
+class _GatedEmbeddingModel:
+    """
+    첫 호출을 gate가 열릴 때까지 붙잡아 두는 임베딩 모델 (그동안 다음 요청들이 큐에 쌓이도록 함)
+    """
+
+    device = "cpu"
+
+    def __init__(self, fail_texts: List[str] = ()):
+        self.started = threading.Event()
+        self.gate = threading.Event()
+        self.fail_texts = set(fail_texts)
+        self.calls: List[List[str]] = []
+
+    def embed_texts(self, texts: List[str], batch_size=None) -> np.ndarray:
+        self.calls.append(list(texts))
+        self.started.set()
+        self.gate.wait(RESULT_TIMEOUT)
+        if self.fail_texts.intersection(texts):
+            raise RuntimeError("임베딩 실패")
+        return np.full((len(texts), DIMENSION), len(self.calls), dtype=np.float32)
+
+
+def _block_worker(batcher: _EmbedBatcher, model: _GatedEmbeddingModel):
+    """
+    첫 요청으로 작업 스레드를 임베딩 중 상태로 붙잡아 두고 그 요청의 Future 반환
+    """
+    first = batcher.submit(["첫 요청"])
+    assert model.started.wait(RESULT_TIMEOUT)
+    return first
+
+
+def test_cancelled_request_does_not_block_batch():
+    """
+    같은 묶음으로 모일 요청 중 하나를 취소해도 나머지 요청이 완료되는지 테스트
+    """
+    model = _GatedEmbeddingModel()
+    batcher = _EmbedBatcher(model, max_texts=16, max_wait=0.05)
+    first = _block_worker(batcher, model)
+
+    cancelled = batcher.submit(["취소할 질의"])
+    kept = batcher.submit(["남은 질의"])
+    assert cancelled.cancel()
+
+    model.gate.set()
+
+    assert first.result(RESULT_TIMEOUT).shape == (1, DIMENSION)
+    assert kept.result(RESULT_TIMEOUT).shape == (1, DIMENSION)
+    assert cancelled.cancelled()
+    assert model.calls[-1] == ["남은 질의"]
+    assert batcher._worker.is_alive()
+
+
+def test_cancelled_async_query_does_not_block_batch():
+    """
+    asyncio 작업 취소(wait_for 시간 초과 등)로 취소된 질의가 같은 묶음의 다른 질의를 막지 않는지 테스트
+    """
+    model = _GatedEmbeddingModel()
+    batcher = _EmbedBatcher(model, max_texts=16, max_wait=0.05)
+    _block_worker(batcher, model)
+
+    async def run():
+        cancelled = asyncio.ensure_future(asyncio.wrap_future(batcher.submit(["취소할 질의"])))
+        kept = asyncio.ensure_future(asyncio.wrap_future(batcher.submit(["남은 질의"])))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        model.gate.set()
+        return await asyncio.wait_for(kept, RESULT_TIMEOUT)
+
+    assert asyncio.run(run()).shape == (1, DIMENSION)
+    assert batcher._worker.is_alive()
+
+
+def test_embedding_error_keeps_worker_alive():
+    """
+    임베딩 오류는 해당 묶음의 요청에만 전달되고 작업 스레드는 다음 요청을 계속 처리하는지 테스트
+    """
+    model = _GatedEmbeddingModel(fail_texts=["실패할 청크"])
+    batcher = _EmbedBatcher(model, max_texts=16, max_wait=0.05)
+    model.gate.set()
+
+    failed = batcher.submit(["실패할 청크"])
+    try:
+        failed.result(RESULT_TIMEOUT)
+        assert False, "임베딩 오류가 전달되지 않았습니다."
+    except RuntimeError:
+        pass
+
+    assert batcher.submit(["다음 청크"]).result(RESULT_TIMEOUT).shape == (1, DIMENSION)
+    assert batcher._worker.is_alive()
+
+
+def main():
+    """
+    메인 함수
+    """
+    tests = [
+        test_cancelled_request_does_not_block_batch,
+        test_cancelled_async_query_does_not_block_batch,
+        test_embedding_error_keeps_worker_alive,
+    ]
+
+    print(f"\n{'=' * 60}")
+    print(f"임베딩 작업 큐 테스트 시작")
+    print(f"{'=' * 60}")
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"- {test.__name__}: 통과")
+        except AssertionError as e:
+            failed += 1
+            print(f"- {test.__name__}: 실패 {str(e)}")
+
+    print(f"\n{'=' * 60}")
+    print(f"테스트 완료 (실패: {failed}개)")
+    print(f"{'=' * 60}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ from dotenv import load_dotenv
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # 내부 모듈
-from core.llm_service import LLMService
+from core.llm_service import get_llm_service
 from utils.common import setup_logger
 
 # 로거 설정
@@ -43,7 +43,7 @@ def test_lmstudio_response(model_name=None, stream=False):
     
     try:
         # LM Studio 서비스 초기화
-        llm = LLMService(
+        llm = get_llm_service(
             provider="lmstudio",
             model=model_name,
             temperature=0.7,
@@ -121,7 +121,7 @@ def test_openai_response(model_name=None, stream=False):
     
     try:
         # OpenAI 서비스 초기화
-        llm = LLMService(
+        llm = get_llm_service(
             provider="openai",
             model=model_name,
             api_key=api_key,
@@ -0,0 +1,126 @@
+"""
+텍스트 분할기 테스트 스크립트
+SpanTextSplitter가 기존 RecursiveCharacterTextSplitter와 같은 청크를 만드는지 테스트
+"""
+import os
+import sys
+import random
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+# 내부 모듈
+from core._text_splitter import SpanTextSplitter
+from utils.common import get_project_root
+
+
+# RAG 엔진에서 사용하는 구분자
+RAG_SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
+
+# 무작위 비교 시 텍스트를 구성할 조각 (겹치는 구분자, 한글, 공백 포함)
+RANDOM_PIECES = ["가", "나", "a", "b", "\n", "\n", "\n\n", " ", " ", ". ", "."]
+RANDOM_SEPARATORS = [RAG_SEPARATORS, ["\n\n", "\n", " "], [". ", "\n"], ["aa", "\n", ""]]
+RANDOM_TRIALS = 300
+
+
+def _assert_same_chunks(text: str, **kwargs):
+    """
+    두 분할기의 결과가 같은지 확인
+
+    Args:
+        text (str): 분할할 텍스트
+        **kwargs: 분할기 생성 인자
+    """
+    expected = RecursiveCharacterTextSplitter(**kwargs).split_text(text)
+    actual = SpanTextSplitter(**kwargs).split_text(text)
+    assert actual == expected, f"분할 결과가 다릅니다 (설정: {kwargs}, 텍스트: {text[:80]!r})"
+
+
+def test_same_chunks_for_project_documents():
+    """
+    프로젝트 문서를 RAG 엔진 설정으로 분할한 결과가 같은지 테스트
+    """
+    docs_dir = os.path.join(get_project_root(), "docs")
+    for file_name in sorted(os.listdir(docs_dir)):
+        if not file_name.endswith(".md"):
+            continue
+        with open(os.path.join(docs_dir, file_name), encoding="utf-8") as f:
+            text = f.read()
+        for chunk_size, chunk_overlap in ((1000, 200), (300, 50)):
+            _assert_same_chunks(
+                text,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                length_function=len,
+                separators=RAG_SEPARATORS
+            )
+
+
+def test_same_chunks_for_random_texts():
+    """
+    무작위 텍스트와 설정(구분자 유지 방식, 공백 제거 여부 포함)에서 결과가 같은지 테스트
+    """
+    rng = random.Random(1)
+    for _ in range(RANDOM_TRIALS):
+        text = "".join(
+            rng.choice(RANDOM_PIECES) * rng.choice([1, 1, 1, 2, 3, 7])
+            for _ in range(rng.randint(0, 400))
+        )
+        chunk_size = rng.randint(1, 60)
+        for keep_separator in (True, False, "start"):
+            for strip_whitespace in (True, False):
+                _assert_same_chunks(
+                    text,
+                    chunk_size=chunk_size,
+                    chunk_overlap=rng.randint(0, chunk_size),
+                    length_function=len,
+                    separators=rng.choice(RANDOM_SEPARATORS),
+                    keep_separator=keep_separator,
+                    strip_whitespace=strip_whitespace
+                )
+
+
+def test_fallback_settings_match():
+    """
+    위치 기반 분할을 쓰지 않는 설정(정규식 구분자, 끝쪽 구분자 유지)에서도 결과가 같은지 테스트
+    """
+    text = "첫 문장입니다. 두 번째 문장!\n\n세 번째 단락의 문장입니다? 마지막 문장." * 20
+    _assert_same_chunks(text, chunk_size=40, chunk_overlap=10,
+                        separators=[r"[.!?]\s", r"\s"], is_separator_regex=True)
+    _assert_same_chunks(text, chunk_size=40, chunk_overlap=10,
+                        separators=RAG_SEPARATORS, keep_separator="end")
+
+
+def main():
+    """
+    메인 함수
+    """
+    tests = [
+        test_same_chunks_for_project_documents,
+        test_same_chunks_for_random_texts,
+        test_fallback_settings_match,
+    ]
+
+    print(f"\n{'=' * 60}")
+    print(f"텍스트 분할기 테스트 시작")
+    print(f"{'=' * 60}")
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"- {test.__name__}: 통과")
+        except AssertionError as e:
+            failed += 1
+            print(f"- {test.__name__}: 실패 {str(e)}")
+
+    print(f"\n{'=' * 60}")
+    print(f"테스트 완료 (실패: {failed}개)")
+    print(f"{'=' * 60}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
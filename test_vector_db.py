@@ -0,0 +1,264 @@
+"""
+벡터 DB 테스트 스크립트
+문서 삭제 표시(tombstone), 재로드, 인덱스 압축(compaction), 이전 형식 인덱스 변환 동작 테스트
+"""
+import os
+import sys
+import json
+import tempfile
+
+import faiss
+import numpy as np
+
+# 프로젝트 루트 디렉토리 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# 내부 모듈
+from core.vector_db import VectorDB, INDEX_FILE_NAME, METADATA_FILE_NAME
+
+
+# 테스트 설정 (벡터 차원, 문서 수, 문서당 청크 수)
+# - 문서 하나를 지워도 삭제 비율이 자동 압축 기준(10%)을 넘지 않도록 문서 수를 정함
+DIMENSION = 32
+DOC_COUNT = 12
+CHUNKS_PER_DOC = 5
+
+
+def _add_documents(vector_db: VectorDB, chunks_per_doc: int = CHUNKS_PER_DOC):
+    """
+    무작위 벡터로 테스트 문서 추가
+
+    Args:
+        vector_db (VectorDB): 벡터 DB
+        chunks_per_doc (int): 문서당 청크 수
+
+    Returns:
+        List[Tuple[str, np.ndarray]]: (문서 ID, 청크 벡터 배열) 목록
+    """
+    rng = np.random.default_rng(0)
+    documents = []
+    with vector_db:
+        for k in range(DOC_COUNT):
+            vectors = rng.standard_normal((chunks_per_doc, DIMENSION)).astype(np.float32)
+            doc_id = vector_db.add_document(
+                title=f"문서 {k}",
+                file_path=f"doc_{k}.txt",
+                chunks=[f"문서 {k} 청크 {i}" for i in range(chunks_per_doc)],
+                embeddings=vectors.copy()
+            )
+            documents.append((str(doc_id), vectors))
+    return documents
+
+
+def _hit_doc_ids(vector_db: VectorDB, vectors: np.ndarray, top_k: int = 3):
+    """
+    여러 벡터로 검색한 결과의 문서 ID 집합
+
+    Args:
+        vector_db (VectorDB): 벡터 DB
+        vectors (np.ndarray): (N, D) 쿼리 벡터 배열
+        top_k (int): 쿼리마다 검색할 결과 수
+
+    Returns:
+        Set[str]: 검색 결과에 나온 문서 ID 집합
+    """
+    return {hit["doc_id"] for hits in vector_db.search_batch(vectors, top_k) for hit in hits}
+
+
+def test_delete_excludes_tombstoned_vectors():
+    """
+    삭제한 문서의 벡터는 인덱스에 남아 있어도 검색 결과에 나오지 않는지 테스트
+    """
+    with tempfile.TemporaryDirectory() as db_path:
+        vector_db = VectorDB(db_path, dimension=DIMENSION, index_factory=None)
+        documents = _add_documents(vector_db)
+        deleted_id, deleted_vectors = documents[2]
+
+        assert vector_db.delete_document(deleted_id)
+
+        stats = vector_db.get_stats()
+        assert stats["deleted_vector_count"] == CHUNKS_PER_DOC
+        assert vector_db.index.ntotal == DOC_COUNT * CHUNKS_PER_DOC
+        assert deleted_id not in _hit_doc_ids(vector_db, deleted_vectors)
+
+        # 다른 문서의 검색은 영향을 받지 않음
+        kept_id, kept_vectors = documents[5]
+        assert vector_db.search(kept_vectors[1], top_k=1)[0]["doc_id"] == kept_id
+
+
+def test_tombstones_survive_reload():
+    """
+    삭제 표시가 저장되어 다시 로드한 뒤에도 검색에서 제외되는지 테스트
+    """
+    with tempfile.TemporaryDirectory() as db_path:
+        vector_db = VectorDB(db_path, dimension=DIMENSION, index_factory=None)
+        documents = _add_documents(vector_db)
+        deleted_id, deleted_vectors = documents[2]
+        vector_db.delete_document(deleted_id)
+
+        reloaded = VectorDB(db_path, dimension=DIMENSION, index_factory=None)
+
+        assert reloaded.get_stats()["deleted_vector_count"] == CHUNKS_PER_DOC
+        assert deleted_id not in _hit_doc_ids(reloaded, deleted_vectors)
+        assert reloaded.get_document_by_id(deleted_id) is None
+
+
+def test_compact_removes_tombstoned_vectors():
+    """
+    압축 후 삭제 표시된 벡터가 인덱스에서 제거되고 남은 문서의 검색 결과는 그대로인지 테스트
+    """
+    with tempfile.TemporaryDirectory() as db_path:
+        vector_db = VectorDB(db_path, dimension=DIMENSION, index_factory=None)
+        documents = _add_documents(vector_db)
+        deleted_id, deleted_vectors = documents[2]
+        vector_db.delete_document(deleted_id)
+
+        queries = np.vstack([vectors[0] for _, vectors in documents])
+        before = [[hit["chunk_id"] for hit in hits] for hits in vector_db.search_batch(queries, 3)]
+
+        vector_db.compact()
+
+        assert vector_db.index.ntotal == (DOC_COUNT - 1) * CHUNKS_PER_DOC
+        assert vector_db.get_stats()["deleted_vector_count"] == 0
+        after = [[hit["chunk_id"] for hit in hits] for hits in vector_db.search_batch(queries, 3)]
+        assert after == before
+
+        # 압축 결과가 저장되었는지 확인
+        reloaded = VectorDB(db_path, dimension=DIMENSION, index_factory=None)
+        assert reloaded.index.ntotal == (DOC_COUNT - 1) * CHUNKS_PER_DOC
+        assert reloaded.get_stats()["deleted_vector_count"] == 0
+
+
+def test_compact_ivf_index_keeps_chunk_ids():
+    """
+    IVF 인덱스에서도 압축 후 남은 벡터가 원래 청크 ID로 검색되는지 테스트
+    """
+    with tempfile.TemporaryDirectory() as db_path:
+        vector_db = VectorDB(db_path, dimension=DIMENSION, index_factory="IVF{nlist},Flat", train_size=300)
+        documents = _add_documents(vector_db, chunks_per_doc=50)
+        deleted_id, deleted_vectors = documents[2]
+        vector_db.delete_document(deleted_id)
+
+        vector_db.compact()
+
+        assert vector_db.index.ntotal == (DOC_COUNT - 1) * 50
+        assert deleted_id not in _hit_doc_ids(vector_db, deleted_vectors)
+        for doc_id, vectors in documents[3:6]:
+            hit = vector_db.search(vectors[7], top_k=1)[0]
+            assert hit["doc_id"] == doc_id
+            assert hit["text_preview"].endswith("청크 7")
+
+
+def _write_legacy_db(db_path: str, vectors: np.ndarray, chunks_per_doc: int = CHUNKS_PER_DOC):
+    """
+    이전 형식(L2 거리 플랫 인덱스, 청크 메타데이터의 vector_index로 벡터 위치 기록)의 벡터 DB 생성
+
+    Args:
+        db_path (str): 벡터 DB 저장 경로
+        vectors (np.ndarray): 저장할 (N, D) 벡터 배열 (정규화하지 않은 벡터)
+        chunks_per_doc (int): 문서당 청크 수
+    """
+    index = faiss.IndexFlatL2(vectors.shape[1])
+    index.add(vectors)
+    faiss.write_index(index, os.path.join(db_path, INDEX_FILE_NAME))
+
+    # 청크 ID는 벡터 위치와 다르게 부여하여 위치 -> 청크 ID 변환을 확인
+    metadata = {"documents": {}, "chunks": {}, "next_doc_id": 1, "next_chunk_id": 100}
+    for position in range(len(vectors)):
+        doc_id = str(position // chunks_per_doc + 1)
+        chunk_id = str(metadata["next_chunk_id"])
+        metadata["next_chunk_id"] += 1
+        if doc_id not in metadata["documents"]:
+            metadata["documents"][doc_id] = {
+                "title": f"문서 {doc_id}",
+                "file_path": f"doc_{doc_id}.txt",
+                "chunk_count": chunks_per_doc,
+                "created_at": "20250407_112508",
+                "chunk_ids": []
+            }
+            metadata["next_doc_id"] += 1
+        metadata["documents"][doc_id]["chunk_ids"].append(chunk_id)
+        metadata["chunks"][chunk_id] = {
+            "doc_id": doc_id,
+            "index": position % chunks_per_doc,
+            "vector_index": position,
+            "text": f"청크 {position}",
+            "created_at": "20250407_112508"
+        }
+
+    with open(os.path.join(db_path, METADATA_FILE_NAME), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, ensure_ascii=False)
+
+
+def test_legacy_index_migration():
+    """
+    이전 형식 인덱스가 정규화된 내적 인덱스로 변환되어 벡터 크기와 무관하게 검색되는지 테스트
+    """
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((DOC_COUNT * CHUNKS_PER_DOC, DIMENSION)).astype(np.float32)
+    # 벡터마다 크기를 다르게 하여 L2 거리와 코사인 유사도의 순위가 달라지도록 함
+    vectors *= rng.uniform(0.5, 20.0, size=(len(vectors), 1)).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as db_path:
+        _write_legacy_db(db_path, vectors)
+
+        vector_db = VectorDB(db_path, dimension=DIMENSION, index_factory=None)
+
+        assert isinstance(vector_db.index, faiss.IndexIDMap2)
+        assert vector_db.index.metric_type == faiss.METRIC_INNER_PRODUCT
+        assert vector_db.index.ntotal == len(vectors)
+        assert not any("vector_index" in chunk for chunk in vector_db.metadata["chunks"].values())
+
+        # 크기만 다른 질의로도 같은 청크가 유사도 1로 검색됨
+        for position in (0, 17, len(vectors) - 1):
+            hit = vector_db.search(vectors[position] * 0.1, top_k=1)[0]
+            assert hit["chunk_id"] == str(100 + position)
+            assert hit["text_preview"] == f"청크 {position}"
+            assert abs(hit["similarity"] - 1.0) < 1e-2
+
+        # 변환 결과가 저장되어 다시 로드할 때는 변환하지 않음
+        reloaded = VectorDB(db_path, dimension=DIMENSION, index_factory=None)
+        assert reloaded.index.metric_type == faiss.METRIC_INNER_PRODUCT
+        assert reloaded.search(vectors[17], top_k=1)[0]["chunk_id"] == "117"
+
+        # 변환 후 추가한 문서는 새 청크 ID로 저장됨
+        new_vector = rng.standard_normal((1, DIMENSION)).astype(np.float32)
+        doc_id = reloaded.add_document("새 문서", "new.txt", ["새 청크"], new_vector.copy())
+        hit = reloaded.search(new_vector[0], top_k=1)[0]
+        assert hit["doc_id"] == str(doc_id)
+        assert int(hit["chunk_id"]) >= 100 + len(vectors)
+
+
+def main():
+    """
+    메인 함수
+    """
+    tests = [
+        test_delete_excludes_tombstoned_vectors,
+        test_tombstones_survive_reload,
+        test_compact_removes_tombstoned_vectors,
+        test_compact_ivf_index_keeps_chunk_ids,
+        test_legacy_index_migration,
+    ]
+
+    print(f"\n{'=' * 60}")
+    print(f"벡터 DB 테스트 시작")
+    print(f"{'=' * 60}")
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"- {test.__name__}: 통과")
+        except AssertionError as e:
+            failed += 1
+            print(f"- {test.__name__}: 실패 {str(e)}")
+
+    print(f"\n{'=' * 60}")
+    print(f"테스트 완료 (실패: {failed}개)")
+    print(f"{'=' * 60}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,10 @@
 공통 유틸리티 함수 모듈
 """
 import os
+import asyncio
+import inspect
 import logging
+import warnings
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 import yaml
@@ -21,17 +24,15 @@ def setup_logger(name: str, log_file: str, level=logging.INFO) -> logging.Logger
     Returns:
         logging.Logger: 설정된 로거 객체
     """
-    # 로그 디렉토리 생성
-    log_dir = os.path.dirname(log_file)
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
     # 로거 설정
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
-    # 이미 핸들러가 있으면 추가하지 않음
+    # 이미 핸들러가 있으면 추가하지 않음 (재호출 시 디렉토리 확인도 생략)
     if not logger.handlers:
+        # 로그 디렉토리 생성
+        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        
         # 파일 핸들러 추가
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         formatter = logging.Formatter(
@@ -135,3 +136,73 @@ def get_timestamp_str(format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
         str: 지정된 포맷의 타임스탬프 문자열
     """
     return datetime.now().strftime(format_str)
+
+# 디스크 캐시 디렉토리 크기 제한
+def prune_cache_dir(cache_dir: str, max_bytes: int) -> int:
+    """
+    캐시 디렉토리의 전체 크기가 제한을 넘으면 수정 시간이 오래된 파일부터 삭제
+    
+    Args:
+        cache_dir (str): 캐시 디렉토리 경로
+        max_bytes (int): 허용할 최대 전체 크기(바이트)
+        
+    Returns:
+        int: 삭제한 파일 수
+    """
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                # 기록 중인 임시 파일은 제외
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        return 0
+    
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+# 다른 이벤트 루프에 묶인 aiohttp 세션 정리
+def discard_session(session: Any, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """
+    다른 이벤트 루프에서 만든 aiohttp 세션을 버림
+    
+    세션의 연결은 만든 루프에서만 닫을 수 있으므로, 그 루프가 실행 중이면 루프에 종료를 예약하고
+    실행 중이 아니면(예: 이전 asyncio.run으로 이미 닫힘) 세션에서 커넥터를 분리해 닫은 뒤 버립니다.
+    
+    Args:
+        session (aiohttp.ClientSession): 버릴 세션
+        loop (Optional[asyncio.AbstractEventLoop]): 세션을 만든 이벤트 루프
+    """
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+    
+    connector = session.connector
+    session.detach()
+    if connector is None:
+        return
+    
+    # 기다릴 루프가 없으므로 close()가 돌려주는 대기 객체는 await하지 않고 버림
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        result = connector.close()
+    if inspect.iscoroutine(result):
+        # 코루틴 close(aiohttp 3.10 이상의 TCPConnector)는 첫 대기 지점까지만 실행해 연결을 닫고 버림
+        try:
+            result.send(None)
+        except StopIteration:
+            pass
+        finally:
+            result.close()